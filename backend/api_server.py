@@ -5,17 +5,27 @@ Provides REST endpoints for file conversion
 """
 
 import os
+import io
+import logging
 import uuid
-import tempfile
 import shutil
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file, send_from_directory
+import orjson
+from flask import Flask, Request, Response, request, send_file, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import NotFound
 from werkzeug.utils import secure_filename
-from file_converter import FileConversionService
+from werkzeug.wsgi import FileWrapper
+from file_converter import (FileConversionService, process_pool_context,
+                            init_conversion_worker, convert_in_worker)
 from tts_service import tts_service
 import threading
 import time
+import functools
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 # Load environment variables from .env file
 try:
@@ -29,7 +39,63 @@ except ImportError:
 except Exception as e:
     print(f"⚠️  Could not load .env file: {e}")
 
+# Request-path diagnostics go through logging so they cost nothing in production
+logging.basicConfig(format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+log = logging.getLogger('filealchemy')
+log.setLevel(logging.INFO if os.environ.get('FLASK_ENV') == 'development' else logging.WARNING)
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used for request.get_json() and jsonify"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def jresponse(obj, status=200):
+    """Build a JSON response serialized straight to bytes with orjson"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+class UploadSpool(io.FileIO):
+    """Spool file for one uploaded part that stops writing past MAX_FILE_SIZE.
+
+    The rest of an oversized part is still read off the request, but it is
+    dropped instead of written to disk and save_upload rejects the file.
+    """
+    
+    def __init__(self, path):
+        super().__init__(path, 'x+')
+        self.size = 0
+        self.oversized = False
+    
+    def write(self, data):
+        if not self.oversized:
+            self.size += len(data)
+            if self.size <= MAX_FILE_SIZE:
+                return super().write(data)
+            self.oversized = True
+            self.truncate(0)
+        return len(data)
+
+class UploadRequest(Request):
+    """Request that spools uploaded files straight into UPLOAD_FOLDER.
+
+    Saving an upload is then a rename instead of a copy out of a temporary file.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spooled_uploads = []
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        stream = UploadSpool(os.path.join(UPLOAD_FOLDER, f"upload_{uuid.uuid4().hex}"))
+        self.spooled_uploads.append(stream.name)
+        return stream
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.request_class = UploadRequest
 
 # Configure CORS based on environment
 if os.environ.get('FLASK_ENV') == 'development':
@@ -42,12 +108,25 @@ else:
     else:
         CORS(app)  # Fallback to allow all if not configured
 
+# Let a front-end proxy (nginx/Apache) stream downloads with sendfile(2)
+if os.environ.get('USE_X_SENDFILE'):
+    app.config['USE_X_SENDFILE'] = True
+
 # Configuration - Use absolute paths for Railway deployment
 import os
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'temp_uploads')
 CONVERTED_FOLDER = os.path.join(BASE_DIR, 'temp_converted')
+# Downloads must resolve to a path inside this prefix
+CONVERTED_REAL_PREFIX = os.path.join(os.path.realpath(CONVERTED_FOLDER), '')
+# Built React frontend, looked up once at startup
+STATIC_FOLDER = os.path.join(os.path.dirname(BASE_DIR), 'dist')
+STATIC_EXISTS = os.path.isdir(STATIC_FOLDER)
+STATIC_ASSET_MAX_AGE = 365 * 24 * 3600  # Hashed bundles under assets/ never change
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # 1MB, Werkzeug's default is 8KB per write
+# Already-compressed formats that proxies and middleware should not gzip again
+COMPRESSED_EXTENSIONS = frozenset({'.zip', '.gz', '.7z', '.mp3', '.flac', '.mp4', '.webm', '.jpg', '.jpeg', '.png'})
 ALLOWED_EXTENSIONS = {
     'images': {'jpg', 'jpeg', 'png', 'bmp', 'tiff', 'gif', 'heic', 'heif', 'webp', 'ico', 'svg'},
     'documents': {'pdf', 'docx', 'txt', 'html', 'rtf', 'xlsx', 'csv', 'pptx', 'odt', 'ods', 'odp'},
@@ -57,6 +136,13 @@ ALLOWED_EXTENSIONS = {
     'data': {'json', 'xml', 'yaml', 'yml'}
 }
 
+# Target formats that turn a PDF into a ZIP of page images
+PDF_IMAGE_TARGETS = frozenset({'JPG', 'JPEG', 'PNG'})
+
+# Flattened extension lookups, built once at import
+_ALL_EXTENSIONS = frozenset().union(*ALLOWED_EXTENSIONS.values())
+_EXT_TO_CATEGORY = {ext: category for category, exts in ALLOWED_EXTENSIONS.items() for ext in exts}
+
 # Create directories
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(CONVERTED_FOLDER, exist_ok=True)
@@ -64,10 +150,53 @@ os.makedirs(CONVERTED_FOLDER, exist_ok=True)
 # Initialize conversion service
 conversion_service = FileConversionService()
 
-# Store conversion jobs in memory (in production, use Redis or database)
-conversion_jobs = {}
+# Store conversion jobs in memory (mirrored to Redis below when configured).
+# Jobs are inserted in creation order, so expired jobs are always at the front.
+# Request handlers, job workers and cleanup all share it - take jobs_lock.
+conversion_jobs = OrderedDict()
+jobs_lock = threading.Lock()
+# Notified whenever a job's status or progress changes (wakes status streams)
+jobs_changed = threading.Condition(jobs_lock)
+
+# Optional shared job store - with REDIS_URL set, every job's status payload is
+# mirrored to Redis so status polls work when several server processes run
+REDIS_URL = os.environ.get('REDIS_URL')
+JOB_KEY_PREFIX = 'queue:jobs:job:'
+JOB_TTL = 3600  # Redis expires jobs on its own after 1 hour
+job_store = None
+if REDIS_URL:
+    try:
+        import redis
+        job_store = redis.Redis.from_url(REDIS_URL)
+    except ImportError:
+        print("⚠️  redis not installed, job status is kept in this process only")
+
+# Seconds between keep-alive comments on an idle status stream
+STATUS_STREAM_KEEPALIVE = 15
+
+# Bounded worker pool for conversion jobs - uploads only enqueue work here
+# instead of spawning a thread per job
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', os.cpu_count() or 2))
+job_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='conversion')
+
+# Process pool for converting the files of multi-file jobs in parallel -
+# conversions are CPU/native-library bound, so processes put every core to use
+CONVERT_WORKERS = max(2, (os.cpu_count() or 2) - 1)
+_convert_pool = None
+_convert_pool_lock = threading.Lock()
+
+# Minimum seconds between cleanup scans of the temp folders
+CLEANUP_MIN_INTERVAL = 60
+# Longest gap between scans when no conversions come in
+CLEANUP_HEARTBEAT_INTERVAL = 15 * 60
+CLEANUP_UNLINK_WORKERS = 8
+_last_cleanup_ts = 0.0
+_cleanup_lock = threading.Lock()
 
 class ConversionJob:
+    __slots__ = ('job_id', 'files', 'source_format', 'target_format', 'status',
+                 'progress', 'results', 'error_message', 'created_at')
+    
     def __init__(self, job_id, files, source_format, target_format):
         self.job_id = job_id
         self.files = files
@@ -79,135 +208,332 @@ class ConversionJob:
         self.error_message = None
         self.created_at = time.time()
 
+@functools.lru_cache(maxsize=1)
+def cached_formats():
+    """Supported formats never change while the process runs, so compute them once"""
+    return conversion_service.list_supported_formats()
+
+@functools.lru_cache(maxsize=1)
+def formats_response_body():
+    """Pre-serialized /api/formats response body"""
+    return orjson.dumps({'success': True, 'formats': cached_formats()})
+
+# Batches often repeat the same client filenames, so cache the sanitized result
+safe_filename = functools.lru_cache(maxsize=4096)(secure_filename)
+
 def allowed_file(filename, category=None):
     """Check if file extension is allowed"""
     if '.' not in filename:
         return False
     
-    ext = filename.rsplit('.', 1)[1].lower()
+    ext = filename.rpartition('.')[2].lower()
     
     if category:
         return ext in ALLOWED_EXTENSIONS.get(category, set())
-    else:
-        # Check all categories
-        all_extensions = set()
-        for exts in ALLOWED_EXTENSIONS.values():
-            all_extensions.update(exts)
-        return ext in all_extensions
+    return ext in _ALL_EXTENSIONS
 
 def get_file_category(filename):
     """Determine file category based on extension"""
     if '.' not in filename:
         return None
     
-    ext = filename.rsplit('.', 1)[1].lower()
+    return _EXT_TO_CATEGORY.get(filename.rpartition('.')[2].lower())
+
+def save_upload(file, filepath):
+    """Move an uploaded file from its spool file to filepath.
+
+    Returns the number of bytes saved, or None if the file was larger than
+    MAX_FILE_SIZE (its spool file is removed with the request).
+    """
+    spool = file.stream
+    if spool.oversized:
+        return None
+    os.replace(spool.name, filepath)
+    return spool.size
+
+def remove_file_quietly(filepath):
+    """Delete a file, ignoring files that are already gone"""
+    try:
+        os.unlink(filepath)
+    except OSError:
+        pass
+
+def remove_expired_files(folder, cutoff_time):
+    """Delete files in folder created before cutoff_time"""
+    expired = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_ctime < cutoff_time:
+                    expired.append(entry.path)
+            except OSError:
+                pass
     
-    for category, extensions in ALLOWED_EXTENSIONS.items():
-        if ext in extensions:
-            return category
-    return None
+    # Issue larger batches of unlinks in parallel; a single file isn't worth a pool
+    if len(expired) == 1:
+        remove_file_quietly(expired[0])
+    elif expired:
+        with ThreadPoolExecutor(max_workers=CLEANUP_UNLINK_WORKERS) as pool:
+            pool.map(remove_file_quietly, expired)
 
 def cleanup_old_files():
     """Clean up files older than 1 hour"""
-    current_time = time.time()
-    cutoff_time = current_time - 3600  # 1 hour
+    cutoff_time = time.time() - 3600  # 1 hour
     
-    # Clean upload folder
-    for filename in os.listdir(UPLOAD_FOLDER):
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-        if os.path.getctime(filepath) < cutoff_time:
-            try:
-                os.remove(filepath)
-            except OSError:
-                pass
+    remove_expired_files(UPLOAD_FOLDER, cutoff_time)
+    remove_expired_files(CONVERTED_FOLDER, cutoff_time)
     
-    # Clean converted folder
-    for filename in os.listdir(CONVERTED_FOLDER):
-        filepath = os.path.join(CONVERTED_FOLDER, filename)
-        if os.path.getctime(filepath) < cutoff_time:
-            try:
-                os.remove(filepath)
-            except OSError:
-                pass
+    # Clean old jobs - stop at the first job that is still fresh
+    with jobs_lock:
+        while conversion_jobs:
+            job_id, job = next(iter(conversion_jobs.items()))
+            if job.created_at >= cutoff_time:
+                break
+            del conversion_jobs[job_id]
+
+def claim_cleanup():
+    """Return True if a cleanup is due, recording it as started"""
+    global _last_cleanup_ts
+    
+    with _cleanup_lock:
+        current_time = time.time()
+        # Throttle scans so busy periods don't re-walk the folders after every conversion
+        if current_time - _last_cleanup_ts < CLEANUP_MIN_INTERVAL:
+            return False
+        _last_cleanup_ts = current_time
+        return True
+
+def maybe_cleanup():
+    """Start a background cleanup if the last one is old enough"""
+    if claim_cleanup():
+        threading.Thread(target=cleanup_old_files, daemon=True).start()
+
+def cleanup_heartbeat():
+    """Clean up on a timer too, so files expire on a server that sees no conversions"""
+    while True:
+        time.sleep(CLEANUP_HEARTBEAT_INTERVAL)
+        if claim_cleanup():
+            cleanup_old_files()
+
+def compute_output_paths(prefix, filename_stem, source_format, target_format):
+    """Work out where a conversion writes its result.
+
+    Returns (output_filename, output_path, converter_path, is_pdf_to_image).
+    PDF to image conversions produce a ZIP of pages, but the converter is given
+    a path with the image extension so it knows which page format to render.
+    Formats are expected to be upper-cased already.
+    """
+    target_ext = target_format.lower()
+    is_pdf_to_image = source_format == 'PDF' and target_format in PDF_IMAGE_TARGETS
+    
+    if is_pdf_to_image:
+        output_filename = f"{filename_stem}_pages.zip"
+        output_path = os.path.join(CONVERTED_FOLDER, f"{prefix}_{output_filename}")
+        converter_path = os.path.join(CONVERTED_FOLDER, f"{prefix}_{filename_stem}.{target_ext}")
+    else:
+        output_filename = f"{filename_stem}.{target_ext}"
+        output_path = converter_path = os.path.join(CONVERTED_FOLDER, f"{prefix}_{output_filename}")
+    
+    return output_filename, output_path, converter_path, is_pdf_to_image
+
+def converter_kwargs(target_format, is_pdf_to_image):
+    """Extra converter options - PDF page images need to know the page format"""
+    return {'target_format': target_format} if is_pdf_to_image else {}
+
+def run_conversion(input_path, output_path, converter_path, target_format, is_pdf_to_image):
+    """Run the converter, moving PDF page archives to their final path"""
+    success = conversion_service.convert_file(
+        input_path, converter_path, **converter_kwargs(target_format, is_pdf_to_image)
+    )
+    return finish_conversion(success, output_path, converter_path, is_pdf_to_image)
+
+def finish_conversion(success, output_path, converter_path, is_pdf_to_image):
+    """Move a PDF page archive to its final path; returns whether the conversion succeeded"""
+    if not success or not is_pdf_to_image:
+        return success
     
-    # Clean old jobs
-    jobs_to_remove = []
-    for job_id, job in conversion_jobs.items():
-        if job.created_at < cutoff_time:
-            jobs_to_remove.append(job_id)
+    # The converter wrote the ZIP at converter_path - rename it to output_path
+    try:
+        shutil.move(converter_path, output_path)
+    except FileNotFoundError:
+        log.warning("Conversion succeeded but temp file %s not found", converter_path)
+        return False
+    log.debug("Moved %s to %s", converter_path, output_path)
+    return True
+
+def job_output_paths(job, file_info):
+    """compute_output_paths for one file of a job"""
+    return compute_output_paths(
+        job.job_id, Path(file_info['filename']).stem, job.source_format, job.target_format
+    )
+
+def convert_job_file(job, file_info):
+    """Convert one file of a job in this process and return its result entry"""
+    input_path = file_info['path']
+    output_filename, output_path, converter_path, is_pdf_to_image = job_output_paths(job, file_info)
+    
+    # Perform conversion
+    log.info("Converting %s to %s (format: %s -> %s)", input_path, output_path, job.source_format, job.target_format)
+    success = run_conversion(input_path, output_path, converter_path, job.target_format, is_pdf_to_image)
+    return job_file_result(job.job_id, file_info, output_filename, output_path, success)
+
+def job_file_result(job_id, file_info, output_filename, output_path, success):
+    """Result entry reported for one converted file of a job"""
+    log.info("Conversion result: %s", success)
     
-    for job_id in jobs_to_remove:
-        del conversion_jobs[job_id]
+    output_size = 0
+    if success:
+        try:
+            output_size = os.stat(output_path).st_size
+        except FileNotFoundError:
+            pass
+    
+    result = {
+        'original_filename': file_info['filename'],
+        'converted_filename': output_filename,
+        'success': success,
+        'size': output_size,
+        'download_url': f"/api/download/{job_id}_{output_filename}" if success else None
+    }
+    
+    if not success:
+        result['error'] = f"Failed to convert {file_info['filename']}"
+        log.warning("Conversion failed for %s", file_info['filename'])
+    
+    return result
+
+def get_convert_pool():
+    """Return the multi-file conversion pool, starting it on first use"""
+    global _convert_pool
+    with _convert_pool_lock:
+        if _convert_pool is None:
+            _convert_pool = ProcessPoolExecutor(max_workers=CONVERT_WORKERS,
+                                                mp_context=process_pool_context(),
+                                                initializer=init_conversion_worker)
+        return _convert_pool
+
+def discard_convert_pool(pool):
+    """Drop a pool that lost a worker (e.g. killed for memory) so later jobs get a fresh one"""
+    global _convert_pool
+    with _convert_pool_lock:
+        if _convert_pool is pool:
+            _convert_pool = None
+    pool.shutdown(wait=False)
+
+def failed_file_result(file_info, output_filename, error):
+    """Result entry for a file whose conversion raised instead of returning"""
+    log.warning("Conversion failed for %s: %s", file_info['filename'], error)
+    return {
+        'original_filename': file_info['filename'],
+        'converted_filename': output_filename,
+        'success': False,
+        'size': 0,
+        'download_url': None,
+        'error': f"Failed to convert {file_info['filename']}"
+    }
+
+def publish_job(job):
+    """Mirror a job's status to the shared job store, if one is configured"""
+    if job_store is None:
+        return
+    try:
+        job_store.set(JOB_KEY_PREFIX + job.job_id, orjson.dumps(job_status_payload(job)), ex=JOB_TTL)
+    except redis.RedisError as e:
+        log.warning("Could not store job %s in Redis: %s", job.job_id, e)
+
+def load_shared_job_status(job_id):
+    """Fetch a job's serialized status from the shared job store, or None"""
+    if job_store is None:
+        return None
+    try:
+        return job_store.get(JOB_KEY_PREFIX + job_id)
+    except redis.RedisError as e:
+        log.warning("Could not read job %s from Redis: %s", job_id, e)
+        return None
+
+def notify_job_update(job):
+    """Publish a job change and wake up status streams waiting for it"""
+    publish_job(job)
+    with jobs_changed:
+        jobs_changed.notify_all()
 
 def process_conversion_job(job):
-    """Process conversion job in background thread"""
+    """Process conversion job on a worker pool thread"""
     try:
         job.status = 'processing'
+        notify_job_update(job)
         total_files = len(job.files)
         
-        for i, file_info in enumerate(job.files):
-            input_path = file_info['path']
-            filename_without_ext = Path(file_info['filename']).stem
-            
-            # Special handling for PDF to image conversion (results in ZIP file)
-            if job.source_format.upper() == 'PDF' and job.target_format.upper() in ['JPG', 'JPEG', 'PNG']:
-                output_filename = f"{filename_without_ext}_pages.zip"
-                output_path = os.path.join(CONVERTED_FOLDER, f"{job.job_id}_{output_filename}")
-            else:
-                output_filename = f"{filename_without_ext}.{job.target_format.lower()}"
-                output_path = os.path.join(CONVERTED_FOLDER, f"{job.job_id}_{output_filename}")
-            
-            # Perform conversion
-            print(f"Converting {input_path} to {output_path} (format: {job.source_format} -> {job.target_format})")
-            
-            # For PDF to image conversions, we need to pass the image format to the converter
-            # even though the output file will be a ZIP
-            if job.source_format.upper() == 'PDF' and job.target_format.upper() in ['JPG', 'JPEG', 'PNG']:
-                # Create a temporary output path with the image extension for the converter
-                temp_output = output_path.replace('_pages.zip', f'.{job.target_format.lower()}')
-                success = conversion_service.convert_file(input_path, temp_output, target_format=job.target_format)
-                
-                # If successful, the converter should have created a ZIP file at temp_output
-                # Rename it to the expected output_path
-                if success and os.path.exists(temp_output):
-                    import shutil
-                    shutil.move(temp_output, output_path)
-                    print(f"Moved {temp_output} to {output_path}")
-                elif success:
-                    print(f"Warning: Conversion succeeded but temp file {temp_output} not found")
-                    success = False
-            else:
-                success = conversion_service.convert_file(input_path, output_path)
+        if total_files == 1:
+            # Single files run inline to skip the process pool round-trip
+            job.results.append(convert_job_file(job, job.files[0]))
+            job.progress = 100
+            notify_job_update(job)
+        else:
+            # Convert files in parallel, updating progress as each one finishes.
+            # Workers only run the converter; paths and results stay on this side.
+            paths = [job_output_paths(job, file_info) for file_info in job.files]
             
-            print(f"Conversion result: {success}")
+            def submit_all(pool):
+                return {
+                    pool.submit(
+                        convert_in_worker, file_info['path'], converter_path,
+                        converter_kwargs(job.target_format, is_pdf_to_image)
+                    ): i
+                    for i, (file_info, (_, _, converter_path, is_pdf_to_image))
+                    in enumerate(zip(job.files, paths))
+                }
             
-            result = {
-                'original_filename': file_info['filename'],
-                'converted_filename': output_filename,
-                'success': success,
-                'size': os.path.getsize(output_path) if success and os.path.exists(output_path) else 0,
-                'download_url': f"/api/download/{job.job_id}_{output_filename}" if success else None
-            }
+            pool = get_convert_pool()
+            try:
+                futures = submit_all(pool)
+            except BrokenProcessPool:
+                # Another job lost a worker on this pool; start a fresh one
+                discard_convert_pool(pool)
+                pool = get_convert_pool()
+                futures = submit_all(pool)
+            ordered_results = [None] * total_files
             
-            if not success:
-                result['error'] = f"Failed to convert {file_info['filename']}"
-                print(f"Conversion failed for {file_info['filename']}")
+            for completed, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                output_filename, output_path, converter_path, is_pdf_to_image = paths[i]
+                try:
+                    success = finish_conversion(future.result(), output_path, converter_path, is_pdf_to_image)
+                    result = job_file_result(job.job_id, job.files[i], output_filename, output_path, success)
+                except Exception as e:
+                    # One bad file (or a dead worker) fails that file, not the whole job
+                    if isinstance(e, BrokenProcessPool):
+                        discard_convert_pool(pool)
+                    result = failed_file_result(job.files[i], output_filename, e)
+                ordered_results[i] = result
+                job.results.append(result)
+                job.progress = int((completed / total_files) * 100)
+                notify_job_update(job)
             
-            job.results.append(result)
-            job.progress = int(((i + 1) / total_files) * 100)
+            # Report the final results in upload order
+            job.results = ordered_results
         
         job.status = 'completed'
         
     except Exception as e:
         job.status = 'failed'
         job.error_message = str(e)
+    
+    notify_job_update(job)
+    maybe_cleanup()
+
+@app.teardown_request
+def remove_spooled_uploads(exc):
+    """Delete spooled uploads that were rejected instead of saved"""
+    for filepath in getattr(request, 'spooled_uploads', ()):
+        remove_file_quietly(filepath)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     # Check if conversion service is working
     try:
-        formats = conversion_service.list_supported_formats()
+        formats = cached_formats()
         service_status = 'healthy'
     except Exception as e:
         formats = {}
@@ -216,52 +542,48 @@ def health_check():
     # Check TTS service
     tts_health = tts_service.health_check()
     
-    return jsonify({
+    return jresponse({
         'status': service_status,
         'service': 'FileAlchemy API',
         'version': '1.0.0',
         'environment': os.environ.get('FLASK_ENV', 'development'),
         'port': os.environ.get('PORT', '5000'),
         'supported_formats': len(formats),
-        'frontend_available': os.path.exists(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dist')),
+        'frontend_available': STATIC_EXISTS,
         'tts_service': tts_health
     })
 
 @app.route('/api/formats', methods=['GET'])
 def get_supported_formats():
     """Get all supported formats"""
-    formats = conversion_service.list_supported_formats()
-    return jsonify({
-        'success': True,
-        'formats': formats
-    })
+    return Response(formats_response_body(), mimetype='application/json')
 
 @app.route('/api/upload', methods=['POST'])
 def upload_files():
     """Upload files for conversion"""
     try:
         if 'files' not in request.files:
-            return jsonify({'success': False, 'error': 'No files provided'}), 400
+            return jresponse({'success': False, 'error': 'No files provided'}, 400)
         
         files = request.files.getlist('files')
         source_format = request.form.get('source_format', '').upper()
         target_format = request.form.get('target_format', '').upper()
         
         if not source_format or not target_format:
-            return jsonify({'success': False, 'error': 'Source and target formats required'}), 400
+            return jresponse({'success': False, 'error': 'Source and target formats required'}, 400)
         
         if not files or all(f.filename == '' for f in files):
-            return jsonify({'success': False, 'error': 'No files selected'}), 400
+            return jresponse({'success': False, 'error': 'No files selected'}, 400)
         
         # Check if conversion is supported before processing files
         is_supported, reason = conversion_service.is_conversion_supported(
             source_format.lower(), target_format.lower()
         )
         if not is_supported:
-            return jsonify({
+            return jresponse({
                 'success': False, 
                 'error': f'Conversion not supported: {reason}'
-            }), 400
+            }, 400)
 
         # Validate files
         uploaded_files = []
@@ -269,29 +591,24 @@ def upload_files():
             if file.filename == '':
                 continue
             
-            # Check file size
-            file.seek(0, 2)  # Seek to end
-            file_size = file.tell()
-            file.seek(0)  # Reset to beginning
-            
-            if file_size > MAX_FILE_SIZE:
-                return jsonify({
-                    'success': False, 
-                    'error': f'File {file.filename} is too large (max {MAX_FILE_SIZE // (1024*1024)}MB)'
-                }), 400
-            
             # Check file extension
             if not allowed_file(file.filename):
-                return jsonify({
+                return jresponse({
                     'success': False, 
                     'error': f'File type not supported: {file.filename}'
-                }), 400
+                }, 400)
             
-            # Save file
-            filename = secure_filename(file.filename)
-            unique_filename = f"{uuid.uuid4()}_{filename}"
+            # Save file, enforcing the size limit while streaming
+            filename = safe_filename(file.filename)
+            unique_filename = f"{uuid.uuid4().hex}_{filename}"
             filepath = os.path.join(UPLOAD_FOLDER, unique_filename)
-            file.save(filepath)
+            file_size = save_upload(file, filepath)
+            
+            if file_size is None:
+                return jresponse({
+                    'success': False, 
+                    'error': f'File {file.filename} is too large (max {MAX_FILE_SIZE // (1024*1024)}MB)'
+                }, 400)
             
             uploaded_files.append({
                 'filename': filename,
@@ -300,158 +617,187 @@ def upload_files():
             })
         
         if not uploaded_files:
-            return jsonify({'success': False, 'error': 'No valid files uploaded'}), 400
+            return jresponse({'success': False, 'error': 'No valid files uploaded'}, 400)
         
         # Create conversion job
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         job = ConversionJob(job_id, uploaded_files, source_format, target_format)
-        conversion_jobs[job_id] = job
+        with jobs_lock:
+            conversion_jobs[job_id] = job
+        publish_job(job)
         
-        # Start conversion in background thread
-        thread = threading.Thread(target=process_conversion_job, args=(job,))
-        thread.daemon = True
-        thread.start()
+        # Queue conversion on the worker pool
+        job_executor.submit(process_conversion_job, job)
         
-        return jsonify({
+        return jresponse({
             'success': True,
             'job_id': job_id,
             'message': f'Started conversion of {len(uploaded_files)} files'
         })
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jresponse({'success': False, 'error': str(e)}, 500)
 
-@app.route('/api/status/<job_id>', methods=['GET'])
-def get_conversion_status(job_id):
-    """Get conversion job status"""
-    if job_id not in conversion_jobs:
-        return jsonify({'success': False, 'error': 'Job not found'}), 404
-    
-    job = conversion_jobs[job_id]
-    
-    return jsonify({
+def job_status_payload(job):
+    """Status response body shared by polling and streaming endpoints"""
+    return {
         'success': True,
-        'job_id': job_id,
+        'job_id': job.job_id,
         'status': job.status,
         'progress': job.progress,
         'results': job.results,
         'error_message': job.error_message
-    })
+    }
+
+@app.route('/api/status/<job_id>', methods=['GET'])
+def get_conversion_status(job_id):
+    """Get conversion job status"""
+    with jobs_lock:
+        job = conversion_jobs.get(job_id)
+    
+    if job is None:
+        # The job may belong to another server process
+        shared_status = load_shared_job_status(job_id)
+        if shared_status is not None:
+            return Response(shared_status, mimetype='application/json')
+        return jresponse({'success': False, 'error': 'Job not found'}, 404)
+    
+    return jresponse(job_status_payload(job))
+
+@app.route('/api/status/<job_id>/stream', methods=['GET'])
+def stream_conversion_status(job_id):
+    """Push conversion job status as Server-Sent Events until the job finishes"""
+    with jobs_lock:
+        job = conversion_jobs.get(job_id)
+    
+    if job is None:
+        return jresponse({'success': False, 'error': 'Job not found'}, 404)
+    
+    def job_state():
+        return (job.status, job.progress, len(job.results))
+    
+    def events():
+        last_state = None
+        while True:
+            with jobs_changed:
+                jobs_changed.wait_for(lambda: job_state() != last_state, timeout=STATUS_STREAM_KEEPALIVE)
+            
+            state = job_state()
+            if state == last_state:
+                # Keep idle connections from being closed by proxies
+                yield ': keep-alive\n\n'
+                continue
+            
+            last_state = state
+            yield f"data: {orjson.dumps(job_status_payload(job)).decode()}\n\n"
+            if job.status in ('completed', 'failed'):
+                return
+    
+    return Response(
+        events(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @app.route('/api/download/<filename>', methods=['GET'])
 def download_file(filename):
     """Download converted file"""
     try:
-        # Security check - prevent directory traversal
-        if '..' in filename or '/' in filename or '\\' in filename:
-            print(f"❌ Security violation: Invalid filename {filename}")
-            return jsonify({'success': False, 'error': 'Invalid filename'}), 400
-        
-        filepath = os.path.join(CONVERTED_FOLDER, filename)
-        print(f"🔍 Download request for: {filename}")
-        print(f"📁 Full path: {filepath}")
-        print(f"📂 Converted folder: {CONVERTED_FOLDER}")
-        print(f"📋 Folder exists: {os.path.exists(CONVERTED_FOLDER)}")
-        print(f"📄 File exists: {os.path.exists(filepath)}")
-        
-        # List files in converted folder for debugging
-        if os.path.exists(CONVERTED_FOLDER):
-            files_in_folder = os.listdir(CONVERTED_FOLDER)
-            print(f"📁 Files in converted folder: {files_in_folder}")
-        else:
-            print("❌ Converted folder does not exist!")
-            os.makedirs(CONVERTED_FOLDER, exist_ok=True)
-            print("✅ Created converted folder")
+        # Security check - the resolved path (symlinks included) must stay in CONVERTED_FOLDER
+        filepath = os.path.realpath(os.path.join(CONVERTED_FOLDER, filename))
+        if not filepath.startswith(CONVERTED_REAL_PREFIX):
+            return jresponse({'success': False, 'error': 'Invalid filename'}, 400)
         
-        if not os.path.exists(filepath):
-            print(f"❌ File not found: {filepath}")
-            return jsonify({'success': False, 'error': f'File not found: {filename}'}), 404
+        # One stat call covers both the existence and the size check
+        try:
+            file_stat = os.stat(filepath)
+        except FileNotFoundError:
+            return jresponse({'success': False, 'error': f'File not found: {filename}'}, 404)
         
-        # Check file size
-        file_size = os.path.getsize(filepath)
-        print(f"📊 File size: {file_size} bytes")
+        if file_stat.st_size == 0:
+            return jresponse({'success': False, 'error': 'File is empty'}, 404)
         
-        if file_size == 0:
-            print(f"⚠️ Warning: File is empty: {filepath}")
-            return jsonify({'success': False, 'error': 'File is empty'}), 404
+        # Conditional responses let repeat downloads return 304 Not Modified
+        response = send_file(
+            filepath,
+            as_attachment=True,
+            download_name=filename,
+            conditional=True,
+            etag=True,
+            max_age=0,
+            last_modified=file_stat.st_mtime
+        )
         
-        print(f"✅ Sending file: {filepath}")
-        return send_file(filepath, as_attachment=True, download_name=filename)
+        # Stream in larger chunks unless the server supplied its own (sendfile) wrapper
+        file_wrapper = getattr(response.response, 'iterable', response.response)
+        if isinstance(file_wrapper, FileWrapper):
+            file_wrapper.buffer_size = DOWNLOAD_BUFFER_SIZE
+        
+        if os.path.splitext(filename)[1].lower() in COMPRESSED_EXTENSIONS:
+            response.headers['Content-Encoding'] = 'identity'
+        
+        return response
         
     except Exception as e:
-        print(f"❌ Download error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': f'Download failed: {str(e)}'}), 500
+        log.exception("Download error for %s", filename)
+        return jresponse({'success': False, 'error': f'Download failed: {str(e)}'}, 500)
 
 @app.route('/api/convert', methods=['POST'])
 def convert_single_file():
     """Convert a single file (synchronous)"""
     try:
+        # Reject oversized requests before parsing the multipart body
+        if request.content_length and request.content_length > MAX_FILE_SIZE:
+            return jresponse({
+                'success': False, 
+                'error': f'File is too large (max {MAX_FILE_SIZE // (1024*1024)}MB)'
+            }, 413)
+        
         if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'No file provided'}), 400
+            return jresponse({'success': False, 'error': 'No file provided'}, 400)
         
         file = request.files['file']
         source_format = request.form.get('source_format', '').upper()
         target_format = request.form.get('target_format', '').upper()
         
         if not source_format or not target_format:
-            return jsonify({'success': False, 'error': 'Source and target formats required'}), 400
+            return jresponse({'success': False, 'error': 'Source and target formats required'}, 400)
         
         if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'}), 400
+            return jresponse({'success': False, 'error': 'No file selected'}, 400)
         
         # Check if conversion is supported before processing
         is_supported, reason = conversion_service.is_conversion_supported(
             source_format.lower(), target_format.lower()
         )
         if not is_supported:
-            return jsonify({
+            return jresponse({
                 'success': False, 
                 'error': f'Conversion not supported: {reason}'
-            }), 400
+            }, 400)
         
         # Validate file
         if not allowed_file(file.filename):
-            return jsonify({'success': False, 'error': 'File type not supported'}), 400
+            return jresponse({'success': False, 'error': 'File type not supported'}, 400)
         
         # Save uploaded file
-        filename = secure_filename(file.filename)
-        unique_filename = f"{uuid.uuid4()}_{filename}"
+        filename = safe_filename(file.filename)
+        unique_filename = f"{uuid.uuid4().hex}_{filename}"
         input_path = os.path.join(UPLOAD_FOLDER, unique_filename)
-        file.save(input_path)
-        
-        # Prepare output file
-        filename_without_ext = Path(filename).stem
+        if save_upload(file, input_path) is None:
+            return jresponse({
+                'success': False, 
+                'error': f'File {file.filename} is too large (max {MAX_FILE_SIZE // (1024*1024)}MB)'
+            }, 413)
         
-        # Special handling for PDF to image conversion (results in ZIP file)
-        if source_format.upper() == 'PDF' and target_format.upper() in ['JPG', 'JPEG', 'PNG']:
-            output_filename = f"{filename_without_ext}_pages.zip"
-            output_path = os.path.join(CONVERTED_FOLDER, f"{uuid.uuid4()}_{output_filename}")
-        else:
-            output_filename = f"{filename_without_ext}.{target_format.lower()}"
-            output_path = os.path.join(CONVERTED_FOLDER, f"{uuid.uuid4()}_{output_filename}")
-        
-        # Perform conversion
-        if source_format.upper() == 'PDF' and target_format.upper() in ['JPG', 'JPEG', 'PNG']:
-            # Create a temporary output path with the image extension for the converter
-            temp_output = output_path.replace('_pages.zip', f'.{target_format.lower()}')
-            success = conversion_service.convert_file(input_path, temp_output, target_format=target_format)
-            
-            # If successful, the converter should have created a ZIP file at temp_output
-            # Rename it to the expected output_path
-            if success and os.path.exists(temp_output):
-                import shutil
-                shutil.move(temp_output, output_path)
-                print(f"Moved {temp_output} to {output_path}")
-            elif success:
-                print(f"Warning: Conversion succeeded but temp file {temp_output} not found")
-                success = False
-        else:
-            success = conversion_service.convert_file(input_path, output_path)
+        # Prepare output file and perform conversion
+        output_filename, output_path, converter_path, is_pdf_to_image = compute_output_paths(
+            uuid.uuid4().hex, Path(filename).stem, source_format, target_format
+        )
+        success = run_conversion(input_path, output_path, converter_path, target_format, is_pdf_to_image)
         
         if success:
-            return jsonify({
+            return jresponse({
                 'success': True,
                 'original_filename': filename,
                 'converted_filename': output_filename,
@@ -459,13 +805,13 @@ def convert_single_file():
                 'size': os.path.getsize(output_path)
             })
         else:
-            return jsonify({
+            return jresponse({
                 'success': False,
                 'error': f'Failed to convert {filename} from {source_format} to {target_format}'
-            }), 500
+            }, 500)
             
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jresponse({'success': False, 'error': str(e)}, 500)
     finally:
         # Clean up input file
         if 'input_path' in locals() and os.path.exists(input_path):
@@ -473,6 +819,7 @@ def convert_single_file():
                 os.remove(input_path)
             except OSError:
                 pass
+        maybe_cleanup()
 
 # TTS API Endpoints
 @app.route('/api/tts/voices', methods=['GET'])
@@ -480,13 +827,13 @@ def get_tts_voices():
     """Get available TTS voices"""
     try:
         voices_data = tts_service.get_voices()
-        return jsonify(voices_data)
+        return jresponse(voices_data)
     except Exception as e:
-        return jsonify({
+        return jresponse({
             'success': False,
             'error': f'Failed to get voices: {str(e)}',
             'voices': []
-        }), 500
+        }, 500)
 
 @app.route('/api/tts/convert', methods=['POST'])
 def text_to_speech():
@@ -494,11 +841,11 @@ def text_to_speech():
     try:
         data = request.get_json()
         if not data:
-            return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
+            return jresponse({'success': False, 'error': 'No JSON data provided'}, 400)
         
         text = data.get('text', '').strip()
         if not text:
-            return jsonify({'success': False, 'error': 'No text provided'}), 400
+            return jresponse({'success': False, 'error': 'No text provided'}, 400)
         
         # Optional parameters
         rate = data.get('rate')  # Words per minute (100-300)
@@ -510,30 +857,31 @@ def text_to_speech():
             try:
                 rate = int(rate)
                 if rate < 50 or rate > 400:
-                    return jsonify({'success': False, 'error': 'Rate must be between 50 and 400 WPM'}), 400
+                    return jresponse({'success': False, 'error': 'Rate must be between 50 and 400 WPM'}, 400)
             except (ValueError, TypeError):
-                return jsonify({'success': False, 'error': 'Invalid rate value'}), 400
+                return jresponse({'success': False, 'error': 'Invalid rate value'}, 400)
         
         if volume is not None:
             try:
                 volume = float(volume)
                 if volume < 0.0 or volume > 1.0:
-                    return jsonify({'success': False, 'error': 'Volume must be between 0.0 and 1.0'}), 400
+                    return jresponse({'success': False, 'error': 'Volume must be between 0.0 and 1.0'}, 400)
             except (ValueError, TypeError):
-                return jsonify({'success': False, 'error': 'Invalid volume value'}), 400
+                return jresponse({'success': False, 'error': 'Invalid volume value'}, 400)
         
         # Generate unique filename
-        filename = f"tts_{uuid.uuid4()}.wav"
+        filename = f"tts_{uuid.uuid4().hex}.wav"
         output_path = os.path.join(CONVERTED_FOLDER, filename)
         
         # Convert text to speech
         success, message = tts_service.text_to_speech_file(
             text, output_path, rate, volume, voice_id
         )
+        maybe_cleanup()
         
         if success:
             file_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
-            return jsonify({
+            return jresponse({
                 'success': True,
                 'message': message,
                 'filename': filename,
@@ -542,13 +890,13 @@ def text_to_speech():
                 'text_length': len(text)
             })
         else:
-            return jsonify({
+            return jresponse({
                 'success': False,
                 'error': message
-            }), 500
+            }, 500)
             
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jresponse({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/tts/preview', methods=['POST'])
 def preview_speech():
@@ -556,15 +904,15 @@ def preview_speech():
     try:
         data = request.get_json()
         if not data:
-            return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
+            return jresponse({'success': False, 'error': 'No JSON data provided'}, 400)
         
         text = data.get('text', '').strip()
         if not text:
-            return jsonify({'success': False, 'error': 'No text provided'}), 400
+            return jresponse({'success': False, 'error': 'No text provided'}, 400)
         
         # Limit preview text length for performance
         if len(text) > 500:
-            return jsonify({'success': False, 'error': 'Preview text too long (max 500 characters)'}), 400
+            return jresponse({'success': False, 'error': 'Preview text too long (max 500 characters)'}, 400)
         
         # Optional parameters
         rate = data.get('rate')
@@ -576,58 +924,51 @@ def preview_speech():
             try:
                 rate = int(rate)
                 if rate < 50 or rate > 400:
-                    return jsonify({'success': False, 'error': 'Rate must be between 50 and 400 WPM'}), 400
+                    return jresponse({'success': False, 'error': 'Rate must be between 50 and 400 WPM'}, 400)
             except (ValueError, TypeError):
-                return jsonify({'success': False, 'error': 'Invalid rate value'}), 400
+                return jresponse({'success': False, 'error': 'Invalid rate value'}, 400)
         
         if volume is not None:
             try:
                 volume = float(volume)
                 if volume < 0.0 or volume > 1.0:
-                    return jsonify({'success': False, 'error': 'Volume must be between 0.0 and 1.0'}), 400
+                    return jresponse({'success': False, 'error': 'Volume must be between 0.0 and 1.0'}, 400)
             except (ValueError, TypeError):
-                return jsonify({'success': False, 'error': 'Invalid volume value'}), 400
+                return jresponse({'success': False, 'error': 'Invalid volume value'}, 400)
         
         # Preview speech
         success, message = tts_service.preview_speech(text, rate, volume, voice_id)
         
         if success:
-            return jsonify({
+            return jresponse({
                 'success': True,
                 'message': message,
                 'text_length': len(text)
             })
         else:
-            return jsonify({
+            return jresponse({
                 'success': False,
                 'error': message
-            }), 500
+            }, 500)
             
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jresponse({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/tts/health', methods=['GET'])
 def tts_health_check():
     """TTS service health check"""
     try:
         health_data = tts_service.health_check()
-        return jsonify({
+        return jresponse({
             'success': True,
             'health': health_data
         })
     except Exception as e:
-        return jsonify({
+        return jresponse({
             'success': False,
             'error': str(e),
             'health': {'initialized': False}
-        }), 500
-
-# Cleanup task
-def cleanup_task():
-    """Periodic cleanup task"""
-    while True:
-        time.sleep(300)  # Run every 5 minutes
-        cleanup_old_files()
+        }, 500)
 
 # Serve static files (React frontend) in production
 # This route must be AFTER all API routes to avoid conflicts
@@ -637,32 +978,37 @@ def serve_frontend(path):
     """Serve React frontend static files"""
     # Skip API routes - they should be handled by their specific endpoints
     if path.startswith('api/'):
-        return jsonify({'error': 'API endpoint not found'}), 404
+        return jresponse({'error': 'API endpoint not found'}, 404)
     
-    # In production, serve built React files
-    static_folder = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dist')
-    
-    if os.path.exists(static_folder):
-        if path != "" and os.path.exists(os.path.join(static_folder, path)):
-            return send_from_directory(static_folder, path)
-        else:
-            # For React Router, serve index.html for all non-API routes
-            return send_from_directory(static_folder, 'index.html')
-    else:
+    if not STATIC_EXISTS:
         # Development mode - return a simple message
-        return jsonify({
+        return jresponse({
             'message': 'FileAlchemy API Server',
             'status': 'running',
             'frontend': 'not built - run npm run build to create production frontend',
             'note': 'Run "npm run build" to create the production frontend'
         })
+    
+    # In production, serve built React files
+    if path.startswith('assets/'):
+        # Content-hashed bundles can be cached by browsers indefinitely
+        response = send_from_directory(STATIC_FOLDER, path, conditional=True, max_age=STATIC_ASSET_MAX_AGE)
+        response.cache_control.immutable = True
+        return response
+    
+    if path:
+        try:
+            return send_from_directory(STATIC_FOLDER, path, conditional=True)
+        except NotFound:
+            pass
+    
+    # For React Router, serve index.html for all non-API routes
+    response = send_from_directory(STATIC_FOLDER, 'index.html', conditional=True)
+    response.cache_control.no_cache = True
+    return response
 
-# Start cleanup thread
-cleanup_thread = threading.Thread(target=cleanup_task)
-cleanup_thread.daemon = True
-cleanup_thread.start()
-
-if __name__ == '__main__':
+def main():
+    """Start the development server; run_server.py calls this"""
     print("Starting FileAlchemy API Server...")
     print(f"Base directory: {BASE_DIR}")
     print(f"Upload folder: {UPLOAD_FOLDER}")
@@ -671,7 +1017,7 @@ if __name__ == '__main__':
     print(f"Converted folder exists: {os.path.exists(CONVERTED_FOLDER)}")
     
     print("Supported formats:")
-    formats = conversion_service.list_supported_formats()
+    formats = cached_formats()
     for conv_type, format_dict in formats.items():
         print(f"  {conv_type.capitalize()}:")
         print(f"    Input:  {', '.join(format_dict['input'])}")
@@ -681,5 +1027,11 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
     
+    # Started here rather than at import, so importing this module never runs it
+    threading.Thread(target=cleanup_heartbeat, daemon=True, name='cleanup-heartbeat').start()
+    
     print(f"Server starting on port {port}")
-    app.run(debug=debug_mode, host='0.0.0.0', port=port)
\ No newline at end of file
+    app.run(debug=debug_mode, host='0.0.0.0', port=port)
+
+if __name__ == '__main__':
+    main()
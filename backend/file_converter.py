@@ -4,11 +4,483 @@ Supports images, documents, media, and archives
 """
 
 import os
+import io
+import logging
+import multiprocessing
+import re
+import html
+import importlib.util
+import stat
+import queue
+import threading
+import contextlib
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from abc import ABC, abstractmethod
 
+# Per-file conversion tracing goes through logging (under api_server's 'filealchemy'
+# logger) so it is skipped cheaply unless enabled
+log = logging.getLogger('filealchemy.converter')
+
+# Output extension -> Pillow save format, and modes that carry transparency
+_EXT_TO_PIL_FORMAT = {
+    'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG', 'bmp': 'BMP', 'tiff': 'TIFF',
+    'gif': 'GIF', 'webp': 'WEBP', 'ico': 'ICO',
+}
+_ALPHA_MODES = frozenset({'RGBA', 'LA'})
+_JPEG_SAFE_MODES = frozenset({'RGB', 'L'})
+
+# Fallback HTML stripping patterns, compiled once
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Optional libraries are probed once at import time - converters only read these flags
+try:
+    import PIL
+    from PIL import Image
+    _PILLOW_OK = True
+    # Pillow-SIMD is a drop-in replacement that tags its releases as X.Y.Z.postN
+    _PILLOW_SIMD = '.post' in PIL.__version__
+    if _PILLOW_SIMD:
+        print(f"Image backend: Pillow-SIMD {PIL.__version__}")
+    else:
+        print(f"Image backend: Pillow {PIL.__version__} (install pillow-simd for faster image processing)")
+except ImportError as e:
+    print(f"Basic image conversion unavailable: {e}")
+    _PILLOW_OK = False
+    _PILLOW_SIMD = False
+
+# NumPy (installed alongside pandas) speeds up alpha flattening for JPEG output
+try:
+    import numpy as np
+    _NUMPY_OK = True
+except ImportError:
+    _NUMPY_OK = False
+
+# Numba (optional) JIT-compiles the alpha blend for very large images
+try:
+    import numba
+    _NUMBA_OK = _NUMPY_OK
+except ImportError:
+    _NUMBA_OK = False
+
+try:
+    import pillow_heif
+    pillow_heif.register_heif_opener()
+    _HEIF_OK = True
+except ImportError as e:
+    print(f"HEIF image support unavailable (this is optional): {e}")
+    _HEIF_OK = False
+
+# SVG support is optional and requires the system Cairo library
+try:
+    import cairosvg
+    _CAIROSVG_OK = True
+except (ImportError, OSError) as e:
+    print(f"SVG conversion unavailable (this is optional): {e}")
+    _CAIROSVG_OK = False
+
+# The converters below import these where they use them, so only check they are installed
+_PYMUPDF_OK = importlib.util.find_spec('fitz') is not None
+
+# pypdfium2 (Chrome's PDFium) is an optional, faster renderer for PDF pages
+_PDFIUM_OK = importlib.util.find_spec('pypdfium2') is not None
+
+_PDF2DOCX_OK = importlib.util.find_spec('pdf2docx') is not None
+
+# python-docx, for reading DOCX files
+_PYTHON_DOCX_OK = importlib.util.find_spec('docx') is not None
+
+# HTML parsers for HTML to TXT, fastest first
+try:
+    from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+    _SELECTOLAX_OK = True
+except ImportError:
+    _SELECTOLAX_OK = False
+
+try:
+    from bs4 import BeautifulSoup
+    _BS4_OK = True
+except ImportError:
+    _BS4_OK = False
+
+_LXML_OK = importlib.util.find_spec('lxml') is not None
+
+# Real HTML renderers for HTML to PDF (optional; otherwise the text is laid out with reportlab)
+try:
+    from xhtml2pdf import pisa
+    _XHTML2PDF_OK = True
+except ImportError:
+    _XHTML2PDF_OK = False
+
+try:
+    import weasyprint
+    _WEASYPRINT_OK = True
+except (ImportError, OSError):  # OSError: missing Pango/Cairo system libraries
+    _WEASYPRINT_OK = False
+
+# reportlab, for creating PDFs
+_REPORTLAB_OK = importlib.util.find_spec('reportlab') is not None
+
+# Faster gzip for .tar.gz archives: ISA-L bindings, else the pigz binary, else zlib
+try:
+    from isal import igzip_threaded, isal_zlib
+    _ISAL_OK = True
+except ImportError:
+    _ISAL_OK = False
+
+_PIGZ_PATH = shutil.which('pigz')
+
+# CRC-32 for ZIP members we compress ourselves. ISA-L computes the same
+# (ISO-HDLC) checksum with carry-less multiply instructions, several times
+# faster than zlib's tables.
+if _ISAL_OK:
+    _crc32 = isal_zlib.crc32
+else:
+    from zlib import crc32 as _crc32
+
+# Images with at least this many pixels use the Numba kernel, which pays a one-time compile
+NUMBA_MIN_PIXELS = 16 * 1024 * 1024
+
+if _NUMBA_OK:
+    @numba.njit(parallel=True, cache=True)
+    def _composite_over_white(pixels):
+        """Blend an (H, W, 4) RGBA or (H, W, 2) LA array onto white, one row per thread"""
+        height, width, channels = pixels.shape
+        out = np.empty((height, width, 3), np.uint8)
+        for y in numba.prange(height):
+            for x in range(width):
+                alpha = np.uint32(pixels[y, x, channels - 1])
+                background = 255 * (255 - alpha) + 127
+                for c in range(3):
+                    # LA images have a single gray channel for all three outputs
+                    value = np.uint32(pixels[y, x, c if channels == 4 else 0])
+                    out[y, x, c] = (value * alpha + background) // 255
+        return out
+
+def _flatten_alpha(img):
+    """Composite an RGBA or LA image onto a white background, returning an RGB image"""
+    # Pillow-SIMD's vectorized paste beats the NumPy blend
+    if _PILLOW_SIMD or not _NUMPY_OK:
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    
+    arr = np.asarray(img)
+    if _NUMBA_OK and img.width * img.height >= NUMBA_MIN_PIXELS:
+        return Image.fromarray(_composite_over_white(arr), 'RGB')
+    
+    rgb = np.empty((img.height, img.width, 3), dtype=np.uint8)
+    # Blend in blocks of rows to keep the uint16 temporaries small
+    for top in range(0, img.height, 1024):
+        block = arr[top:top + 1024].astype(np.uint16)
+        alpha = block[..., -1:]
+        color = block[..., :-1]  # One gray channel for LA broadcasts to RGB
+        rgb[top:top + 1024] = (color * alpha + 255 * (255 - alpha) + 127) // 255
+    return Image.fromarray(rgb, 'RGB')
+
+# reportlab sample stylesheet shared by all PDF builders, created on first use
+_STYLES = None
+
+def _pdf_styles():
+    """Return the shared reportlab stylesheet, building it on first use"""
+    global _STYLES
+    if _STYLES is None:
+        from reportlab.lib.styles import getSampleStyleSheet
+        _STYLES = getSampleStyleSheet()
+    return _STYLES
+
+def _is_heading(stripped: str) -> bool:
+    """Short all-caps lines without a trailing period look like headings"""
+    # Cheap O(1) checks first; isupper() is a single C scan that stops at the first lowercase letter
+    return len(stripped) < 50 and stripped[-1] != '.' and stripped.isupper()
+
+def _classify_paragraphs(content: str) -> Iterator[Tuple[str, str]]:
+    """Split plain text into ('heading' | 'paragraph' | 'blank', text) items.
+
+    Headings are stripped; paragraphs keep their original text.
+    """
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            yield 'blank', ''
+        elif _is_heading(stripped):
+            yield 'heading', stripped
+        else:
+            yield 'paragraph', line
+
+# Empty PyMuPDF's resource store after this many rendered pages
+PDF_STORE_SHRINK_PAGES = 16
+
+def _iter_pdf_page_images(input_path: str, page_numbers: List[int], zoom: float,
+                          target_format: str, base_name: str, jpg_quality: int = 95):
+    """Yield (page_filename, image_bytes) for the given PDF pages, one page at a time"""
+    import fitz
+    
+    # Loop invariants: one matrix, one format decision and one filename prefix for every page
+    mat = fitz.Matrix(zoom, zoom)
+    is_jpeg = target_format == 'jpg'
+    name_prefix = f"{base_name}_page_"
+    
+    doc = fitz.open(input_path)
+    try:
+        for count, page_num in enumerate(page_numbers, 1):
+            # Render page straight to an alpha-free RGB pixmap, which JPEG needs anyway
+            page = doc.load_page(page_num)
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+            
+            # Encode with PyMuPDF's own encoder, no intermediate Pixmap copies
+            if is_jpeg:
+                data = pix.tobytes(output='jpg', jpg_quality=jpg_quality)
+            else:
+                data = pix.tobytes(output='png')
+            # Release the page and pixmap before the next page is loaded
+            pix = None
+            page = None
+            
+            # Fonts and images of rendered pages pile up in PyMuPDF's global store.
+            # Emptying it now and then keeps memory flat on long documents, at the
+            # cost of re-decoding resources shared across pages.
+            if count % PDF_STORE_SHRINK_PAGES == 0:
+                fitz.TOOLS.store_shrink(100)
+            
+            yield f"{name_prefix}{page_num + 1:03d}.{target_format}", data
+    finally:
+        doc.close()
+
+def _iter_pdfium_page_images(input_path: str, page_numbers: List[int], zoom: float,
+                             target_format: str, base_name: str, jpg_quality: int = 95):
+    """Yield (page_filename, image_bytes) for the given PDF pages, rendered with pypdfium2"""
+    import pypdfium2 as pdfium
+    
+    save_kwargs = {'format': 'JPEG', 'quality': jpg_quality} if target_format == 'jpg' else {'format': 'PNG'}
+    name_prefix = f"{base_name}_page_"
+    
+    pdf = pdfium.PdfDocument(input_path)
+    try:
+        for page_num in page_numbers:
+            page = pdf[page_num]
+            try:
+                bitmap = page.render(scale=zoom)
+                buf = io.BytesIO()
+                bitmap.to_pil().save(buf, **save_kwargs)
+                bitmap = None
+            finally:
+                page.close()
+            
+            yield f"{name_prefix}{page_num + 1:03d}.{target_format}", buf.getvalue()
+    finally:
+        pdf.close()
+
+# PDF page renderers by backend name
+_PAGE_IMAGE_RENDERERS = {
+    'pymupdf': _iter_pdf_page_images,
+    'pdfium': _iter_pdfium_page_images,
+}
+
+def _pdf_page_count(input_path: str, backend: str) -> int:
+    """Number of pages in a PDF, opened with the given backend"""
+    if backend == 'pdfium':
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(input_path)
+    else:
+        import fitz
+        pdf = fitz.open(input_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+def _render_pdf_pages(input_path: str, page_numbers: List[int], zoom: float,
+                      target_format: str, base_name: str, jpg_quality: int = 95,
+                      backend: str = 'pymupdf') -> List[tuple]:
+    """Render the given PDF pages to encoded images.
+
+    Runs in a worker process, so it opens its own copy of the document.
+    Returns a list of (page_filename, image_bytes) tuples.
+    """
+    renderer = _PAGE_IMAGE_RENDERERS[backend]
+    return list(renderer(input_path, page_numbers, zoom, target_format, base_name, jpg_quality))
+
+# PDF pages render on one shared process pool. Each task is a short page range,
+# and at most PDF_RENDER_WINDOW ranges per PDF are in flight, so the encoded
+# pages waiting to be written stay bounded however long the document is.
+PDF_RENDER_WORKERS = min(os.cpu_count() or 1, 4)
+PDF_RENDER_TASK_PAGES = 4
+PDF_RENDER_WINDOW = 2 * PDF_RENDER_WORKERS
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+def process_pool_context():
+    """Start method for long-lived worker pools.
+
+    Pools are started from server threads, and a child forked while another
+    thread holds a lock can deadlock, so start workers from a fork server
+    (or spawn them where fork servers aren't available).
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+def _pdf_render_pool():
+    """Return the shared PDF rendering pool, starting it on first use"""
+    global _render_pool
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=PDF_RENDER_WORKERS,
+                                               mp_context=process_pool_context())
+        return _render_pool
+
+def _discard_pdf_render_pool(pool) -> None:
+    """Drop a pool that lost a worker so the next PDF starts a fresh one"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is pool:
+            _render_pool = None
+    pool.shutdown(wait=False)
+
+# Archives with fewer members than this are extracted/created on the calling thread
+ZIP_PARALLEL_MIN_MEMBERS = 16
+COPY_BUFFER_SIZE = 1024 * 1024
+ZIP_COMPRESS_LEVEL = 6
+GZIP_COMPRESS_LEVEL = 6
+ISAL_COMPRESS_LEVEL = 2  # ISA-L levels run 0-3; 2 is its default
+# Larger files are deflated by ZipFile.write itself rather than read whole into memory
+ZIP_PRECOMPRESS_MAX_BYTES = 32 * 1024 * 1024
+
+def _walk_files(root: str) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (DirEntry, arcname) for every regular file under root.
+
+    DirEntry caches the file type from the directory listing, so this avoids
+    the extra stat per entry that Path.rglob + is_file() costs. arcname is the
+    '/'-separated path relative to root, built up from entry names on the way
+    down rather than computed per file with relpath.
+    """
+    stack = [(root, '')]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, prefix + entry.name + '/'))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry, prefix + entry.name
+
+def _walk_format(root: str, ext: str, recursive: bool = True) -> Iterator[Tuple[str, str]]:
+    """Yield (path, relative_path) for files under root ending in .ext"""
+    suffix = '.' + ext.lower()
+    if recursive:
+        entries = _walk_files(root)
+    else:
+        with os.scandir(root) as it:
+            entries = [(entry, entry.name) for entry in it
+                       if entry.is_file(follow_symlinks=False)]
+    for entry, rel_path in entries:
+        if entry.name.lower().endswith(suffix):
+            yield entry.path, rel_path
+
+def _deflate_member(source) -> Tuple[bytes, int, int]:
+    """Raw-DEFLATE a ZIP entry's data, given as bytes or a file path to read.
+
+    Runs in a worker thread; zlib releases the GIL while compressing.
+    Returns (compressed_bytes, crc32, uncompressed_size).
+    """
+    import zlib
+    if isinstance(source, bytes):
+        data = source
+    else:
+        with open(source, 'rb') as f:
+            data = f.read()
+    compressor = zlib.compressobj(ZIP_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(), _crc32(data), len(data)
+
+def _write_deflated_member(zipf, zinfo, deflated: Tuple[bytes, int, int]) -> None:
+    """Append an already-compressed member to a ZipFile opened for writing"""
+    import zipfile
+    payload, crc, size = deflated
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(payload)
+    
+    # Same bookkeeping ZipFile.write does; close() writes the central directory
+    zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.start_dir
+    zipf.fp.write(zinfo.FileHeader(False))
+    zipf.fp.write(payload)
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+    zipf._didModify = True
+
+# Reused copy buffers, so extracting many small files doesn't allocate one per file
+_BUFFER_POOL = queue.LifoQueue(maxsize=2 * (os.cpu_count() or 1))
+
+def _copy_stream(src, dst) -> None:
+    """Copy src to dst through a pooled 1 MiB buffer"""
+    try:
+        buf = _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        buf = bytearray(COPY_BUFFER_SIZE)
+    try:
+        view = memoryview(buf)
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            dst.write(view[:n])
+    finally:
+        try:
+            _BUFFER_POOL.put_nowait(buf)
+        except queue.Full:
+            pass
+
+def _make_member_dirs(members: list, extract_root: str) -> list:
+    """Create the directories an archive's members need; returns the file members.
+
+    Works with zipfile and rarfile info objects. Directories that would land
+    outside extract_root are not created.
+    """
+    files = [m for m in members if not m.is_dir()]
+    directories = {os.path.dirname(m.filename) for m in files}
+    directories.update(m.filename for m in members if m.is_dir())
+    root_prefix = os.path.join(extract_root, '')
+    for directory in directories:
+        target = os.path.realpath(os.path.join(extract_root, directory))
+        if target == extract_root or target.startswith(root_prefix):
+            os.makedirs(target, exist_ok=True)
+    return files
+
+def _copy_members(archive, members: list, extract_root: str) -> None:
+    """Write file members of an open ZipFile/RarFile under extract_root.
+
+    Members that would land outside extract_root are skipped.
+    """
+    root_prefix = os.path.join(extract_root, '')
+    for member in members:
+        target = os.path.realpath(os.path.join(extract_root, member.filename))
+        if not target.startswith(root_prefix):
+            print(f"Skipping unsafe archive member: {member.filename}")
+            continue
+        with archive.open(member) as src, open(target, 'wb') as dst:
+            _copy_stream(src, dst)
+
+def _extract_zip_members(archive_path: str, members: list, extract_root: str) -> None:
+    """Extract the given ZIP file members into extract_root.
+
+    Runs in a worker thread with its own ZipFile handle, since a shared handle
+    serializes reads on its file position.
+    """
+    import zipfile
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        _copy_members(zip_ref, members, extract_root)
+
 class BaseConverter(ABC):
     """Base class for all file converters"""
     
@@ -26,41 +498,20 @@ class ImageConverter(BaseConverter):
     """Handle image conversions using Pillow and pillow-heif"""
     
     def __init__(self):
-        self.available_libs = {}
-        
-        # Check for basic image support (Pillow)
-        try:
-            from PIL import Image
-            self.available_libs['pillow'] = True
-        except ImportError as e:
-            print(f"Basic image conversion unavailable: {e}")
-            self.available_libs['pillow'] = False
-        
-        # Check for HEIF support (optional)
-        try:
-            import pillow_heif
-            pillow_heif.register_heif_opener()
-            self.available_libs['pillow_heif'] = True
-        except ImportError as e:
-            print(f"HEIF image support unavailable (this is optional): {e}")
-            self.available_libs['pillow_heif'] = False
-            
-        # Check for SVG support (optional, requires system Cairo library)
-        try:
-            import cairosvg
-            self.available_libs['cairosvg'] = True
-        except (ImportError, OSError) as e:
-            print(f"SVG conversion unavailable (this is optional): {e}")
-            self.available_libs['cairosvg'] = False
-            
-        self.available = self.available_libs['pillow']
+        self.available_libs = {
+            'pillow': _PILLOW_OK,
+            'pillow_simd': _PILLOW_SIMD,
+            'pillow_heif': _HEIF_OK,
+            'cairosvg': _CAIROSVG_OK,
+        }
+        self.available = _PILLOW_OK
     
     def convert(self, input_path: str, output_path: str, **kwargs) -> bool:
         if not self.available:
             return False
             
-        input_ext = Path(input_path).suffix.lower().lstrip('.')
-        output_ext = Path(output_path).suffix.lower().lstrip('.')
+        input_ext = os.path.splitext(input_path)[1][1:].lower()
+        output_ext = os.path.splitext(output_path)[1][1:].lower()
         
         # Handle SVG conversion
         if input_ext == 'svg':
@@ -69,25 +520,22 @@ class ImageConverter(BaseConverter):
         try:
             from PIL import Image
             
+            save_format = _EXT_TO_PIL_FORMAT.get(output_ext) or output_ext.upper()
+            
             with Image.open(input_path) as img:
                 # Handle different color modes for JPEG conversion
-                if output_ext in ['jpg', 'jpeg']:
-                    if img.mode in ['RGBA', 'LA']:
-                        # Create white background for JPEG (transparency not supported)
-                        background = Image.new('RGB', img.size, (255, 255, 255))
-                        background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                        img = background
+                if save_format == 'JPEG':
+                    if img.mode in _ALPHA_MODES:
+                        # Flatten onto a white background for JPEG (transparency not supported)
+                        img = _flatten_alpha(img)
                     elif img.mode == 'P':
                         # Convert palette mode (common in GIFs) to RGB
                         img = img.convert('RGB')
-                    elif img.mode not in ['RGB', 'L']:
+                    elif img.mode not in _JPEG_SAFE_MODES:
                         # Convert any other mode to RGB
                         img = img.convert('RGB')
                 
                 # Convert and save
-                save_format = output_ext.upper()
-                if save_format in ['JPG']:
-                    save_format = 'JPEG'
                 img.save(output_path, format=save_format, **kwargs)
             return True
             
@@ -102,7 +550,6 @@ class ImageConverter(BaseConverter):
             return False
             
         try:
-            import cairosvg
             from PIL import Image
             import io
             
@@ -116,9 +563,7 @@ class ImageConverter(BaseConverter):
                 img = Image.open(io.BytesIO(png_data))
                 # Convert RGBA to RGB for JPEG
                 if img.mode == 'RGBA':
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    background.paste(img, mask=img.split()[-1])
-                    img = background
+                    img = _flatten_alpha(img)
                 img.save(output_path, 'JPEG')
             else:
                 return False
@@ -142,81 +587,53 @@ class DocumentConverter(BaseConverter):
     """Handle document conversions using PyMuPDF and pdf2docx"""
     
     def __init__(self):
-        self.available_libs = {}
-        try:
-            import fitz  # PyMuPDF
-            self.available_libs['pymupdf'] = True
-        except ImportError:
-            self.available_libs['pymupdf'] = False
-            
-        try:
-            from pdf2docx import Converter
-            self.available_libs['pdf2docx'] = True
-        except ImportError:
-            self.available_libs['pdf2docx'] = False
-            
-        # Check for python-docx (for reading DOCX files)
-        try:
-            import docx
-            self.available_libs['python_docx'] = True
-        except ImportError:
-            self.available_libs['python_docx'] = False
-            
-        # Check for reportlab (for creating PDFs)
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            self.available_libs['reportlab'] = True
-        except ImportError:
-            self.available_libs['reportlab'] = False
+        self.available_libs = {
+            'pymupdf': _PYMUPDF_OK,
+            'pdfium': _PDFIUM_OK,
+            'pdf2docx': _PDF2DOCX_OK,
+            'python_docx': _PYTHON_DOCX_OK,
+            'reportlab': _REPORTLAB_OK,
+            'xhtml2pdf': _XHTML2PDF_OK,
+            'weasyprint': _WEASYPRINT_OK,
+        }
+    
+    # (input extension, output extension) -> handler method name.
+    # '.jpeg' outputs are normalized to '.jpg' before the lookup.
+    _DISPATCH = {
+        ('.pdf', '.docx'): '_pdf_to_docx',
+        ('.pdf', '.txt'): '_pdf_to_text',
+        ('.pdf', '.jpg'): '_pdf_to_images',  # Multi-page to ZIP
+        ('.pdf', '.png'): '_pdf_to_images',  # Multi-page to ZIP
+        ('.docx', '.pdf'): '_docx_to_pdf',
+        ('.docx', '.txt'): '_docx_to_txt',
+        ('.txt', '.docx'): '_txt_to_docx',
+        ('.txt', '.pdf'): '_txt_to_pdf',
+        ('.txt', '.html'): '_txt_to_html',
+        ('.html', '.txt'): '_html_to_txt',
+        ('.html', '.pdf'): '_html_to_pdf',
+    }
     
     def convert(self, input_path: str, output_path: str, **kwargs) -> bool:
-        input_ext = Path(input_path).suffix.lower()
-        output_ext = Path(output_path).suffix.lower()
-        
-        # PDF to DOCX conversion
-        if input_ext == '.pdf' and output_ext == '.docx':
-            return self._pdf_to_docx(input_path, output_path, **kwargs)
-        
-        # PDF to text conversion
-        elif input_ext == '.pdf' and output_ext == '.txt':
-            return self._pdf_to_text(input_path, output_path, **kwargs)
-        
-        # PDF to image conversion (multi-page to ZIP)
-        elif input_ext == '.pdf' and output_ext in ['.jpg', '.jpeg', '.png']:
-            return self._pdf_to_images(input_path, output_path, **kwargs)
-        
-        # DOCX to PDF conversion
-        elif input_ext == '.docx' and output_ext == '.pdf':
-            return self._docx_to_pdf(input_path, output_path, **kwargs)
-        
-        # DOCX to TXT conversion
-        elif input_ext == '.docx' and output_ext == '.txt':
-            return self._docx_to_txt(input_path, output_path, **kwargs)
+        input_ext = os.path.splitext(input_path)[1].lower()
+        output_ext = os.path.splitext(output_path)[1].lower()
+        if output_ext == '.jpeg':
+            output_ext = '.jpg'
         
-        # TXT to DOCX conversion
-        elif input_ext == '.txt' and output_ext == '.docx':
-            return self._txt_to_docx(input_path, output_path, **kwargs)
-        
-        # TXT to PDF conversion
-        elif input_ext == '.txt' and output_ext == '.pdf':
-            return self._txt_to_pdf(input_path, output_path, **kwargs)
-        
-        # TXT to HTML conversion
-        elif input_ext == '.txt' and output_ext == '.html':
-            return self._txt_to_html(input_path, output_path, **kwargs)
-        
-        # HTML to TXT conversion
-        elif input_ext == '.html' and output_ext == '.txt':
-            return self._html_to_txt(input_path, output_path, **kwargs)
-        
-        # HTML to PDF conversion
-        elif input_ext == '.html' and output_ext == '.pdf':
-            return self._html_to_pdf(input_path, output_path, **kwargs)
-        
-        return False
+        handler = self._DISPATCH.get((input_ext, output_ext))
+        if handler is None:
+            return False
+        return getattr(self, handler)(input_path, output_path, **kwargs)
     
     def _pdf_to_docx(self, input_path: str, output_path: str, **kwargs) -> bool:
+        # Building the DOCX from PyMuPDF's text blocks is far faster than pdf2docx's
+        # layout analysis; pdf2docx stays as the fallback
+        if self.available_libs['pymupdf'] and self.available_libs['python_docx']:
+            try:
+                self._pdf_to_docx_native(input_path, output_path)
+                return True
+            except Exception as e:
+                print(f"Native PDF to DOCX conversion failed, falling back to pdf2docx: {e}")
+        
         if not self.available_libs['pdf2docx']:
             print("pdf2docx not available")
             return False
@@ -231,7 +648,55 @@ class DocumentConverter(BaseConverter):
             print(f"PDF to DOCX conversion failed: {e}")
             return False
     
+    def _pdf_to_docx_native(self, input_path: str, output_path: str) -> None:
+        """Rebuild a PDF's text blocks and images as a DOCX with PyMuPDF and python-docx"""
+        import fitz
+        import io
+        import docx
+        from docx.shared import Inches, Pt
+        
+        doc = docx.Document()
+        pdf = fitz.open(input_path)
+        try:
+            for page_num, page in enumerate(pdf):
+                if page_num:
+                    doc.add_page_break()
+                page_width = page.rect.width
+                
+                for block in page.get_text('dict')['blocks']:
+                    if block['type'] == 1:
+                        # Image block - keep its width relative to the 6 inch text column
+                        block_width = block['bbox'][2] - block['bbox'][0]
+                        try:
+                            doc.add_picture(io.BytesIO(block['image']),
+                                            width=Inches(6 * min(block_width / page_width, 1)))
+                        except Exception:
+                            pass  # Image formats Word can't embed (e.g. JBIG2) are skipped
+                        continue
+                    
+                    # Text block - one paragraph, keeping each span's size and style
+                    para = doc.add_paragraph()
+                    for line_num, line in enumerate(block['lines']):
+                        if line_num:
+                            para.add_run(' ')
+                        for span in line['spans']:
+                            run = para.add_run(span['text'])
+                            run.font.size = Pt(round(span['size']))
+                            run.bold = bool(span['flags'] & 16)
+                            run.italic = bool(span['flags'] & 2)
+            
+            doc.save(output_path)
+        finally:
+            pdf.close()
+    
     def _pdf_to_text(self, input_path: str, output_path: str, **kwargs) -> bool:
+        if self.available_libs['pdfium']:
+            try:
+                self._pdf_to_text_pdfium(input_path, output_path)
+                return True
+            except Exception as e:
+                print(f"pdfium text extraction failed, falling back to PyMuPDF: {e}")
+        
         if not self.available_libs['pymupdf']:
             print("PyMuPDF not available")
             return False
@@ -239,94 +704,147 @@ class DocumentConverter(BaseConverter):
         try:
             import fitz
             doc = fitz.open(input_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
-            doc.close()
+            try:
+                # Write each page's text as it is extracted instead of accumulating one big string
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    for page in doc:
+                        f.write(page.get_text())
+            finally:
+                doc.close()
             return True
         except Exception as e:
             print(f"PDF to text conversion failed: {e}")
             return False
     
+    def _pdf_to_text_pdfium(self, input_path: str, output_path: str) -> None:
+        """Extract PDF text page by page with pypdfium2"""
+        import pypdfium2 as pdfium
+        
+        pdf = pdfium.PdfDocument(input_path)
+        try:
+            # newline='' keeps PDFium's own line endings instead of translating them
+            with open(output_path, 'w', encoding='utf-8', newline='') as f:
+                for page_num in range(len(pdf)):
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    try:
+                        # PDFium separates lines with CRLF; match PyMuPDF's LF output
+                        f.write(textpage.get_text_range().replace('\r\n', '\n'))
+                        f.write('\n')
+                    finally:
+                        textpage.close()
+                        page.close()
+        finally:
+            pdf.close()
+    
     def _pdf_to_images(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert PDF pages to images and package in ZIP file"""
         print(f"Starting PDF to images conversion: {input_path} -> {output_path}")
         
-        if not self.available_libs['pymupdf']:
-            print("PyMuPDF not available for PDF to image conversion")
+        if not (self.available_libs['pymupdf'] or self.available_libs['pdfium']):
+            print("Neither PyMuPDF nor pypdfium2 available for PDF to image conversion")
             return False
             
         try:
-            import fitz
-            import zipfile
-            import tempfile
-            import os
-            
             # For PDF to images, we need to determine the target format from kwargs or default to jpg
             target_format = kwargs.get('target_format', 'jpg').lower()
-            if target_format in ['jpeg']:
+            if target_format == 'jpeg':
                 target_format = 'jpg'
             
             print(f"Target image format: {target_format}")
             
-            if target_format not in ['jpg', 'png']:
+            if target_format not in {'jpg', 'png'}:
                 print(f"Unsupported image format: {target_format}")
                 return False
             
-            # Open PDF document
-            doc = fitz.open(input_path)
+            # Set resolution (DPI) - higher values = better quality but larger files
+            dpi = kwargs.get('dpi', 150)  # Default 150 DPI
+            zoom = dpi / 72  # 72 is the default DPI
+            jpg_quality = kwargs.get('quality', 95)
+            base_name = Path(input_path).stem
+            
+            # Prefer PDFium when installed; PyMuPDF takes over for files it can't handle
+            backends = [name for name in ('pdfium', 'pymupdf') if self.available_libs[name]]
+            for backend in backends:
+                try:
+                    page_count = self._write_page_images_zip(
+                        input_path, output_path, backend, zoom, target_format,
+                        base_name, jpg_quality, kwargs.get('num_workers')
+                    )
+                    break
+                except Exception as e:
+                    if backend == backends[-1]:
+                        raise
+                    print(f"{backend} rendering failed, retrying with {backends[-1]}: {e}")
             
-            # Create temporary directory for images
-            with tempfile.TemporaryDirectory() as temp_dir:
-                image_files = []
-                
-                # Convert each page to image
-                for page_num in range(len(doc)):
-                    page = doc.load_page(page_num)
-                    
-                    # Set resolution (DPI) - higher values = better quality but larger files
-                    dpi = kwargs.get('dpi', 150)  # Default 150 DPI
-                    zoom = dpi / 72  # 72 is the default DPI
-                    mat = fitz.Matrix(zoom, zoom)
-                    
-                    # Render page to pixmap
-                    pix = page.get_pixmap(matrix=mat)
-                    
-                    # Generate filename for this page
-                    base_name = Path(input_path).stem
-                    page_filename = f"{base_name}_page_{page_num + 1:03d}.{target_format}"
-                    page_path = os.path.join(temp_dir, page_filename)
-                    
-                    # Save image
-                    if target_format in ['jpg', 'jpeg']:
-                        # Convert to RGB for JPEG (remove alpha channel)
-                        if pix.alpha:
-                            pix = fitz.Pixmap(fitz.csRGB, pix)
-                        pix.save(page_path)
-                    else:
-                        # PNG supports alpha channel
-                        pix.save(page_path)
-                    
-                    image_files.append((page_filename, page_path))
-                    pix = None  # Free memory
-                
-                doc.close()
-                
-                # Create ZIP file with all images
-                with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for filename, filepath in image_files:
-                        zipf.write(filepath, filename)
-                
-                print(f"Successfully converted {len(image_files)} pages to {target_format.upper()} images in ZIP file")
-                return True
+            print(f"Successfully converted {page_count} pages to {target_format.upper()} images in ZIP file")
+            return True
                 
         except Exception as e:
             print(f"PDF to images conversion failed: {e}")
             return False
     
+    def _write_page_images_zip(self, input_path: str, output_path: str, backend: str, zoom: float,
+                               target_format: str, base_name: str, jpg_quality: int,
+                               num_workers: Optional[int] = None) -> int:
+        """Render every page of a PDF into a ZIP of images and return the page count.
+
+        Pass num_workers=1 to render in this process instead of the shared pool.
+        """
+        import zipfile
+        
+        page_count = _pdf_page_count(input_path, backend)
+        
+        # Batch and job pool workers already run one conversion per core, so they
+        # render in-process rather than feeding another pool
+        parallel = (num_workers != 1 and page_count > PDF_RENDER_TASK_PAGES
+                    and multiprocessing.parent_process() is None)
+        
+        # JPEG/PNG data is already compressed, so store pages without deflating them again
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED) as zipf:
+            if not parallel:
+                # Write each page as soon as it is rendered
+                for filename, data in _PAGE_IMAGE_RENDERERS[backend](
+                    input_path, range(page_count), zoom, target_format, base_name, jpg_quality
+                ):
+                    zipf.writestr(filename, data)
+            else:
+                self._write_pages_from_pool(zipf, input_path, page_count, backend, zoom,
+                                            target_format, base_name, jpg_quality)
+        
+        return page_count
+    
+    def _write_pages_from_pool(self, zipf, input_path: str, page_count: int, backend: str, zoom: float,
+                               target_format: str, base_name: str, jpg_quality: int) -> None:
+        """Render page ranges on the shared pool and write them to zipf in page order"""
+        from collections import deque
+        from concurrent.futures.process import BrokenProcessPool
+        
+        pool = _pdf_render_pool()
+        pending = deque()
+        try:
+            for start in range(0, page_count, PDF_RENDER_TASK_PAGES):
+                pages = range(start, min(start + PDF_RENDER_TASK_PAGES, page_count))
+                pending.append(pool.submit(
+                    _render_pdf_pages, input_path, pages, zoom, target_format,
+                    base_name, jpg_quality, backend
+                ))
+                # Write the oldest range once the window is full; later ones keep rendering
+                if len(pending) >= PDF_RENDER_WINDOW:
+                    for filename, data in pending.popleft().result():
+                        zipf.writestr(filename, data)
+            
+            while pending:
+                for filename, data in pending.popleft().result():
+                    zipf.writestr(filename, data)
+        except BrokenProcessPool:
+            _discard_pdf_render_pool(pool)
+            raise
+        finally:
+            # Don't leave the rest of a failed PDF queued on the shared pool
+            for future in pending:
+                future.cancel()
+    
     def _docx_to_pdf(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert DOCX to PDF using python-docx and reportlab"""
         print(f"Starting DOCX to PDF conversion: {input_path} -> {output_path}")
@@ -344,10 +862,8 @@ class DocumentConverter(BaseConverter):
             from reportlab.pdfgen import canvas
             from reportlab.lib.pagesizes import letter, A4
             from reportlab.lib.units import inch
-            from reportlab.lib.styles import getSampleStyleSheet
             from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
             from reportlab.lib import colors
-            import io
             
             # Read DOCX document
             doc = docx.Document(input_path)
@@ -362,39 +878,38 @@ class DocumentConverter(BaseConverter):
                 bottomMargin=18
             )
             
-            # Get styles
-            styles = getSampleStyleSheet()
+            # Look up the styles once, outside the paragraph loop
+            styles = _pdf_styles()
+            normal_style = styles['Normal']
+            heading3_style = styles['Heading3']
+            # "Heading 1" and "Heading 2" map by their level number; other levels use Heading3
+            heading_styles = {'1': styles['Heading1'], '2': styles['Heading2']}
             story = []
             
             # Process each paragraph in the DOCX
             for paragraph in doc.paragraphs:
-                if paragraph.text.strip():  # Skip empty paragraphs
+                text = paragraph.text
+                if text.strip():  # Skip empty paragraphs
                     # Determine style based on paragraph formatting
-                    if paragraph.style.name.startswith('Heading'):
-                        # Use heading style
-                        if '1' in paragraph.style.name:
-                            style = styles['Heading1']
-                        elif '2' in paragraph.style.name:
-                            style = styles['Heading2']
-                        else:
-                            style = styles['Heading3']
+                    style_name = paragraph.style.name
+                    if style_name.startswith('Heading'):
+                        style = heading_styles.get(style_name[7:].strip(), heading3_style)
                     else:
-                        # Use normal style
-                        style = styles['Normal']
+                        style = normal_style
                     
-                    # Create paragraph with text
-                    para = Paragraph(paragraph.text, style)
+                    # Create paragraph with text (escaped, Paragraph parses markup)
+                    para = Paragraph(html.escape(text, quote=False), style)
                     story.append(para)
                     story.append(Spacer(1, 12))  # Add space between paragraphs
             
             # Handle tables if present
             for table in doc.tables:
                 # Add table content as text (simple approach)
-                story.append(Paragraph("--- Table Content ---", styles['Heading3']))
+                story.append(Paragraph("--- Table Content ---", heading3_style))
                 for row in table.rows:
                     row_text = " | ".join([cell.text for cell in row.cells])
                     if row_text.strip():
-                        para = Paragraph(row_text, styles['Normal'])
+                        para = Paragraph(html.escape(row_text, quote=False), normal_style)
                         story.append(para)
                         story.append(Spacer(1, 6))
                 story.append(Spacer(1, 12))
@@ -475,26 +990,19 @@ class DocumentConverter(BaseConverter):
             filename = Path(input_path).stem
             doc.add_heading(f'Document: {filename}', 0)
             
-            # Split content into paragraphs
-            paragraphs = content.split('\n')
-            
-            for para_text in paragraphs:
-                if para_text.strip():
-                    # Check if it looks like a heading (all caps, short, etc.)
-                    if (len(para_text.strip()) < 50 and 
-                        para_text.strip().isupper() and 
-                        not para_text.strip().endswith('.')):
-                        doc.add_heading(para_text.strip(), level=1)
-                    else:
-                        doc.add_paragraph(para_text)
+            paragraph_count = 0
+            for kind, text in _classify_paragraphs(content):
+                paragraph_count += 1
+                if kind == 'heading':
+                    doc.add_heading(text, level=1)
                 else:
-                    # Add empty paragraph for spacing
-                    doc.add_paragraph('')
+                    # Blank lines become empty paragraphs for spacing
+                    doc.add_paragraph(text)
             
             # Save DOCX document
             doc.save(output_path)
             
-            print(f"Successfully converted TXT to DOCX: {len(paragraphs)} paragraphs")
+            print(f"Successfully converted TXT to DOCX: {paragraph_count} paragraphs")
             return True
             
         except Exception as e:
@@ -510,63 +1018,59 @@ class DocumentConverter(BaseConverter):
             return False
             
         try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.styles import getSampleStyleSheet
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.units import inch
-            
             # Read text file
             with open(input_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Create PDF document
-            pdf_doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
-            
-            # Get styles
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Add title
-            filename = Path(input_path).stem
-            title = Paragraph(f"Text Document: {filename}", styles['Title'])
-            story.append(title)
-            story.append(Spacer(1, 20))
-            
-            # Split content into paragraphs
-            paragraphs = content.split('\n')
-            
-            for para_text in paragraphs:
-                if para_text.strip():
-                    # Check if it looks like a heading
-                    if (len(para_text.strip()) < 50 and 
-                        para_text.strip().isupper() and 
-                        not para_text.strip().endswith('.')):
-                        para = Paragraph(para_text.strip(), styles['Heading1'])
-                    else:
-                        para = Paragraph(para_text, styles['Normal'])
-                    story.append(para)
-                    story.append(Spacer(1, 12))
-                else:
-                    story.append(Spacer(1, 12))
-            
-            # Build PDF
-            pdf_doc.build(story)
+            paragraph_count = self._build_text_pdf(content, output_path, Path(input_path).stem)
             
-            print(f"Successfully converted TXT to PDF: {len(paragraphs)} paragraphs")
+            print(f"Successfully converted TXT to PDF: {paragraph_count} paragraphs")
             return True
             
         except Exception as e:
             print(f"TXT to PDF conversion failed: {e}")
             return False
     
+    def _build_text_pdf(self, content: str, output_path: str, filename: str) -> int:
+        """Lay out plain text as a PDF document and return the paragraph count"""
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
+        # Create PDF document
+        pdf_doc = SimpleDocTemplate(
+            output_path,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18
+        )
+        
+        # Get styles
+        styles = _pdf_styles()
+        heading_style = styles['Heading1']
+        normal_style = styles['Normal']
+        story = []
+        
+        # Add title
+        title = Paragraph(f"Text Document: {filename}", styles['Title'])
+        story.append(title)
+        story.append(Spacer(1, 20))
+        
+        paragraph_count = 0
+        for kind, text in _classify_paragraphs(content):
+            paragraph_count += 1
+            # Paragraph parses its text as markup, so escape it first
+            if kind == 'heading':
+                story.append(Paragraph(html.escape(text, quote=False), heading_style))
+            elif kind == 'paragraph':
+                story.append(Paragraph(html.escape(text, quote=False), normal_style))
+            story.append(Spacer(1, 12))
+        
+        # Build PDF
+        pdf_doc.build(story)
+        return paragraph_count
+    
     def _txt_to_html(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert plain text to HTML"""
         print(f"Starting TXT to HTML conversion: {input_path} -> {output_path}")
@@ -579,8 +1083,9 @@ class DocumentConverter(BaseConverter):
             # Get filename for title
             filename = Path(input_path).stem
             
-            # Create HTML content
-            html_content = f"""<!DOCTYPE html>
+            # Stream the page straight to the output file rather than building one big string
+            with open(output_path, 'w', encoding='utf-8') as out:
+                out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -622,35 +1127,26 @@ class DocumentConverter(BaseConverter):
 <body>
     <div class="container">
         <h1>Text Document: {filename}</h1>
-"""
-            
-            # Process content
-            paragraphs = content.split('\n')
-            
-            for para_text in paragraphs:
-                if para_text.strip():
-                    # Check if it looks like a heading
-                    if (len(para_text.strip()) < 50 and 
-                        para_text.strip().isupper() and 
-                        not para_text.strip().endswith('.')):
-                        html_content += f"        <h2>{para_text.strip()}</h2>\n"
+""")
+                
+                # Process content
+                paragraph_count = 0
+                for kind, text in _classify_paragraphs(content):
+                    paragraph_count += 1
+                    if kind == 'heading':
+                        out.write(f"        <h2>{html.escape(text, quote=False)}</h2>\n")
+                    elif kind == 'paragraph':
+                        # Escape HTML characters
+                        out.write(f"        <p>{html.escape(text, quote=False)}</p>\n")
                     else:
-                        # Escape HTML characters and preserve line breaks
-                        escaped_text = para_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        html_content += f"        <p>{escaped_text}</p>\n"
-                else:
-                    html_content += '        <div class="empty-line"></div>\n'
-            
-            # Close HTML
-            html_content += """    </div>
+                        out.write('        <div class="empty-line"></div>\n')
+                
+                # Close HTML
+                out.write("""    </div>
 </body>
-</html>"""
+</html>""")
             
-            # Write HTML file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            print(f"Successfully converted TXT to HTML: {len(paragraphs)} paragraphs")
+            print(f"Successfully converted TXT to HTML: {paragraph_count} paragraphs")
             return True
             
         except Exception as e:
@@ -662,60 +1158,11 @@ class DocumentConverter(BaseConverter):
         print(f"Starting HTML to TXT conversion: {input_path} -> {output_path}")
         
         try:
-            # Try to use BeautifulSoup if available, otherwise use simple parsing
-            try:
-                from bs4 import BeautifulSoup
-                
-                # Read HTML file
-                with open(input_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Parse HTML
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Extract text content
-                text_content = soup.get_text()
-                
-                # Clean up extra whitespace
-                lines = [line.strip() for line in text_content.split('\n')]
-                cleaned_lines = []
-                
-                for line in lines:
-                    if line:
-                        cleaned_lines.append(line)
-                    elif cleaned_lines and cleaned_lines[-1]:  # Add empty line only if previous line had content
-                        cleaned_lines.append('')
-                
-                text_content = '\n'.join(cleaned_lines)
-                
-            except ImportError:
-                print("BeautifulSoup not available, using simple HTML parsing")
-                
-                # Simple HTML parsing without BeautifulSoup
-                with open(input_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Remove HTML tags using simple regex
-                import re
-                
-                # Remove script and style elements
-                html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-                html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-                
-                # Remove HTML tags
-                text_content = re.sub(r'<[^>]+>', '', html_content)
-                
-                # Decode HTML entities
-                text_content = text_content.replace('&amp;', '&')
-                text_content = text_content.replace('&lt;', '<')
-                text_content = text_content.replace('&gt;', '>')
-                text_content = text_content.replace('&quot;', '"')
-                text_content = text_content.replace('&#39;', "'")
-                text_content = text_content.replace('&nbsp;', ' ')
-                
-                # Clean up whitespace
-                lines = [line.strip() for line in text_content.split('\n')]
-                text_content = '\n'.join(line for line in lines if line)
+            # Read HTML file
+            with open(input_path, 'r', encoding='utf-8') as f:
+                html_content = f.read()
+            
+            text_content = self._extract_html_text(html_content)
             
             # Write text file
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -728,39 +1175,78 @@ class DocumentConverter(BaseConverter):
             print(f"HTML to TXT conversion failed: {e}")
             return False
     
+    def _extract_html_text(self, html_content: str) -> str:
+        """Extract readable text from an HTML document"""
+        # Prefer the fastest parser available: selectolax, then BeautifulSoup
+        # with lxml, then BeautifulSoup's pure-Python html.parser
+        if _SELECTOLAX_OK or _BS4_OK:
+            if _SELECTOLAX_OK:
+                tree = SelectolaxHTMLParser(html_content)
+                tree.strip_tags(['script', 'style'])
+                text_content = tree.text()
+            else:
+                soup = BeautifulSoup(html_content, 'lxml' if _LXML_OK else 'html.parser')
+                text_content = soup.get_text()
+            
+            # Clean up extra whitespace - strip lines and keep at most one blank line between blocks
+            text_content = '\n'.join(line.strip() for line in text_content.split('\n'))
+            return _BLANK_LINES_RE.sub('\n\n', text_content).strip('\n')
+        
+        print("BeautifulSoup not available, using simple HTML parsing")
+        
+        # Remove script and style elements
+        html_content = _SCRIPT_RE.sub('', html_content)
+        html_content = _STYLE_RE.sub('', html_content)
+        
+        # Remove HTML tags
+        text_content = _TAG_RE.sub('', html_content)
+        
+        # Decode HTML entities in a single pass (non-breaking spaces become plain spaces)
+        text_content = html.unescape(text_content).replace('\xa0', ' ')
+        
+        # Clean up whitespace
+        lines = [line.strip() for line in text_content.split('\n')]
+        return '\n'.join(line for line in lines if line)
+    
     def _html_to_pdf(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert HTML to PDF"""
         print(f"Starting HTML to PDF conversion: {input_path} -> {output_path}")
         
+        # Render the HTML itself in a single pass when a renderer is installed,
+        # keeping its styling and layout
+        if self.available_libs['xhtml2pdf']:
+            try:
+                with open(input_path, 'rb') as src, open(output_path, 'wb') as dest:
+                    result = pisa.CreatePDF(src, dest=dest, encoding='utf-8')
+                if not result.err:
+                    print("Successfully converted HTML to PDF with xhtml2pdf")
+                    return True
+                print(f"xhtml2pdf reported {result.err} errors, falling back")
+            except Exception as e:
+                print(f"xhtml2pdf conversion failed, falling back: {e}")
+        
+        if self.available_libs['weasyprint']:
+            try:
+                weasyprint.HTML(filename=input_path).write_pdf(output_path)
+                print("Successfully converted HTML to PDF with WeasyPrint")
+                return True
+            except Exception as e:
+                print(f"WeasyPrint conversion failed, falling back: {e}")
+        
         if not self.available_libs['reportlab']:
             print("reportlab not available for PDF creation")
             return False
             
         try:
-            # First convert HTML to text, then text to PDF
-            import tempfile
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as temp_file:
-                temp_txt_path = temp_file.name
-            
-            # Convert HTML to text first
-            if not self._html_to_txt(input_path, temp_txt_path):
-                return False
-            
-            # Then convert text to PDF
-            result = self._txt_to_pdf(temp_txt_path, output_path, **kwargs)
-            
-            # Cleanup temp file
-            import os
-            try:
-                os.unlink(temp_txt_path)
-            except:
-                pass
+            # Extract the text in memory and lay it out as a PDF directly
+            with open(input_path, 'r', encoding='utf-8') as f:
+                html_content = f.read()
             
-            if result:
-                print(f"Successfully converted HTML to PDF via text conversion")
+            text_content = self._extract_html_text(html_content)
+            self._build_text_pdf(text_content, output_path, Path(input_path).stem)
             
-            return result
+            print(f"Successfully converted HTML to PDF via text conversion")
+            return True
             
         except Exception as e:
             print(f"HTML to PDF conversion failed: {e}")
@@ -770,7 +1256,7 @@ class DocumentConverter(BaseConverter):
         formats = {'input': [], 'output': []}
         
         # PDF conversions
-        if self.available_libs['pymupdf']:
+        if self.available_libs['pymupdf'] or self.available_libs['pdfium']:
             formats['input'].extend(['pdf'])
             formats['output'].extend(['txt', 'jpg', 'jpeg', 'png'])
         if self.available_libs['pdf2docx']:
@@ -798,21 +1284,169 @@ class DocumentConverter(BaseConverter):
         
         return formats
 
+# LZMA2 preset for 7z output; py7zr defaults to 7, which encodes much slower
+SEVENZIP_PRESET = 5
+
+# Sheets whose compressed XML is at least this big are inflated on a background thread
+XLSX_READ_AHEAD_MIN_BYTES = 4 * 1024 * 1024
+
+class _ReadAheadStream(io.RawIOBase):
+    """Read-only stream that pulls chunks from src on a background thread.
+
+    zlib releases the GIL while inflating, so wrapping a ZipFile member lets
+    decompression of the next chunks overlap with parsing of the current one.
+    """
+    
+    def __init__(self, src, chunk_size: int = COPY_BUFFER_SIZE, depth: int = 4):
+        super().__init__()
+        self._src = src
+        self._chunks = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._current = memoryview(b'')
+        self._thread = threading.Thread(target=self._fill, args=(chunk_size,), daemon=True)
+        self._thread.start()
+    
+    def _fill(self, chunk_size: int) -> None:
+        while not self._stop.is_set():
+            try:
+                chunk = self._src.read(chunk_size)
+            except Exception as e:
+                chunk = e
+            # Time out periodically so close() can stop a producer blocked on a full queue
+            while not self._stop.is_set():
+                try:
+                    self._chunks.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if not isinstance(chunk, bytes) or not chunk:
+                return
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        if not self._current:
+            chunk = self._chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                self._chunks.put(chunk)  # Keep EOF visible to later reads
+                return 0
+            self._current = memoryview(chunk)
+        n = min(len(b), len(self._current))
+        b[:n] = self._current[:n]
+        self._current = self._current[n:]
+        return n
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._src.close()
+        super().close()
+
+# Bytes of FFmpeg's stderr kept for error messages
+FFMPEG_ERROR_TAIL_BYTES = 4096
+
 class MediaConverter(BaseConverter):
     """Handle video/audio conversions using FFmpeg"""
     
+    VIDEO_EXTS = frozenset({'mp4', 'avi', 'mov', 'mkv', 'wmv', 'flv', 'webm'})
+    # Containers that get a hardware H.264 encode when acceleration is available
+    HW_VIDEO_OUTPUTS = frozenset({'mp4', 'avi', 'mov', 'mkv'})
+    VAAPI_DEVICE = '/dev/dri/renderD128'
+    # -hwaccel method -> (H.264 encoder, input args keeping frames on the GPU, quality flag)
+    HW_BACKENDS = {
+        'cuda': ('h264_nvenc', ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'], '-cq'),
+        'qsv': ('h264_qsv', ['-hwaccel', 'qsv', '-hwaccel_output_format', 'qsv'], '-global_quality'),
+        'vaapi': ('h264_vaapi', ['-hwaccel', 'vaapi', '-vaapi_device', VAAPI_DEVICE,
+                                 '-hwaccel_output_format', 'vaapi'], '-qp'),
+        'videotoolbox': ('h264_videotoolbox', ['-hwaccel', 'videotoolbox'], '-q:v'),
+    }
+    
     def __init__(self):
         self.available = self._check_ffmpeg()
+        self.hwaccel = self._detect_hwaccel() if self.available else None
     
     def _check_ffmpeg(self) -> bool:
         try:
             subprocess.run(['ffmpeg', '-version'], 
-                         capture_output=True, check=True)
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             print("FFmpeg not found. Install FFmpeg for media conversion.")
             return False
     
+    def _detect_hwaccel(self) -> Optional[str]:
+        """Pick a hardware acceleration method both FFmpeg and this machine support.
+
+        FFMPEG_HWACCEL can force a method (cuda, qsv, vaapi, videotoolbox) or
+        disable acceleration with 'none'; the default 'auto' probes in that order.
+        """
+        requested = os.environ.get('FFMPEG_HWACCEL', 'auto').lower()
+        if requested == 'none':
+            return None
+        
+        try:
+            hwaccels = subprocess.run(['ffmpeg', '-hide_banner', '-hwaccels'],
+                                      capture_output=True, text=True, check=True).stdout
+            encoders = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                      capture_output=True, text=True, check=True).stdout
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        
+        # First line is the "Hardware acceleration methods:" header
+        methods = set(hwaccels.split()[3:])
+        encoder_names = {line.split()[1] for line in encoders.splitlines() if len(line.split()) > 1}
+        
+        candidates = list(self.HW_BACKENDS) if requested == 'auto' else [requested]
+        for method in candidates:
+            if method not in self.HW_BACKENDS or method not in methods:
+                continue
+            if self.HW_BACKENDS[method][0] not in encoder_names:
+                continue
+            # FFmpeg builds list methods even without the hardware, so check for the device
+            if requested == 'auto' and not self._hw_device_present(method):
+                continue
+            print(f"FFmpeg hardware acceleration: {method}")
+            return method
+        return None
+    
+    def _hw_device_present(self, method: str) -> bool:
+        if method == 'cuda':
+            return os.path.exists('/dev/nvidia0')
+        if method in ('vaapi', 'qsv'):
+            return os.path.exists(self.VAAPI_DEVICE)
+        if method == 'videotoolbox':
+            import sys
+            return sys.platform == 'darwin'
+        return False
+    
+    def _hw_command(self, input_path: str, **kwargs) -> List[str]:
+        """FFmpeg arguments (without output) for a hardware decode + encode"""
+        encoder, input_args, quality_flag = self.HW_BACKENDS[self.hwaccel]
+        cmd = ['ffmpeg', *input_args, '-i', input_path, '-c:v', encoder]
+        if 'quality' in kwargs:
+            cmd.extend([quality_flag, str(kwargs['quality'])])
+        if 'bitrate' in kwargs:
+            cmd.extend(['-b:v', kwargs['bitrate']])
+        if 'audio_bitrate' in kwargs:
+            cmd.extend(['-b:a', kwargs['audio_bitrate']])
+        return cmd
+    
+    def _run_ffmpeg(self, cmd: List[str]) -> Tuple[bool, str]:
+        """Run an FFmpeg command; returns (success, tail of stderr).
+
+        Progress output is switched off and stderr kept as bytes, so only the
+        last few KiB are decoded, and only when reporting a failure.
+        """
+        cmd = [cmd[0], '-hide_banner', '-nostats', '-loglevel', 'error', *cmd[1:]]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode == 0:
+            return True, ''
+        return False, result.stderr[-FFMPEG_ERROR_TAIL_BYTES:].decode('utf-8', errors='replace')
+    
     def convert(self, input_path: str, output_path: str, **kwargs) -> bool:
         if not self.available:
             return False
@@ -824,6 +1458,7 @@ class MediaConverter(BaseConverter):
         
         try:
             cmd = ['ffmpeg', '-i', input_path]
+            hw_cmd = None
             
             # Special handling for different conversion types
             if input_ext == 'gif' and output_ext in ['mp4', 'avi', 'mov', 'mkv', 'webm']:
@@ -837,44 +1472,17 @@ class MediaConverter(BaseConverter):
                     
             elif output_ext == 'gif':
                 # Video to GIF conversion
-                # Use palette generation for better quality
+                # Generate the palette and apply it in one pass so the source is decoded once
                 if input_ext in ['mp4', 'avi', 'mov', 'mkv', 'webm']:
-                    # Two-pass conversion for better GIF quality
-                    palette_path = output_path.replace('.gif', '_palette.png')
-                    
-                    # First pass: generate palette
-                    palette_cmd = ['ffmpeg', '-i', input_path, '-vf', 'palettegen', '-y', palette_path]
-                    palette_result = subprocess.run(palette_cmd, capture_output=True, text=True)
-                    
-                    if palette_result.returncode == 0:
-                        # Second pass: create GIF with palette
-                        fps = kwargs.get('fps', 10)  # Default 10 fps for video to GIF
-                        scale = kwargs.get('scale', '320:-1')  # Default scale
-                        cmd = ['ffmpeg', '-i', input_path, '-i', palette_path]
-                        cmd.extend(['-filter_complex', f'fps={fps},scale={scale}:flags=lanczos[x];[x][1:v]paletteuse'])
-                        cmd.extend(['-y', output_path])
-                        
-                        result = subprocess.run(cmd, capture_output=True, text=True)
-                        
-                        # Cleanup palette file
-                        try:
-                            os.remove(palette_path)
-                        except:
-                            pass
-                        
-                        if result.returncode == 0:
-                            print(f"Successfully converted {input_ext} to GIF with palette optimization")
-                            return True
-                    
-                    # Fallback to simple conversion if palette method fails
-                    print("Palette method failed, using simple GIF conversion")
-                    cmd = ['ffmpeg', '-i', input_path]
-                    fps = kwargs.get('fps', 10)
-                    scale = kwargs.get('scale', '320:-1')
-                    cmd.extend(['-vf', f'fps={fps},scale={scale}:flags=lanczos'])
+                    fps = kwargs.get('fps', 10)  # Default 10 fps for video to GIF
+                    scale = kwargs.get('scale', '320:-1')  # Default scale
+                    cmd.extend(['-filter_complex',
+                                f'fps={fps},scale={scale}:flags=lanczos,split[a][b];[a]palettegen[p];[b][p]paletteuse'])
                     
             else:
                 # Standard video/audio conversion
+                if self.hwaccel and input_ext in self.VIDEO_EXTS and output_ext in self.HW_VIDEO_OUTPUTS:
+                    hw_cmd = self._hw_command(input_path, **kwargs)
                 if 'quality' in kwargs:
                     cmd.extend(['-crf', str(kwargs['quality'])])
                 if 'bitrate' in kwargs:
@@ -884,14 +1492,22 @@ class MediaConverter(BaseConverter):
             
             cmd.extend(['-y', output_path])  # -y to overwrite
             
+            if hw_cmd:
+                # Decode and encode on the GPU; fall back to the software command on failure
+                ok, error = self._run_ffmpeg(hw_cmd + ['-y', output_path])
+                if ok:
+                    print(f"Media conversion successful ({self.hwaccel}): {input_ext} -> {output_ext}")
+                    return True
+                print(f"Hardware conversion failed, retrying in software: {error}")
+            
             print(f"Running FFmpeg command: {' '.join(cmd[:5])}... (truncated)")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            ok, error = self._run_ffmpeg(cmd)
             
-            if result.returncode == 0:
+            if ok:
                 print(f"Media conversion successful: {input_ext} -> {output_ext}")
                 return True
             else:
-                print(f"FFmpeg error: {result.stderr}")
+                print(f"FFmpeg error: {error}")
                 return False
             
         except Exception as e:
@@ -909,6 +1525,8 @@ class MediaConverter(BaseConverter):
 class ArchiveConverter(BaseConverter):
     """Handle archive conversions using various archive libraries"""
     
+    TAR_FORMATS = frozenset({'tar', 'gz', 'tgz'})
+    
     def __init__(self):
         self.available_libs = {}
         
@@ -945,38 +1563,67 @@ class ArchiveConverter(BaseConverter):
         output_ext = Path(output_path).suffix.lower().lstrip('.')
         
         try:
-            # Extract input archive
-            temp_dir = Path("temp_extract")
-            temp_dir.mkdir(exist_ok=True)
+            if self._convert_direct(input_path, output_path, input_ext, output_ext):
+                return True
             
-            if not self._extract_archive(input_path, input_ext, temp_dir):
+            temp_dir = self._extract_to_temp(input_path, input_ext)
+            if temp_dir is None:
                 return False
-            
-            # Create output archive
-            success = self._create_archive(temp_dir, output_path, output_ext)
-            
-            # Cleanup
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            
-            return success
+            try:
+                return self._create_archive(temp_dir, output_path, output_ext)
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
             
         except Exception as e:
             print(f"Archive conversion failed: {e}")
             return False
     
+    def _convert_direct(self, input_path: str, output_path: str, input_ext: str, output_ext: str) -> bool:
+        """Handle conversions that need no extraction; returns False if the pair isn't one"""
+        # Same format: the archive is already what was asked for
+        if input_ext == output_ext:
+            shutil.copyfile(input_path, output_path)
+            return True
+        
+        # Tar family: move entries across without a round trip through a temp directory
+        if (input_ext in self.TAR_FORMATS and output_ext in ('tar', 'gz')
+                and self.available_libs['tarfile']):
+            self._repack_tar(input_path, input_ext, output_path, output_ext)
+            return True
+        
+        # ZIP <-> tar family: stream each member from the reader into the writer
+        if self.available_libs['zipfile'] and self.available_libs['tarfile']:
+            if input_ext == 'zip' and output_ext in ('tar', 'gz'):
+                self._zip_to_tar(input_path, output_path, output_ext)
+                return True
+            if input_ext in self.TAR_FORMATS and output_ext == 'zip':
+                self._tar_to_zip(input_path, input_ext, output_path)
+                return True
+        
+        return False
+    
+    def _extract_to_temp(self, input_path: str, input_ext: str) -> Optional[Path]:
+        """Extract an archive into a fresh temp directory, or return None on failure"""
+        import tempfile
+        # A private directory per call, so concurrent conversions don't mix files
+        temp_dir = Path(tempfile.mkdtemp(prefix='filealchemy_extract_'))
+        if self._extract_archive(input_path, input_ext, temp_dir):
+            return temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return None
+    
     def _extract_archive(self, archive_path: str, format_type: str, extract_to: Path) -> bool:
         """Extract archive to temporary directory"""
         try:
             if format_type == 'zip' and self.available_libs['zipfile']:
                 import zipfile
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_to)
+                    members = zip_ref.infolist()
+                self._extract_zip(archive_path, members, extract_to)
                 return True
                 
-            elif format_type in ['tar', 'gz', 'tgz'] and self.available_libs['tarfile']:
-                import tarfile
-                with tarfile.open(archive_path, 'r:*') as tar_ref:
+            elif format_type in self.TAR_FORMATS and self.available_libs['tarfile']:
+                with self._open_tar_reader(archive_path, format_type) as tar_ref:
                     tar_ref.extractall(extract_to)
                 return True
                 
@@ -988,8 +1635,10 @@ class ArchiveConverter(BaseConverter):
                 
             elif format_type == 'rar' and self.available_libs['rarfile']:
                 import rarfile
+                extract_root = os.path.realpath(extract_to)
                 with rarfile.RarFile(archive_path) as rf:
-                    rf.extractall(extract_to)
+                    files = _make_member_dirs(rf.infolist(), extract_root)
+                    _copy_members(rf, files, extract_root)
                 return True
                 
             return False
@@ -997,32 +1646,222 @@ class ArchiveConverter(BaseConverter):
             print(f"Failed to extract {format_type}: {e}")
             return False
     
+    def _extract_zip(self, archive_path: str, members: list, extract_to: Path) -> None:
+        """Extract a ZIP, inflating members concurrently when there are many.
+
+        Each entry is an independent DEFLATE stream, so they can be decoded in parallel.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from itertools import repeat
+        
+        extract_root = os.path.realpath(extract_to)
+        # Create every directory up front so workers only write files
+        files = _make_member_dirs(members, extract_root)
+        
+        if len(files) < ZIP_PARALLEL_MIN_MEMBERS:
+            _extract_zip_members(archive_path, files, extract_root)
+            return
+        
+        num_workers = min(os.cpu_count() or 1, len(files)) or 1
+        # Strided groups spread large and small members across workers
+        groups = [files[start::num_workers] for start in range(num_workers)]
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            # list() re-raises any worker exception here
+            list(executor.map(_extract_zip_members, repeat(archive_path), groups, repeat(extract_root)))
+    
+    @contextlib.contextmanager
+    def _open_tar_reader(self, archive_path: str, format_type: str) -> Iterator[Any]:
+        """Yield a TarFile reading the archive, inflating .tar.gz with ISA-L or pigz when available"""
+        import tarfile
+        
+        if format_type in ('gz', 'tgz') and _ISAL_OK:
+            with igzip_threaded.open(archive_path, 'rb') as gz, \
+                    tarfile.open(fileobj=gz, mode='r|') as tar_ref:
+                yield tar_ref
+            return
+        
+        if format_type in ('gz', 'tgz') and _PIGZ_PATH:
+            proc = subprocess.Popen([_PIGZ_PATH, '-dc', archive_path], stdout=subprocess.PIPE)
+            try:
+                with tarfile.open(fileobj=proc.stdout, mode='r|') as tar_ref:
+                    yield tar_ref
+            finally:
+                proc.stdout.close()
+                returncode = proc.wait()
+            if returncode != 0:
+                raise RuntimeError(f"pigz exited with status {returncode}")
+            return
+        
+        with tarfile.open(archive_path, 'r:*') as tar_ref:
+            yield tar_ref
+    
+    def _open_tar_writer(self, output_path: str, format_type: str):
+        """Return a context manager yielding a TarFile writing a .tar or .tar.gz"""
+        import tarfile
+        if format_type == 'gz' and (_ISAL_OK or _PIGZ_PATH):
+            return self._open_tar_gz_writer(output_path)
+        return tarfile.open(output_path, 'w:gz' if format_type == 'gz' else 'w')
+    
+    @contextlib.contextmanager
+    def _open_tar_gz_writer(self, output_path: str) -> Iterator[Any]:
+        """Yield a TarFile writing .tar.gz, compressing on every core with ISA-L or pigz"""
+        import tarfile
+        threads = os.cpu_count() or 1
+        
+        if _ISAL_OK:
+            with igzip_threaded.open(output_path, 'wb', compresslevel=ISAL_COMPRESS_LEVEL, threads=threads) as gz, \
+                    tarfile.open(fileobj=gz, mode='w|') as tar:
+                yield tar
+            return
+        
+        with open(output_path, 'wb') as out:
+            proc = subprocess.Popen([_PIGZ_PATH, '-p', str(threads), f'-{GZIP_COMPRESS_LEVEL}'],
+                                    stdin=subprocess.PIPE, stdout=out)
+            try:
+                with tarfile.open(fileobj=proc.stdin, mode='w|') as tar:
+                    yield tar
+            finally:
+                proc.stdin.close()
+                returncode = proc.wait()
+        if returncode != 0:
+            raise RuntimeError(f"pigz exited with status {returncode}")
+    
+    def _repack_tar(self, input_path: str, input_ext: str, output_path: str, output_ext: str) -> None:
+        """Copy tar entries straight into a tar/tar.gz without extracting them to disk"""
+        with self._open_tar_reader(input_path, input_ext) as tar_in, \
+                self._open_tar_writer(output_path, output_ext) as tar_out:
+            for member in tar_in:
+                tar_out.addfile(member, tar_in.extractfile(member) if member.isreg() else None)
+    
+    def _zip_to_tar(self, input_path: str, output_path: str, output_ext: str) -> None:
+        """Stream ZIP file members into a tar/tar.gz without extracting them to disk"""
+        import tarfile
+        import time
+        import zipfile
+        
+        with zipfile.ZipFile(input_path, 'r') as zip_ref, \
+                self._open_tar_writer(output_path, output_ext) as tar_out:
+            for member in zip_ref.infolist():
+                tinfo = tarfile.TarInfo(member.filename.rstrip('/'))
+                tinfo.mtime = int(time.mktime(member.date_time + (0, 0, -1)))
+                unix_mode = member.external_attr >> 16
+                mode = stat.S_IMODE(unix_mode)
+                
+                if member.is_dir():
+                    # Keep directory entries so empty directories survive
+                    tinfo.type = tarfile.DIRTYPE
+                    tinfo.mode = mode or 0o755
+                    tar_out.addfile(tinfo)
+                elif stat.S_ISLNK(unix_mode):
+                    # Unix zip tools store a symlink's target as the member's data
+                    tinfo.type = tarfile.SYMTYPE
+                    tinfo.linkname = zip_ref.read(member).decode('utf-8')
+                    tinfo.mode = mode or 0o777
+                    tar_out.addfile(tinfo)
+                else:
+                    tinfo.size = member.file_size
+                    tinfo.mode = mode or 0o644
+                    with zip_ref.open(member) as src:
+                        tar_out.addfile(tinfo, src)
+    
+    def _tar_to_zip(self, input_path: str, input_ext: str, output_path: str) -> None:
+        """Stream tar file members into a ZIP, deflating them on the worker pool"""
+        import zipfile
+        
+        with self._open_tar_reader(input_path, input_ext) as tar_in, \
+                zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                                compresslevel=ZIP_COMPRESS_LEVEL) as zipf:
+            self._write_zip_parallel(zipf, self._tar_zip_members(tar_in, zipf))
+    
+    def _tar_zip_members(self, tar_in, zipf) -> Iterator[Tuple[Any, bytes]]:
+        """Yield (ZipInfo, data) for the tar's regular files.
+
+        Files too big to hold in memory are streamed into zipf here instead.
+        """
+        import time
+        import zipfile
+        
+        for member in tar_in:
+            if not member.isreg():
+                continue
+            name = member.name
+            while name.startswith('./'):
+                name = name[2:]
+            # ZIP timestamps can't predate 1980
+            date_time = max(time.localtime(member.mtime)[:6], (1980, 1, 1, 0, 0, 0))
+            zinfo = zipfile.ZipInfo(name.lstrip('/'), date_time=date_time)
+            zinfo.external_attr = (stat.S_IFREG | stat.S_IMODE(member.mode)) << 16
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            zinfo.file_size = member.size  # Lets zipf.open() decide on ZIP64 up front
+            
+            with tar_in.extractfile(member) as src:
+                if member.size > ZIP_PRECOMPRESS_MAX_BYTES:
+                    with zipf.open(zinfo, 'w') as dst:
+                        _copy_stream(src, dst)
+                    continue
+                data = src.read()
+            yield zinfo, data
+    
+    def _zip_file_members(self, zipf, files: list) -> Iterator[Tuple[Any, str]]:
+        """Yield (ZipInfo, path) for files on disk; big files are written to zipf here instead"""
+        import zipfile
+        for entry, arcname in files:
+            if entry.stat().st_size > ZIP_PRECOMPRESS_MAX_BYTES:
+                zipf.write(entry.path, arcname)
+                continue
+            yield zipfile.ZipInfo.from_file(entry.path, arcname), entry.path
+    
+    def _write_zip_parallel(self, zipf, members: Iterator[Tuple[Any, Any]]) -> None:
+        """Deflate (ZipInfo, bytes-or-path) members on a thread pool and append them to zipf in order.
+
+        The members iterator may write large entries to zipf itself; that happens
+        on this thread between appends while the workers keep compressing.
+        """
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        
+        num_workers = os.cpu_count() or 1
+        # Bound how many compressed files wait in memory for the writer
+        max_pending = num_workers * 4
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for zinfo, source in members:
+                pending.append((zinfo, executor.submit(_deflate_member, source)))
+                if len(pending) >= max_pending:
+                    zinfo, future = pending.popleft()
+                    _write_deflated_member(zipf, zinfo, future.result())
+            
+            while pending:
+                zinfo, future = pending.popleft()
+                _write_deflated_member(zipf, zinfo, future.result())
+    
     def _create_archive(self, source_dir: Path, output_path: str, format_type: str) -> bool:
         """Create archive from directory"""
         try:
             if format_type == 'zip' and self.available_libs['zipfile']:
                 import zipfile
-                with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in source_dir.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(source_dir)
-                            zipf.write(file_path, arcname)
+                files = list(_walk_files(str(source_dir)))
+                with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                                     compresslevel=ZIP_COMPRESS_LEVEL) as zipf:
+                    if len(files) >= ZIP_PARALLEL_MIN_MEMBERS:
+                        self._write_zip_parallel(zipf, self._zip_file_members(zipf, files))
+                    else:
+                        for entry, arcname in files:
+                            zipf.write(entry.path, arcname)
                 return True
                 
             elif format_type in ['tar', 'gz'] and self.available_libs['tarfile']:
-                import tarfile
-                mode = 'w:gz' if format_type == 'gz' else 'w'
-                with tarfile.open(output_path, mode) as tar:
+                with self._open_tar_writer(output_path, format_type) as tar:
                     tar.add(source_dir, arcname='.')
                 return True
                 
             elif format_type == '7z' and self.available_libs['py7zr']:
                 import py7zr
-                with py7zr.SevenZipFile(output_path, 'w') as archive:
-                    for file_path in source_dir.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(source_dir)
-                            archive.write(file_path, arcname)
+                filters = [{'id': py7zr.FILTER_LZMA2, 'preset': SEVENZIP_PRESET}]
+                with py7zr.SevenZipFile(output_path, 'w', filters=filters) as archive:
+                    for entry, arcname in _walk_files(str(source_dir)):
+                        archive.write(entry.path, arcname)
                 return True
                 
             return False
@@ -1052,6 +1891,30 @@ class ArchiveConverter(BaseConverter):
             
         return formats
 
+# Bytes of CSV each pyarrow parser thread handles at a time
+CSV_BLOCK_SIZE = 8 * 1024 * 1024
+# Rows per chunk when streaming CSV to JSON
+CSV_JSON_CHUNK_ROWS = 50_000
+# First-chunk column types that become nullable, so blanks in later chunks still fit
+_CSV_JSON_NULLABLE_DTYPES = {'int64': 'Int64', 'bool': 'boolean'}
+
+# orjson encodes straight to UTF-8 bytes several times faster than the json module
+try:
+    import orjson
+    
+    def _dump_json(obj) -> bytes:
+        # csv.DictReader files extra fields under a None key, which json writes as "null"
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _load_json = orjson.loads
+except ImportError:
+    import json
+    
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    
+    _load_json = json.loads
+
 class DataConverter(BaseConverter):
     """Handle data file conversions (CSV, XLSX, JSON, etc.)"""
     
@@ -1072,50 +1935,61 @@ class DataConverter(BaseConverter):
         except ImportError:
             self.available_libs['openpyxl'] = False
             
+        # Check for python-calamine (Rust XLSX reader, pandas >= 2.2)
+        self.available_libs['calamine'] = importlib.util.find_spec('python_calamine') is not None
+            
+        # Check for pyarrow (multithreaded CSV parser)
+        self.available_libs['pyarrow'] = importlib.util.find_spec('pyarrow') is not None
+            
         # Check for reportlab (for PDF creation)
         try:
             from reportlab.pdfgen import canvas
             self.available_libs['reportlab'] = True
         except ImportError:
             self.available_libs['reportlab'] = False
+        
+        # Library availability doesn't change after this point
+        self._formats = self._compute_formats()
+    
+    # JSON/XML to TXT and XML to JSON have no implementation yet, so they are left out
+    _DISPATCH = {
+        ('.csv', '.xlsx'): '_csv_to_xlsx',
+        ('.csv', '.pdf'): '_csv_to_pdf',
+        ('.csv', '.txt'): '_csv_to_txt',
+        ('.csv', '.json'): '_csv_to_json',
+        ('.xlsx', '.csv'): '_xlsx_to_csv',
+        ('.xlsx', '.pdf'): '_xlsx_to_pdf',
+        ('.xlsx', '.txt'): '_xlsx_to_txt',
+        ('.json', '.csv'): '_json_to_csv',
+        ('.json', '.xlsx'): '_json_to_xlsx',
+    }
     
     def convert(self, input_path: str, output_path: str, **kwargs) -> bool:
-        input_ext = Path(input_path).suffix.lower()
-        output_ext = Path(output_path).suffix.lower()
-        
-        # CSV conversions
-        if input_ext == '.csv' and output_ext == '.xlsx':
-            return self._csv_to_xlsx(input_path, output_path, **kwargs)
-        elif input_ext == '.csv' and output_ext == '.pdf':
-            return self._csv_to_pdf(input_path, output_path, **kwargs)
-        elif input_ext == '.csv' and output_ext == '.txt':
-            return self._csv_to_txt(input_path, output_path, **kwargs)
-        elif input_ext == '.csv' and output_ext == '.json':
-            return self._csv_to_json(input_path, output_path, **kwargs)
-        
-        # XLSX conversions
-        elif input_ext == '.xlsx' and output_ext == '.csv':
-            return self._xlsx_to_csv(input_path, output_path, **kwargs)
-        elif input_ext == '.xlsx' and output_ext == '.pdf':
-            return self._xlsx_to_pdf(input_path, output_path, **kwargs)
-        elif input_ext == '.xlsx' and output_ext == '.txt':
-            return self._xlsx_to_txt(input_path, output_path, **kwargs)
-        
-        # JSON conversions
-        elif input_ext == '.json' and output_ext == '.csv':
-            return self._json_to_csv(input_path, output_path, **kwargs)
-        elif input_ext == '.json' and output_ext == '.xlsx':
-            return self._json_to_xlsx(input_path, output_path, **kwargs)
-        elif input_ext == '.json' and output_ext == '.txt':
-            return self._json_to_txt(input_path, output_path, **kwargs)
-        
-        # XML conversions (basic support)
-        elif input_ext == '.xml' and output_ext == '.json':
-            return self._xml_to_json(input_path, output_path, **kwargs)
-        elif input_ext == '.xml' and output_ext == '.txt':
-            return self._xml_to_txt(input_path, output_path, **kwargs)
+        input_ext = os.path.splitext(input_path)[1].lower()
+        output_ext = os.path.splitext(output_path)[1].lower()
         
-        return False
+        handler = self._DISPATCH.get((input_ext, output_ext))
+        if handler is None:
+            return False
+        return getattr(self, handler)(input_path, output_path, **kwargs)
+    
+    def _read_csv(self, input_path: str):
+        """Load a CSV into a DataFrame, using pyarrow's multithreaded parser when installed"""
+        import pandas as pd
+        
+        if self.available_libs['pyarrow']:
+            import pyarrow.csv as pa_csv
+            try:
+                table = pa_csv.read_csv(
+                    input_path,
+                    read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+                )
+                # Release Arrow buffers as columns are converted to keep peak memory down
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+            except Exception as e:
+                print(f"pyarrow CSV parse failed, falling back to pandas: {e}")
+        
+        return pd.read_csv(input_path, encoding='utf-8')
     
     def _csv_to_xlsx(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert CSV to Excel (XLSX)"""
@@ -1126,14 +2000,9 @@ class DataConverter(BaseConverter):
             return False
             
         try:
-            import pandas as pd
-            
             # Read CSV file
-            df = pd.read_csv(input_path, encoding='utf-8')
-            
-            # Write to Excel
-            with pd.ExcelWriter(output_path, engine='openpyxl' if self.available_libs['openpyxl'] else 'xlsxwriter') as writer:
-                df.to_excel(writer, sheet_name='Sheet1', index=False)
+            df = self._read_csv(input_path)
+            self._df_to_xlsx(df, output_path)
             
             print(f"Successfully converted CSV to XLSX: {len(df)} rows, {len(df.columns)} columns")
             return True
@@ -1142,6 +2011,12 @@ class DataConverter(BaseConverter):
             print(f"CSV to XLSX conversion failed: {e}")
             return False
     
+    def _df_to_xlsx(self, df, output_path: str) -> None:
+        """Write a DataFrame to a single-sheet Excel workbook"""
+        import pandas as pd
+        with pd.ExcelWriter(output_path, engine='openpyxl' if self.available_libs['openpyxl'] else 'xlsxwriter') as writer:
+            df.to_excel(writer, sheet_name='Sheet1', index=False)
+    
     def _csv_to_pdf(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert CSV to PDF table"""
         print(f"Starting CSV to PDF conversion: {input_path} -> {output_path}")
@@ -1155,84 +2030,9 @@ class DataConverter(BaseConverter):
             return False
             
         try:
-            import pandas as pd
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet
-            from reportlab.lib import colors
-            from reportlab.lib.units import inch
-            
             # Read CSV file
-            df = pd.read_csv(input_path, encoding='utf-8')
-            
-            # Create PDF document
-            pdf_doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
-                rightMargin=30,
-                leftMargin=30,
-                topMargin=30,
-                bottomMargin=18
-            )
-            
-            # Get styles
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Add title
-            filename = Path(input_path).stem
-            title = Paragraph(f"Data Table: {filename}", styles['Title'])
-            story.append(title)
-            story.append(Spacer(1, 20))
-            
-            # Prepare table data
-            # Convert DataFrame to list of lists for ReportLab
-            table_data = []
-            
-            # Add headers
-            headers = list(df.columns)
-            table_data.append(headers)
-            
-            # Add data rows (limit to prevent huge PDFs)
-            max_rows = kwargs.get('max_rows', 100)  # Default limit
-            for i, row in df.iterrows():
-                if i >= max_rows:
-                    break
-                # Convert all values to strings and handle NaN
-                row_data = [str(val) if pd.notna(val) else '' for val in row.values]
-                table_data.append(row_data)
-            
-            # Create table
-            table = Table(table_data)
-            
-            # Style the table
-            table.setStyle(TableStyle([
-                # Header styling
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                
-                # Data styling
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                
-                # Alternating row colors
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
-            ]))
-            
-            story.append(table)
-            
-            # Add summary info
-            if len(df) > max_rows:
-                story.append(Spacer(1, 20))
-                summary = Paragraph(f"Note: Showing first {max_rows} rows of {len(df)} total rows", styles['Normal'])
-                story.append(summary)
-            
-            # Build PDF
-            pdf_doc.build(story)
+            df = self._read_csv(input_path)
+            self._df_to_pdf(df, output_path, Path(input_path).stem, **kwargs)
             
             print(f"Successfully converted CSV to PDF: {len(df)} rows, {len(df.columns)} columns")
             return True
@@ -1243,6 +2043,77 @@ class DataConverter(BaseConverter):
             traceback.print_exc()
             return False
     
+    def _df_to_pdf(self, df, output_path: str, title: str, **kwargs) -> None:
+        """Render a DataFrame as a PDF table"""
+        from reportlab.lib.pagesizes import letter, A4
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+        from reportlab.lib import colors
+        from reportlab.lib.units import inch
+        
+        # Create PDF document
+        pdf_doc = SimpleDocTemplate(
+            output_path,
+            pagesize=A4,
+            rightMargin=30,
+            leftMargin=30,
+            topMargin=30,
+            bottomMargin=18
+        )
+        
+        # Get styles
+        styles = _pdf_styles()
+        story = []
+        
+        # Add title
+        story.append(Paragraph(f"Data Table: {title}", styles['Title']))
+        story.append(Spacer(1, 20))
+        
+        # Prepare table data
+        # Convert DataFrame to list of lists for ReportLab
+        table_data = []
+        
+        # Add headers
+        headers = list(df.columns)
+        table_data.append(headers)
+        
+        # Add data rows (limit to prevent huge PDFs)
+        max_rows = kwargs.get('max_rows', 100)  # Default limit
+        # Convert all values to strings and handle NaN in one vectorized pass
+        table_data.extend(df.head(max_rows).fillna('').astype(str).values.tolist())
+        
+        # Create table
+        table = Table(table_data)
+        
+        # Style the table
+        table.setStyle(TableStyle([
+            # Header styling
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            
+            # Data styling
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            
+            # Alternating row colors
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
+        ]))
+        
+        story.append(table)
+        
+        # Add summary info
+        if len(df) > max_rows:
+            story.append(Spacer(1, 20))
+            summary = Paragraph(f"Note: Showing first {max_rows} rows of {len(df)} total rows", styles['Normal'])
+            story.append(summary)
+        
+        # Build PDF
+        pdf_doc.build(story)
+        
+    
     def _csv_to_txt(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert CSV to formatted text"""
         print(f"Starting CSV to TXT conversion: {input_path} -> {output_path}")
@@ -1267,22 +2138,9 @@ class DataConverter(BaseConverter):
                 return False
         
         try:
-            import pandas as pd
-            
             # Read CSV file
-            df = pd.read_csv(input_path, encoding='utf-8')
-            
-            # Convert to formatted text
-            with open(output_path, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write("Data Table: " + Path(input_path).stem + "\n")
-                f.write("=" * 50 + "\n\n")
-                
-                # Write data in a readable format
-                f.write(df.to_string(index=False))
-                
-                # Write summary
-                f.write(f"\n\nSummary: {len(df)} rows, {len(df.columns)} columns")
+            df = self._read_csv(input_path)
+            self._df_to_txt(df, output_path, Path(input_path).stem)
             
             print(f"Successfully converted CSV to TXT: {len(df)} rows, {len(df.columns)} columns")
             return True
@@ -1291,26 +2149,39 @@ class DataConverter(BaseConverter):
             print(f"CSV to TXT conversion failed: {e}")
             return False
     
+    def _df_to_txt(self, df, output_path: str, title: str) -> None:
+        """Write a DataFrame as a readable text table"""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            # Write header
+            f.write("Data Table: " + title + "\n")
+            f.write("=" * 50 + "\n\n")
+            
+            # Tab-separated rows, streamed by pandas' CSV writer instead of
+            # building one padded string for the whole table
+            df.to_csv(f, sep='\t', index=False, lineterminator='\n')
+            
+            # Write summary
+            f.write(f"\nSummary: {len(df)} rows, {len(df.columns)} columns")
+    
     def _csv_to_json(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert CSV to JSON"""
         print(f"Starting CSV to JSON conversion: {input_path} -> {output_path}")
         
         if not self.available_libs['pandas']:
-            # Fallback to basic CSV/JSON
+            # Fallback to basic CSV/JSON, written one row at a time
             try:
                 import csv
-                import json
-                
-                data = []
-                with open(input_path, 'r', encoding='utf-8') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    for row in reader:
-                        data.append(row)
                 
-                with open(output_path, 'w', encoding='utf-8') as jsonfile:
-                    json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+                count = 0
+                with open(input_path, 'r', newline='', encoding='utf-8') as csvfile, \
+                        open(output_path, 'wb') as jsonfile:
+                    jsonfile.write(b'[')
+                    for count, row in enumerate(csv.DictReader(csvfile), 1):
+                        jsonfile.write(b',\n  ' if count > 1 else b'\n  ')
+                        jsonfile.write(_dump_json(row))
+                    jsonfile.write(b'\n]\n' if count else b']\n')
                 
-                print(f"Successfully converted CSV to JSON: {len(data)} records")
+                print(f"Successfully converted CSV to JSON: {count} records")
                 return True
                 
             except Exception as e:
@@ -1320,33 +2191,128 @@ class DataConverter(BaseConverter):
         try:
             import pandas as pd
             
-            # Read CSV file
-            df = pd.read_csv(input_path, encoding='utf-8')
-            
-            # Convert to JSON
-            df.to_json(output_path, orient='records', indent=2, force_ascii=False)
-            
-            print(f"Successfully converted CSV to JSON: {len(df)} records")
+            try:
+                count = self._write_csv_json_chunks(input_path, output_path)
+            except (ValueError, TypeError) as e:
+                # A later chunk doesn't fit the column types of the first one
+                print(f"Column types change after the first {CSV_JSON_CHUNK_ROWS} rows ({e}), converting in one pass")
+                df = pd.read_csv(input_path, encoding='utf-8')
+                df.to_json(output_path, orient='records', indent=2, force_ascii=False)
+                count = len(df)
+            
+            print(f"Successfully converted CSV to JSON: {count} records")
             return True
             
         except Exception as e:
             print(f"CSV to JSON conversion failed: {e}")
             return False
     
+    def _write_csv_json_chunks(self, input_path: str, output_path: str) -> int:
+        """Write a CSV as an indented JSON array of records, one chunk of rows at a time.
+
+        Column types come from the first chunk and are applied to every later
+        one, so a column renders the same way throughout the file. Returns the
+        number of records written.
+        """
+        from itertools import chain
+        import pandas as pd
+        
+        first = pd.read_csv(input_path, encoding='utf-8', nrows=CSV_JSON_CHUNK_ROWS)
+        dtypes = {column: _CSV_JSON_NULLABLE_DTYPES.get(str(dtype), dtype)
+                  for column, dtype in first.dtypes.items()}
+        
+        count = 0
+        with open(output_path, 'w', encoding='utf-8') as jsonfile:
+            jsonfile.write('[')
+            chunks = [first.astype(dtypes)]
+            if len(first) == CSV_JSON_CHUNK_ROWS:
+                chunks = chain(chunks, pd.read_csv(
+                    input_path, encoding='utf-8', dtype=dtypes, chunksize=CSV_JSON_CHUNK_ROWS,
+                    skiprows=range(1, CSV_JSON_CHUNK_ROWS + 1)
+                ))
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+                # Each chunk renders as "[<records>\n]"; keep the records and stitch them together
+                records = chunk.to_json(orient='records', indent=2, force_ascii=False)
+                if count:
+                    jsonfile.write(',')
+                jsonfile.write(records[1:-1].rstrip('\n'))
+                count += len(chunk)
+            # Same layout as DataFrame.to_json(indent=2), including an empty array
+            jsonfile.write('\n]' if count else '\n\n]')
+        
+        return count
+    
+    def _read_excel(self, input_path: str, sheet_name=0):
+        """Load a worksheet into a DataFrame, with calamine when installed"""
+        import pandas as pd
+        
+        if self.available_libs['calamine']:
+            try:
+                return pd.read_excel(input_path, sheet_name=sheet_name, engine='calamine')
+            except (ValueError, ImportError) as e:
+                # Older pandas without the calamine engine
+                print(f"calamine engine unavailable, falling back to openpyxl: {e}")
+        
+        return pd.read_excel(input_path, sheet_name=sheet_name)
+    
+    def _read_ahead_sheet(self, wb, ws) -> None:
+        """Have a large read-only worksheet inflated on a background thread while openpyxl parses it"""
+        try:
+            if wb._archive.getinfo(ws._worksheet_path).compress_size < XLSX_READ_AHEAD_MIN_BYTES:
+                return
+            # openpyxl opens the sheet XML through this hook each time it iterates rows
+            open_sheet = ws._get_source
+            ws._get_source = lambda: _ReadAheadStream(open_sheet())
+        except (AttributeError, KeyError):
+            # Internals of a different openpyxl version; just read the sheet normally
+            pass
+    
     def _xlsx_to_csv(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert Excel (XLSX) to CSV"""
         print(f"Starting XLSX to CSV conversion: {input_path} -> {output_path}")
         
+        sheet_name = kwargs.get('sheet_name', 0)  # Default to first sheet
+        
+        # Without calamine, stream rows straight from openpyxl's read-only mode
+        # instead of loading the whole workbook model through pandas
+        if self.available_libs['openpyxl'] and not self.available_libs['calamine']:
+            try:
+                import csv
+                import openpyxl
+                
+                wb = openpyxl.load_workbook(input_path, read_only=True, data_only=True)
+                try:
+                    ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+                    # The stored dimensions can be missing or stale; read to the real end
+                    ws.reset_dimensions()
+                    self._read_ahead_sheet(wb, ws)
+                    rows = 0
+                    columns = 0
+                    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+                        writer = csv.writer(csvfile)
+                        for row in ws.iter_rows(values_only=True):
+                            writer.writerow(row)
+                            rows += 1
+                            columns = max(columns, len(row))
+                finally:
+                    wb.close()
+                
+                print(f"Successfully converted XLSX to CSV: {max(rows - 1, 0)} rows, {columns} columns")
+                return True
+                
+            except Exception as e:
+                print(f"XLSX to CSV conversion failed: {e}")
+                return False
+        
         if not self.available_libs['pandas']:
             print("pandas not available for XLSX processing")
             return False
             
         try:
-            import pandas as pd
-            
-            # Read Excel file (first sheet by default)
-            sheet_name = kwargs.get('sheet_name', 0)  # Default to first sheet
-            df = pd.read_excel(input_path, sheet_name=sheet_name)
+            # Read Excel file
+            df = self._read_excel(input_path, sheet_name)
             
             # Write to CSV
             df.to_csv(output_path, index=False, encoding='utf-8')
@@ -1362,57 +2328,39 @@ class DataConverter(BaseConverter):
         """Convert Excel (XLSX) to PDF"""
         print(f"Starting XLSX to PDF conversion: {input_path} -> {output_path}")
         
-        # First convert to CSV, then CSV to PDF
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
-            temp_csv_path = temp_file.name
+        if not self.available_libs['pandas'] or not self.available_libs['reportlab']:
+            print("pandas and reportlab are required for XLSX to PDF conversion")
+            return False
         
         try:
-            # Convert XLSX to CSV first
-            if not self._xlsx_to_csv(input_path, temp_csv_path, **kwargs):
-                return False
-            
-            # Then convert CSV to PDF
-            result = self._csv_to_pdf(temp_csv_path, output_path, **kwargs)
+            df = self._read_excel(input_path, kwargs.get('sheet_name', 0))
+            self._df_to_pdf(df, output_path, Path(input_path).stem, **kwargs)
             
-            return result
+            print(f"Successfully converted XLSX to PDF: {len(df)} rows, {len(df.columns)} columns")
+            return True
             
-        finally:
-            # Cleanup temp file
-            import os
-            try:
-                os.unlink(temp_csv_path)
-            except:
-                pass
+        except Exception as e:
+            print(f"XLSX to PDF conversion failed: {e}")
+            return False
     
     def _xlsx_to_txt(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert Excel (XLSX) to text"""
         print(f"Starting XLSX to TXT conversion: {input_path} -> {output_path}")
         
-        # First convert to CSV, then CSV to TXT
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
-            temp_csv_path = temp_file.name
+        if not self.available_libs['pandas']:
+            print("pandas not available for XLSX processing")
+            return False
         
         try:
-            # Convert XLSX to CSV first
-            if not self._xlsx_to_csv(input_path, temp_csv_path, **kwargs):
-                return False
-            
-            # Then convert CSV to TXT
-            result = self._csv_to_txt(temp_csv_path, output_path, **kwargs)
+            df = self._read_excel(input_path, kwargs.get('sheet_name', 0))
+            self._df_to_txt(df, output_path, Path(input_path).stem)
             
-            return result
+            print(f"Successfully converted XLSX to TXT: {len(df)} rows, {len(df.columns)} columns")
+            return True
             
-        finally:
-            # Cleanup temp file
-            import os
-            try:
-                os.unlink(temp_csv_path)
-            except:
-                pass
+        except Exception as e:
+            print(f"XLSX to TXT conversion failed: {e}")
+            return False
     
     def _json_to_csv(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert JSON to CSV"""
@@ -1421,11 +2369,10 @@ class DataConverter(BaseConverter):
         if not self.available_libs['pandas']:
             # Fallback to basic JSON/CSV
             try:
-                import json
                 import csv
                 
-                with open(input_path, 'r', encoding='utf-8') as jsonfile:
-                    data = json.load(jsonfile)
+                with open(input_path, 'rb') as jsonfile:
+                    data = _load_json(jsonfile.read())
                 
                 # Handle different JSON structures
                 if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
@@ -1467,31 +2414,27 @@ class DataConverter(BaseConverter):
         """Convert JSON to Excel (XLSX)"""
         print(f"Starting JSON to XLSX conversion: {input_path} -> {output_path}")
         
-        # First convert to CSV, then CSV to XLSX
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
-            temp_csv_path = temp_file.name
+        if not self.available_libs['pandas']:
+            print("pandas not available for JSON processing")
+            return False
         
         try:
-            # Convert JSON to CSV first
-            if not self._json_to_csv(input_path, temp_csv_path, **kwargs):
-                return False
+            import pandas as pd
             
-            # Then convert CSV to XLSX
-            result = self._csv_to_xlsx(temp_csv_path, output_path, **kwargs)
+            df = pd.read_json(input_path)
+            self._df_to_xlsx(df, output_path)
             
-            return result
+            print(f"Successfully converted JSON to XLSX: {len(df)} rows, {len(df.columns)} columns")
+            return True
             
-        finally:
-            # Cleanup temp file
-            import os
-            try:
-                os.unlink(temp_csv_path)
-            except:
-                pass
+        except Exception as e:
+            print(f"JSON to XLSX conversion failed: {e}")
+            return False
     
     def supported_formats(self) -> Dict[str, List[str]]:
+        return self._formats
+    
+    def _compute_formats(self) -> Dict[str, List[str]]:
         formats = {'input': [], 'output': []}
         
         if self.available_libs['pandas']:
@@ -1511,9 +2454,9 @@ class DataConverter(BaseConverter):
         if self.available_libs['pandas']:
             formats['output'].extend(['csv'])
         
-        # Remove duplicates
-        formats['input'] = list(set(formats['input']))
-        formats['output'] = list(set(formats['output']))
+        # Remove duplicates, keeping a stable order
+        formats['input'] = list(dict.fromkeys(formats['input']))
+        formats['output'] = list(dict.fromkeys(formats['output']))
         
         return formats
 
@@ -1528,73 +2471,82 @@ class FileConversionService:
             'archive': ArchiveConverter(),
             'data': DataConverter()
         }
+        
+        # Library availability is fixed after __init__, so the format tables
+        # are computed once and every lookup is a dict/set probe
+        self._formats_cache = {name: conv.supported_formats()
+                               for name, conv in self.converters.items()}
+        self._all_inputs = frozenset(ext for formats in self._formats_cache.values()
+                                     for ext in formats['input'])
+        self._all_outputs = frozenset(ext for formats in self._formats_cache.values()
+                                      for ext in formats['output'])
+        self._dispatch: Dict[Tuple[str, str], str] = {}
+        for name, formats in self._formats_cache.items():
+            for input_ext in formats['input']:
+                for output_ext in formats['output']:
+                    # First converter in registration order wins, as before
+                    self._dispatch.setdefault((input_ext, output_ext), name)
+        # PDF to image conversion (output will be ZIP, but we check for image format);
+        # DocumentConverter handles PDF to images
+        for image_ext in ('jpg', 'jpeg', 'png'):
+            self._dispatch[('pdf', image_ext)] = 'document'
     
     def convert_file(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert a file based on its extension"""
         try:
-            input_ext = Path(input_path).suffix.lower().lstrip('.')
-            output_ext = Path(output_path).suffix.lower().lstrip('.')
+            input_ext = os.path.splitext(input_path)[1].lower().lstrip('.')
+            output_ext = os.path.splitext(output_path)[1].lower().lstrip('.')
             
             # Special case: PDF to image conversion where output file is .zip but target format is image
             target_format = kwargs.get('target_format')
             if input_ext == 'pdf' and output_ext == 'zip' and target_format:
                 actual_target_ext = target_format.lower()
-                print(f"PDF to image conversion detected: {input_ext} -> {actual_target_ext} (packaged as ZIP)")
+                log.debug("PDF to image conversion detected: %s -> %s (packaged as ZIP)", input_ext, actual_target_ext)
                 output_ext = actual_target_ext  # Use the actual target format for converter selection
             
-            print(f"Converting: {input_ext} -> {output_ext}")
-            print(f"Input file: {input_path}")
-            print(f"Output file: {output_path}")
+            log.info("Converting: %s -> %s", input_ext, output_ext)
+            log.debug("Input file: %s", input_path)
+            log.debug("Output file: %s", output_path)
             
-            # Check if input file exists
-            if not os.path.exists(input_path):
-                print(f"Error: Input file does not exist: {input_path}")
+            # Check the input file exists and get its size in one stat
+            try:
+                file_size = os.stat(input_path).st_size
+            except FileNotFoundError:
+                log.error("Input file does not exist: %s", input_path)
                 return False
-            
-            # Check file size
-            file_size = os.path.getsize(input_path)
-            print(f"Input file size: {file_size} bytes")
+            log.debug("Input file size: %d bytes", file_size)
             
             # Determine converter type
             converter_type = self._get_converter_type(input_ext, output_ext)
             if not converter_type:
-                print(f"No converter found for {input_ext} -> {output_ext}")
+                log.warning("No converter found for %s -> %s", input_ext, output_ext)
                 return False
             
-            print(f"Using converter: {converter_type}")
+            log.debug("Using converter: %s", converter_type)
             converter = self.converters[converter_type]
             
             # Perform conversion
             result = converter.convert(input_path, output_path, **kwargs)
-            print(f"Conversion result: {result}")
+            log.debug("Conversion result: %s", result)
             
             # Check if output file was created
-            if result and os.path.exists(output_path):
-                output_size = os.path.getsize(output_path)
-                print(f"Output file created successfully, size: {output_size} bytes")
-            elif result:
-                print("Warning: Conversion reported success but output file not found")
-                return False
+            if result:
+                try:
+                    output_size = os.stat(output_path).st_size
+                except FileNotFoundError:
+                    log.warning("Conversion reported success but output file not found: %s", output_path)
+                    return False
+                log.debug("Output file created successfully, size: %d bytes", output_size)
             
             return result
             
         except Exception as e:
-            print(f"Error in convert_file: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in convert_file: %s", e)
             return False
     
     def _get_converter_type(self, input_ext: str, output_ext: str) -> Optional[str]:
         """Determine which converter to use based on file extensions"""
-        # Special case: PDF to image conversion (output will be ZIP, but we check for image format)
-        if input_ext == 'pdf' and output_ext in ['jpg', 'jpeg', 'png']:
-            return 'document'  # DocumentConverter handles PDF to images
-        
-        for conv_type, converter in self.converters.items():
-            formats = converter.supported_formats()
-            if input_ext in formats['input'] and output_ext in formats['output']:
-                return conv_type
-        return None
+        return self._dispatch.get((input_ext, output_ext))
     
     def is_conversion_supported(self, input_ext: str, output_ext: str) -> tuple[bool, str]:
         """Check if a conversion is supported and return reason if not"""
@@ -1611,27 +2563,16 @@ class FileConversionService:
             return True, "Conversion supported"
         
         # Check if input format is supported at all
-        input_supported = False
-        output_supported = False
-        
-        for conv_type, converter in self.converters.items():
-            formats = converter.supported_formats()
-            if input_ext in formats['input']:
-                input_supported = True
-            if output_ext in formats['output']:
-                output_supported = True
-        
-        if not input_supported:
+        if input_ext not in self._all_inputs:
             return False, f"Input format '{input_ext}' is not supported"
-        elif not output_supported:
+        elif output_ext not in self._all_outputs:
             return False, f"Output format '{output_ext}' is not supported"
         else:
             return False, f"Conversion from '{input_ext}' to '{output_ext}' is not supported"
     
     def list_supported_formats(self) -> Dict[str, Dict[str, List[str]]]:
         """List all supported formats by converter type"""
-        return {name: conv.supported_formats() 
-                for name, conv in self.converters.items()}
+        return dict(self._formats_cache)
 
 if __name__ == "__main__":
     # Example usage
@@ -1642,9 +2583,28 @@ if __name__ == "__main__":
     for conv_type, formats in service.list_supported_formats().items():
         print(f"{conv_type}: {formats}")
 
+_worker_service: Optional[FileConversionService] = None
+
+
+def init_conversion_worker():
+    """Pool initializer: build one conversion service per worker process"""
+    global _worker_service
+    _worker_service = FileConversionService()
+
+
+def convert_in_worker(input_path: str, output_path: str, kwargs: Dict[str, Any]) -> bool:
+    """Convert a single file inside a worker started with init_conversion_worker"""
+    return _worker_service.convert_file(input_path, output_path, **kwargs)
+
+
 class BatchConverter:
     """Handle batch file conversions with parallel processing"""
     
+    # Converters whose work is mostly pure Python/C holding the GIL; these run
+    # in worker processes, while media/archive jobs wait on subprocesses and
+    # codecs that release it, so threads are enough
+    PROCESS_CONVERTERS = frozenset({'image', 'document', 'data'})
+    
     def __init__(self, service: FileConversionService):
         self.service = service
     
@@ -1652,31 +2612,57 @@ class BatchConverter:
                          input_format: str, output_format: str, 
                          preserve_structure: bool = True) -> Dict[str, bool]:
         """Convert all files of input_format in directory to output_format"""
-        input_path = Path(input_dir)
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
         
-        results = {}
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
         
-        # Find all files with input format
-        pattern = f"**/*.{input_format}" if preserve_structure else f"*.{input_format}"
-        for file_path in input_path.glob(pattern):
-            if file_path.is_file():
-                # Calculate output path
-                relative_path = file_path.relative_to(input_path)
-                output_file = output_path / relative_path.with_suffix(f'.{output_format}')
-                
-                # Create output directory if needed
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Convert file
-                success = self.service.convert_file(str(file_path), str(output_file))
-                results[str(file_path)] = success
+        # Find all files with input format; walk fully before submitting work
+        jobs = []
+        created_dirs = {output_dir}
+        strip = len(input_format) + 1
+        for file_path, relative_path in _walk_format(input_dir, input_format, preserve_structure):
+            # Calculate output path
+            output_file = os.path.join(output_dir, relative_path[:-strip] + '.' + output_format)
+            
+            # Create output directory if needed, once per directory
+            output_parent = os.path.dirname(output_file)
+            if output_parent not in created_dirs:
+                os.makedirs(output_parent, exist_ok=True)
+                created_dirs.add(output_parent)
+            jobs.append((file_path, output_file))
+        
+        results = {}
+        if not jobs:
+            return results
+        
+        workers = min(len(jobs), os.cpu_count() or 1)
+        converter_type = self.service._get_converter_type(input_format.lower(), output_format.lower())
+        if converter_type in self.PROCESS_CONVERTERS and workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=init_conversion_worker)
+            submit = lambda in_s, out_s: executor.submit(convert_in_worker, in_s, out_s, {})
+        else:
+            # Converters hold no per-call state, so threads share one service
+            executor = ThreadPoolExecutor(max_workers=workers)
+            submit = lambda in_s, out_s: executor.submit(self.service.convert_file, in_s, out_s)
+        
+        with executor:
+            futures = {
+                submit(input_str, output_str): (input_str, output_str)
+                for input_str, output_str in jobs
+            }
+            for future in as_completed(futures):
+                input_str, output_str = futures[future]
+                try:
+                    success = future.result()
+                except Exception as e:
+                    log.error("Error converting %s: %s", input_str, e)
+                    success = False
+                results[input_str] = success
                 
                 if success:
-                    print(f"✓ Converted: {file_path} -> {output_file}")
+                    log.info("✓ Converted: %s -> %s", input_str, output_str)
                 else:
-                    print(f"✗ Failed: {file_path}")
+                    log.warning("✗ Failed: %s", input_str)
         
         return results
 
@@ -1695,6 +2681,9 @@ def main():
     
     args = parser.parse_args()
     
+    # The CLI shows per-file progress; the API server keeps it at WARNING
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     service = FileConversionService()
     
     if args.list_formats:
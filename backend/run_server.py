@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Start the FileAlchemy API server
+
+Conversion pool workers re-run the script the server was started from, so
+this one does nothing at import and only loads api_server when run directly.
+"""
+
+if __name__ == '__main__':
+    from api_server import main
+    main()
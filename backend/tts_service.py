@@ -5,6 +5,7 @@ Provides high-quality TTS functionality using Google Text-to-Speech (gTTS)
 """
 
 import os
+import subprocess
 import uuid
 import tempfile
 import threading
@@ -12,34 +13,178 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import io
+import re
+import base64
+
+# Resolved once at import so each request doesn't go through the import machinery
+try:
+    from gtts import gTTS
+    _GTTS_OK = True
+    _GTTS_IMPORT_ERROR = None
+except ImportError as e:
+    gTTS = None
+    _GTTS_OK = False
+    _GTTS_IMPORT_ERROR = str(e)
+
+try:
+    from pydub import AudioSegment
+    from pydub.effects import speedup
+except ImportError:
+    AudioSegment = None
+    speedup = None
+
+# gTTS splits long text into ~100 character parts and fetches them one by one;
+# we send a few at a time and reassemble them in order. This mirrors gTTS's
+# request building and response format, which is why requirements.txt caps
+# the gTTS version. Kept low so a long text doesn't draw 429s from Google.
+TTS_FETCH_WORKERS = 3
+_GTTS_AUDIO_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+# One pooled keep-alive session for every Google request, so health checks
+# and TTS calls skip the TCP/TLS handshake once a connection is warm
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    _HTTP = requests.Session()
+    _HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+except ImportError:
+    _HTTP = None
+
+
+def _fetch_gtts_part(prepared_request, timeout) -> bytes:
+    """Send one prepared gTTS request and decode its MP3 payload"""
+    import urllib.request
+    response = _HTTP.send(
+        prepared_request,
+        proxies=urllib.request.getproxies(),
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    
+    audio = bytearray()
+    for line in response.iter_lines(chunk_size=1024):
+        decoded_line = line.decode('utf-8')
+        if 'jQ1olc' in decoded_line:
+            audio_search = _GTTS_AUDIO_RE.search(decoded_line)
+            if not audio_search:
+                raise ValueError("No audio stream in Google TTS response")
+            audio += base64.b64decode(audio_search.group(1).encode('ascii'))
+    if not audio:
+        raise ValueError("Empty Google TTS response")
+    return bytes(audio)
+
+
+def _write_gtts_audio(tts, fp):
+    """Write the MP3 for a gTTS object to fp, fetching text parts in parallel.
+    
+    Parts that fail are retried one at a time; gTTS's own sequential writer
+    is only used when no part could be fetched this way.
+    """
+    try:
+        if _HTTP is None:
+            raise ImportError("requests is not installed")
+        prepared_requests = tts._prepare_requests()
+        if len(prepared_requests) == 1:
+            fp.write(_fetch_gtts_part(prepared_requests[0], tts.timeout))
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        workers = min(TTS_FETCH_WORKERS, len(prepared_requests))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_fetch_gtts_part, pr, tts.timeout) for pr in prepared_requests]
+        parts = [None if future.exception() else future.result() for future in futures]
+    except Exception as e:
+        print(f"⚠️  Parallel Google TTS fetch failed ({e}), retrying sequentially")
+        tts.write_to_fp(fp)
+        return
+    
+    if not any(parts):
+        print(f"⚠️  Parallel Google TTS fetch failed ({futures[0].exception()}), retrying sequentially")
+        tts.write_to_fp(fp)
+        return
+    
+    # Keep the parts that arrived and fetch only the missing ones again
+    for i, part in enumerate(parts):
+        if part is None:
+            print(f"⚠️  Google TTS part {i + 1} failed ({futures[i].exception()}), retrying")
+            part = _fetch_gtts_part(prepared_requests[i], tts.timeout)
+        fp.write(part)
+
+# Health checks probe Google over HTTPS; reuse the result for this many seconds
+TTS_HEALTH_TTL = float(os.environ.get('TTS_HEALTH_TTL', 30))
+
+# Google TLD -> human-readable region/accent name for voice labels
+_REGION_MAP = {
+    'com': 'US',
+    'co.uk': 'UK',
+    'com.au': 'Australia',
+    'ca': 'Canada',
+    'es': 'Spain',
+    'com.mx': 'Mexico',
+    'fr': 'France',
+    'de': 'Germany',
+    'it': 'Italy',
+    'pt': 'Portugal',
+    'com.br': 'Brazil',
+    'ru': 'Russia',
+    'co.jp': 'Japan',
+    'co.kr': 'Korea',
+    'co.in': 'India',
+    'nl': 'Netherlands',
+    'se': 'Sweden',
+    'dk': 'Denmark',
+    'no': 'Norway',
+    'fi': 'Finland',
+    'pl': 'Poland',
+    'com.tr': 'Turkey',
+    'co.th': 'Thailand'
+}
 
 class TTSService:
+    # Google TTS supports many languages; this is a curated list of the most popular ones
+    SUPPORTED_LANGUAGES = {
+        'en': {'name': 'English', 'tlds': ['com', 'co.uk', 'com.au', 'ca']},
+        'es': {'name': 'Spanish', 'tlds': ['es', 'com.mx']},
+        'fr': {'name': 'French', 'tlds': ['fr', 'ca']},
+        'de': {'name': 'German', 'tlds': ['de']},
+        'it': {'name': 'Italian', 'tlds': ['it']},
+        'pt': {'name': 'Portuguese', 'tlds': ['pt', 'com.br']},
+        'ru': {'name': 'Russian', 'tlds': ['ru']},
+        'ja': {'name': 'Japanese', 'tlds': ['co.jp']},
+        'ko': {'name': 'Korean', 'tlds': ['co.kr']},
+        'zh': {'name': 'Chinese', 'tlds': ['com']},
+        'hi': {'name': 'Hindi', 'tlds': ['co.in']},
+        'ar': {'name': 'Arabic', 'tlds': ['com']},
+        'nl': {'name': 'Dutch', 'tlds': ['nl']},
+        'sv': {'name': 'Swedish', 'tlds': ['se']},
+        'da': {'name': 'Danish', 'tlds': ['dk']},
+        'no': {'name': 'Norwegian', 'tlds': ['no']},
+        'fi': {'name': 'Finnish', 'tlds': ['fi']},
+        'pl': {'name': 'Polish', 'tlds': ['pl']},
+        'tr': {'name': 'Turkish', 'tlds': ['com.tr']},
+        'th': {'name': 'Thai', 'tlds': ['co.th']}
+    }
+    
     def __init__(self):
         self.available_voices = []
+        self._voices_by_id = {}
+        self._voices_by_index = {}
         self.is_initialized = False
         self.lock = threading.Lock()
+        self._health_cache = None
+        self._health_ts = 0.0
         self.supported_languages = {}
         self._initialize_service()
     
     def _initialize_service(self):
         """Initialize the Google TTS service"""
         try:
-            # Try to import gTTS
-            try:
-                from gtts import gTTS
-                self.gtts_available = True
+            # gTTS must be installed with the app (see requirements.txt)
+            self.gtts_available = _GTTS_OK
+            if self.gtts_available:
                 print("✅ Google TTS (gTTS) library available")
-            except ImportError:
-                print("⚠️  gTTS library not found, trying to install...")
-                try:
-                    import subprocess
-                    subprocess.check_call(['pip', 'install', 'gtts'])
-                    from gtts import gTTS
-                    self.gtts_available = True
-                    print("✅ Google TTS (gTTS) library installed and imported")
-                except Exception as install_error:
-                    print(f"❌ Failed to install gTTS: {install_error}")
-                    self.gtts_available = False
+            else:
+                print(f"⚠️  gTTS library not found: {_GTTS_IMPORT_ERROR}")
             
             if self.gtts_available:
                 # Initialize supported languages and voices
@@ -56,30 +201,7 @@ class TTSService:
     
     def _initialize_voices(self):
         """Initialize available Google TTS voices and languages"""
-        # Google TTS supports many languages with high-quality voices
-        # We'll provide a curated list of the most popular ones
-        self.supported_languages = {
-            'en': {'name': 'English', 'tlds': ['com', 'co.uk', 'com.au', 'ca']},
-            'es': {'name': 'Spanish', 'tlds': ['es', 'com.mx']},
-            'fr': {'name': 'French', 'tlds': ['fr', 'ca']},
-            'de': {'name': 'German', 'tlds': ['de']},
-            'it': {'name': 'Italian', 'tlds': ['it']},
-            'pt': {'name': 'Portuguese', 'tlds': ['pt', 'com.br']},
-            'ru': {'name': 'Russian', 'tlds': ['ru']},
-            'ja': {'name': 'Japanese', 'tlds': ['co.jp']},
-            'ko': {'name': 'Korean', 'tlds': ['co.kr']},
-            'zh': {'name': 'Chinese', 'tlds': ['com']},
-            'hi': {'name': 'Hindi', 'tlds': ['co.in']},
-            'ar': {'name': 'Arabic', 'tlds': ['com']},
-            'nl': {'name': 'Dutch', 'tlds': ['nl']},
-            'sv': {'name': 'Swedish', 'tlds': ['se']},
-            'da': {'name': 'Danish', 'tlds': ['dk']},
-            'no': {'name': 'Norwegian', 'tlds': ['no']},
-            'fi': {'name': 'Finnish', 'tlds': ['fi']},
-            'pl': {'name': 'Polish', 'tlds': ['pl']},
-            'tr': {'name': 'Turkish', 'tlds': ['com.tr']},
-            'th': {'name': 'Thai', 'tlds': ['co.th']}
-        }
+        self.supported_languages = self.SUPPORTED_LANGUAGES
         
         # Create voice entries for different accents/regions
         voices = []
@@ -118,6 +240,9 @@ class TTSService:
                 break
         
         self.available_voices = voices
+        # Voices can be requested by id or by list index
+        self._voices_by_id = {voice['id']: voice for voice in voices}
+        self._voices_by_index = {str(voice['index']): voice for voice in voices}
         
         # Log available voices
         for voice in voices[:5]:  # Show first 5
@@ -127,32 +252,11 @@ class TTSService:
     
     def _get_region_name(self, tld: str) -> str:
         """Get human-readable region name from TLD"""
-        region_map = {
-            'com': 'US',
-            'co.uk': 'UK',
-            'com.au': 'Australia',
-            'ca': 'Canada',
-            'es': 'Spain',
-            'com.mx': 'Mexico',
-            'fr': 'France',
-            'de': 'Germany',
-            'it': 'Italy',
-            'pt': 'Portugal',
-            'com.br': 'Brazil',
-            'ru': 'Russia',
-            'co.jp': 'Japan',
-            'co.kr': 'Korea',
-            'co.in': 'India',
-            'nl': 'Netherlands',
-            'se': 'Sweden',
-            'dk': 'Denmark',
-            'no': 'Norway',
-            'fi': 'Finland',
-            'pl': 'Poland',
-            'com.tr': 'Turkey',
-            'co.th': 'Thailand'
-        }
-        return region_map.get(tld, '')
+        return _REGION_MAP.get(tld, '')
+    
+    def _find_voice(self, voice_id) -> Optional[Dict]:
+        """Look up a voice by id or index"""
+        return self._voices_by_id.get(voice_id) or self._voices_by_index.get(str(voice_id))
     
     def get_voices(self) -> Dict:
         """Get available voices for API response"""
@@ -185,22 +289,13 @@ class TTSService:
             return False, "Google TTS service not initialized"
         
         try:
-            from gtts import gTTS
-            import pygame
-            from pydub import AudioSegment
-            from pydub.effects import speedup
-            
             # Parse voice_id to get language and TLD
             language = 'en'
             tld = 'com'
             
             if voice_id and voice_id != 'default':
                 # Find the voice in available voices
-                selected_voice = None
-                for voice in self.available_voices:
-                    if voice['id'] == voice_id or str(voice['index']) == str(voice_id):
-                        selected_voice = voice
-                        break
+                selected_voice = self._find_voice(voice_id)
                 
                 if selected_voice:
                     language = selected_voice['language']
@@ -221,68 +316,61 @@ class TTSService:
             # Create gTTS object
             tts = gTTS(text=text, lang=language, tld=tld, slow=False)
             
-            # Save to a temporary MP3 file first
-            temp_mp3 = output_path.replace('.wav', '_temp.mp3')
-            tts.save(temp_mp3)
-            print(f"✅ Google TTS generated MP3 file")
+            # Keep the MP3 in memory; it is only an intermediate for the WAV
+            mp3_buffer = io.BytesIO()
+            _write_gtts_audio(tts, mp3_buffer)
+            mp3_buffer.seek(0)
+            print(f"✅ Google TTS generated MP3 audio")
+            
+            # Work out rate/volume adjustments
+            speed_multiplier = 1.0
+            if rate and rate != 200:
+                # Calculate speed multiplier (200 WPM is baseline)
+                speed_multiplier = rate / 200.0
+                speed_multiplier = max(0.5, min(2.0, speed_multiplier))  # Limit to reasonable range
+            
+            volume_db = 0.0
+            if volume and volume != 0.9:
+                # Convert volume (0.0-1.0) to dB change
+                volume_db = 20 * (volume - 0.9)  # 0.9 is baseline
+                volume_db = max(-20, min(20, volume_db))  # Limit to reasonable range
             
-            # Convert MP3 to WAV and apply rate/volume adjustments
+            # Convert MP3 to WAV with ffmpeg's native atempo/volume filters
             try:
-                # Load the MP3 file
-                audio = AudioSegment.from_mp3(temp_mp3)
+                self._mp3_to_wav(mp3_buffer.getvalue(), output_path, speed_multiplier, volume_db)
+                if speed_multiplier != 1.0:
+                    print(f"🎛️  Applied speed adjustment: {speed_multiplier}x")
+                if abs(volume_db) > 0.1:
+                    print(f"🔊 Applied volume adjustment: {volume_db:.1f}dB")
+                print(f"✅ Converted to WAV format")
+                
+            except (subprocess.CalledProcessError, FileNotFoundError) as ffmpeg_error:
+                print(f"⚠️  ffmpeg conversion failed: {ffmpeg_error}")
+                if getattr(ffmpeg_error, 'stderr', None):
+                    print(ffmpeg_error.stderr.decode(errors='replace').strip())
+                print("🔄 Trying pydub...")
                 
-                # Apply rate adjustment (speed change)
-                if rate and rate != 200:
-                    # Calculate speed multiplier (200 WPM is baseline)
-                    speed_multiplier = rate / 200.0
-                    speed_multiplier = max(0.5, min(2.0, speed_multiplier))  # Limit to reasonable range
+                # Fallback: pydub (which can also use avconv)
+                try:
+                    if AudioSegment is None:
+                        raise ImportError("pydub is not installed")
                     
+                    audio = AudioSegment.from_file(mp3_buffer, format="mp3")
                     if speed_multiplier != 1.0:
                         audio = speedup(audio, playback_speed=speed_multiplier)
                         print(f"🎛️  Applied speed adjustment: {speed_multiplier}x")
-                
-                # Apply volume adjustment
-                if volume and volume != 0.9:
-                    # Convert volume (0.0-1.0) to dB change
-                    volume_db = 20 * (volume - 0.9)  # 0.9 is baseline
-                    volume_db = max(-20, min(20, volume_db))  # Limit to reasonable range
-                    
                     if abs(volume_db) > 0.1:
                         audio = audio + volume_db
                         print(f"🔊 Applied volume adjustment: {volume_db:.1f}dB")
-                
-                # Export as WAV
-                audio.export(output_path, format="wav")
-                print(f"✅ Converted to WAV format")
-                
-                # Clean up temporary MP3 file
-                if os.path.exists(temp_mp3):
-                    os.remove(temp_mp3)
-                
-            except ImportError as import_error:
-                print(f"⚠️  Audio processing libraries not available: {import_error}")
-                print("🔄 Using basic MP3 to WAV conversion...")
-                
-                # Fallback: simple conversion without rate/volume adjustment
-                try:
-                    import subprocess
-                    # Try using ffmpeg if available
-                    subprocess.run([
-                        'ffmpeg', '-i', temp_mp3, '-acodec', 'pcm_s16le', 
-                        '-ar', '22050', '-ac', '1', output_path, '-y'
-                    ], check=True, capture_output=True)
-                    print(f"✅ Converted using ffmpeg")
+                    audio.export(output_path, format="wav")
+                    print(f"✅ Converted to WAV format")
                     
-                    # Clean up temporary MP3 file
-                    if os.path.exists(temp_mp3):
-                        os.remove(temp_mp3)
-                        
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    # If ffmpeg not available, just rename MP3 to WAV (not ideal but works)
-                    print("⚠️  ffmpeg not available, keeping as MP3 format")
-                    if os.path.exists(temp_mp3):
-                        os.rename(temp_mp3, output_path.replace('.wav', '.mp3'))
-                        output_path = output_path.replace('.wav', '.mp3')
+                except Exception as pydub_error:
+                    # If no decoder is available, save the MP3 as-is (not ideal but works)
+                    print(f"⚠️  Audio processing not available ({pydub_error}), keeping as MP3 format")
+                    output_path = os.path.splitext(output_path)[0] + '.mp3'
+                    with open(output_path, 'wb') as mp3_file:
+                        mp3_file.write(mp3_buffer.getvalue())
             
             # Verify file was created
             if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
@@ -301,6 +389,23 @@ class TTSService:
             print(f"❌ {error_msg}")
             return False, error_msg
     
+    def _mp3_to_wav(self, mp3_data: bytes, output_path: str,
+                    speed_multiplier: float = 1.0, volume_db: float = 0.0):
+        """Decode MP3 bytes to WAV in one ffmpeg run, applying speed and volume"""
+        filters = []
+        if speed_multiplier != 1.0:
+            filters.append(f"atempo={speed_multiplier:g}")
+        if abs(volume_db) > 0.1:
+            filters.append(f"volume={volume_db:.1f}dB")
+        
+        cmd = ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-f', 'mp3', '-i', 'pipe:0']
+        if filters:
+            cmd += ['-filter:a', ','.join(filters)]
+        cmd += ['-acodec', 'pcm_s16le', '-y', output_path]
+        # The WAV goes straight to output_path, so only stderr is worth keeping
+        subprocess.run(cmd, input=mp3_data, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    
     def preview_speech(self, text: str, 
                       rate: Optional[int] = None,
                       volume: Optional[float] = None,
@@ -321,14 +426,10 @@ class TTSService:
             
             # Parse voice_id to validate it exists
             if voice_id and voice_id != 'default':
-                voice_found = False
-                for voice in self.available_voices:
-                    if voice['id'] == voice_id or str(voice['index']) == str(voice_id):
-                        voice_found = True
-                        print(f"🎤 Preview would use voice: {voice['name']}")
-                        break
-                
-                if not voice_found:
+                voice = self._find_voice(voice_id)
+                if voice:
+                    print(f"🎤 Preview would use voice: {voice['name']}")
+                else:
                     print(f"⚠️  Voice {voice_id} not found, would use default")
             
             print(f"🎵 Preview validated for {len(text)} characters")
@@ -348,28 +449,24 @@ class TTSService:
     def health_check(self) -> Dict:
         """Check Google TTS service health"""
         if not self.is_initialized:
-            # Check if gTTS can be imported
-            try:
-                from gtts import gTTS
-                gtts_available = True
-                gtts_error = None
-            except ImportError as e:
-                gtts_available = False
-                gtts_error = str(e)
-            
             return {
                 'initialized': False,
-                'gtts_available': gtts_available,
-                'gtts_error': gtts_error,
+                'gtts_available': _GTTS_OK,
+                'gtts_error': _GTTS_IMPORT_ERROR,
                 'voices_available': 0,
                 'supported_formats': self.get_supported_formats(),
                 'mode': 'unavailable'
             }
         
+        # Frontends poll this; only re-probe Google once the cached result expires
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_ts < TTS_HEALTH_TTL:
+            return self._health_cache
+        
         # Test internet connectivity for Google TTS
         internet_available = self._test_internet_connection()
         
-        return {
+        self._health_cache = {
             'initialized': self.is_initialized,
             'gtts_available': True,
             'internet_available': internet_available,
@@ -379,10 +476,14 @@ class TTSService:
             'mode': 'google_tts',
             'quality': 'high'
         }
+        self._health_ts = time.monotonic()
+        return self._health_cache
     
     def _test_internet_connection(self) -> bool:
         """Test if internet connection is available for Google TTS"""
         try:
+            if _HTTP is not None:
+                return _HTTP.head('https://translate.google.com', timeout=5).ok
             import urllib.request
             urllib.request.urlopen('https://translate.google.com', timeout=5)
             return True
@@ -6,30 +6,75 @@ Builds frontend and deploys to Railway
 
 import os
 import sys
+import shutil
 import subprocess
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-def run_command(command, description, shell=True):
-    """Run a command and handle errors"""
+# Output is streamed live; on failure the last lines are repeated so the
+# error isn't lost in a long build or deploy log
+FAILURE_TAIL_LINES = 20
+
+APP_URL = "https://filealchemy-production.up.railway.app"
+READY_TIMEOUT = 30  # seconds to wait for the new deployment to answer
+
+# Executable name -> resolved path, looked up on PATH once per run
+_BIN_CACHE = {}
+
+def resolve(binary):
+    """Resolve an executable on PATH once (also finds npm.cmd on Windows)"""
+    if binary not in _BIN_CACHE:
+        _BIN_CACHE[binary] = shutil.which(binary) or binary
+    return _BIN_CACHE[binary]
+
+def run_command(command, description):
+    """Run an argv list (no shell) and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=shell, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed")
-        if result.stdout.strip():
-            print(f"   Output: {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed")
-        if e.stdout:
-            print(f"   Output: {e.stdout}")
-        if e.stderr:
-            print(f"   Error: {e.stderr}")
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                bufsize=1, text=True, errors='replace')
+        tail = deque(maxlen=FAILURE_TAIL_LINES)
+        with proc:
+            for line in proc.stdout:
+                sys.stdout.write(f"   {line}")
+                tail.append(line)
+        
+        if proc.returncode == 0:
+            print(f"✅ {description} completed")
+            return True
+        
+        print(f"❌ {description} failed (exit code {proc.returncode})")
+        if tail:
+            print("   Last output:")
+            for line in tail:
+                sys.stdout.write(f"   {line}")
+        return False
+    except FileNotFoundError:
+        print(f"❌ {description} failed: {command[0]} not found")
         return False
 
+def wait_for_health(url, timeout=READY_TIMEOUT):
+    """Poll url with backoff until it returns 200; return seconds waited or None"""
+    import urllib.request
+    start = time.monotonic()
+    deadline = start + timeout
+    delay = 0.5
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if response.status == 200:
+                    return time.monotonic() - start
+        except Exception:
+            pass
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 1.6, 3.0)
+    return None
+
 def check_railway_cli():
     """Check if Railway CLI is installed"""
     try:
-        result = subprocess.run(['railway', '--version'], capture_output=True, text=True, shell=True)
+        result = subprocess.run([resolve('railway'), '--version'], capture_output=True, text=True)
         if result.returncode == 0:
             print(f"✅ Railway CLI found: {result.stdout.strip()}")
             return True
@@ -45,15 +90,21 @@ def main():
     print("🚀 FileAlchemy Railway Deployment")
     print("=" * 40)
     
-    # Check Railway CLI
-    if not check_railway_cli():
+    # Check Railway CLI and build the frontend at the same time; both just
+    # wait on subprocesses and neither depends on the other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cli_future = executor.submit(check_railway_cli)
+        build_future = executor.submit(run_command, [resolve('npm'), 'run', 'build'], "Building frontend")
+        cli_ok = cli_future.result()
+        build_ok = build_future.result()
+    
+    if not cli_ok:
         print("\n📥 Install Railway CLI:")
         print("   npm install -g @railway/cli")
         print("   Then run: railway login")
         sys.exit(1)
     
-    # Build frontend
-    if not run_command("npm run build", "Building frontend"):
+    if not build_ok:
         sys.exit(1)
     
     # Check if dist directory exists
@@ -65,25 +116,30 @@ def main():
     
     # Deploy to Railway
     print("\n🚂 Deploying to Railway...")
-    if not run_command("railway up", "Deploying to Railway"):
+    if not run_command([resolve('railway'), 'up'], "Deploying to Railway"):
         print("❌ Deployment failed")
         sys.exit(1)
     
     print("\n🎉 Deployment completed!")
-    print("🌐 Your app is live at: https://filealchemy-production.up.railway.app")
+    print(f"🌐 Your app is live at: {APP_URL}")
     print("🔧 Fixed download issue with absolute file paths")
     print("🔧 Frontend configured for production mode - always uses Railway backend")
     print("⏳ It may take a few minutes for changes to propagate")
     
     # Run comprehensive test
     print("\n🧪 Running post-deployment test...")
-    time.sleep(10)  # Wait for deployment to propagate
+    # Wait until the deployment actually answers instead of a fixed sleep
+    ready_after = wait_for_health(f"{APP_URL}/api/health")
+    if ready_after is not None:
+        print(f"✅ Deployment responding after {ready_after:.1f}s")
+    else:
+        print(f"⚠️  No healthy response after {READY_TIMEOUT}s, testing anyway")
     
     try:
         subprocess.run([sys.executable, "comprehensive_test.py"], check=True)
     except subprocess.CalledProcessError:
         print("⚠️  Post-deployment test failed, but deployment may still be successful")
-        print("   Check https://filealchemy-production.up.railway.app manually")
+        print(f"   Check {APP_URL} manually")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,9 +5,48 @@ Shows current file cleanup status and configuration
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sys
 import json
 import time
-from datetime import datetime, timedelta
+from http_cache import cached_get
+
+# One keep-alive session for every request, so probes reuse the connection
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                       max_retries=Retry(total=2, backoff_factor=0.2))
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Static part of the status report, written in one go
+CLEANUP_REPORT = """
+🗂️  File Management Configuration:
+   📁 Upload Folder: backend/temp_uploads/
+   📁 Converted Folder: backend/temp_converted/
+   ⏰ Cleanup Interval: After conversions (at most once a minute), and at least every 15 minutes
+   🕐 File Retention: 1 hour
+   🔄 Cleanup Method: Background cleanup after conversions plus a heartbeat thread
+
+🚂 Railway Platform Benefits:
+   💾 Ephemeral Storage: Files deleted on container restart
+   🔄 Auto-scaling: New containers start clean
+   🛡️  Security: No persistent file accumulation
+   💰 Cost-effective: No storage charges for temp files
+
+📊 File Lifecycle:
+   1. 📤 User uploads file → temp_uploads/
+   2. ⚙️  File gets converted → temp_converted/
+   3. 📥 User downloads converted file
+   4. 🧹 Files auto-deleted after 1 hour
+   5. 🔄 Container restart = immediate cleanup
+
+✅ Current Status: OPTIMAL
+   • Files are automatically cleaned up
+   • No manual intervention required
+   • Railway's ephemeral storage provides additional cleanup
+   • System is cost-effective and secure
+"""
 
 def check_cleanup_status():
     """Check the current cleanup configuration and status"""
@@ -16,7 +55,7 @@ def check_cleanup_status():
     
     # Test API health to confirm backend is running
     try:
-        response = requests.get('https://filealchemy-production.up.railway.app/api/health', timeout=10)
+        response = cached_get(SESSION, 'https://filealchemy-production.up.railway.app/api/health', timeout=10)
         if response.status_code == 200:
             health_data = response.json()
             print("✅ Backend Status: Healthy")
@@ -29,62 +68,45 @@ def check_cleanup_status():
         print(f"❌ Cannot connect to backend: {e}")
         return
     
-    print("\n🗂️  File Management Configuration:")
-    print("   📁 Upload Folder: backend/temp_uploads/")
-    print("   📁 Converted Folder: backend/temp_converted/")
-    print("   ⏰ Cleanup Interval: Every 5 minutes")
-    print("   🕐 File Retention: 1 hour")
-    print("   🔄 Cleanup Method: Automatic background thread")
-    
-    print("\n🚂 Railway Platform Benefits:")
-    print("   💾 Ephemeral Storage: Files deleted on container restart")
-    print("   🔄 Auto-scaling: New containers start clean")
-    print("   🛡️  Security: No persistent file accumulation")
-    print("   💰 Cost-effective: No storage charges for temp files")
-    
-    print("\n📊 File Lifecycle:")
-    print("   1. 📤 User uploads file → temp_uploads/")
-    print("   2. ⚙️  File gets converted → temp_converted/")
-    print("   3. 📥 User downloads converted file")
-    print("   4. 🧹 Files auto-deleted after 1 hour")
-    print("   5. 🔄 Container restart = immediate cleanup")
-    
-    print("\n✅ Current Status: OPTIMAL")
-    print("   • Files are automatically cleaned up")
-    print("   • No manual intervention required")
-    print("   • Railway's ephemeral storage provides additional cleanup")
-    print("   • System is cost-effective and secure")
+    sys.stdout.write(CLEANUP_REPORT)
+    sys.stdout.flush()
 
 def simulate_file_lifecycle():
     """Simulate what happens to files during conversion"""
-    print("\n🎬 File Conversion Lifecycle Simulation:")
-    print("-" * 40)
+    base = int(time.time())
     
-    current_time = datetime.now()
+    def at(offset):
+        """Local HH:MM:SS for `offset` seconds from now"""
+        t = time.localtime(base + offset)
+        return f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
     
-    print(f"⏰ Current Time: {current_time.strftime('%H:%M:%S')}")
-    print("\n📤 Step 1: User uploads 'document.pdf'")
-    print(f"   📁 Stored in: temp_uploads/uuid_document.pdf")
-    print(f"   🕐 Created at: {current_time.strftime('%H:%M:%S')}")
-    
-    print("\n⚙️  Step 2: Conversion starts (PDF → DOCX)")
-    conversion_time = current_time + timedelta(seconds=30)
-    print(f"   🔄 Processing at: {conversion_time.strftime('%H:%M:%S')}")
-    print(f"   📁 Output to: temp_converted/uuid_document.docx")
-    
-    print("\n📥 Step 3: User downloads converted file")
-    download_time = current_time + timedelta(minutes=2)
-    print(f"   ⬇️  Downloaded at: {download_time.strftime('%H:%M:%S')}")
-    print(f"   ✅ Conversion successful!")
-    
-    print("\n🧹 Step 4: Automatic cleanup")
-    cleanup_time = current_time + timedelta(hours=1)
-    print(f"   🗑️  Files deleted at: {cleanup_time.strftime('%H:%M:%S')}")
-    print(f"   📁 Both temp_uploads/ and temp_converted/ files removed")
-    
-    print("\n🔄 Alternative: Container restart")
-    print("   🚂 Railway restarts container → All temp files deleted immediately")
-    print("   💾 Fresh container starts with empty temp directories")
+    # Render the whole walkthrough once and write it with a single call
+    sys.stdout.write(f"""
+🎬 File Conversion Lifecycle Simulation:
+{'-' * 40}
+⏰ Current Time: {at(0)}
+
+📤 Step 1: User uploads 'document.pdf'
+   📁 Stored in: temp_uploads/uuid_document.pdf
+   🕐 Created at: {at(0)}
+
+⚙️  Step 2: Conversion starts (PDF → DOCX)
+   🔄 Processing at: {at(30)}
+   📁 Output to: temp_converted/uuid_document.docx
+
+📥 Step 3: User downloads converted file
+   ⬇️  Downloaded at: {at(120)}
+   ✅ Conversion successful!
+
+🧹 Step 4: Automatic cleanup
+   🗑️  Files deleted at: {at(3600)}
+   📁 Both temp_uploads/ and temp_converted/ files removed
+
+🔄 Alternative: Container restart
+   🚂 Railway restarts container → All temp files deleted immediately
+   💾 Fresh container starts with empty temp directories
+""")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     check_cleanup_status()
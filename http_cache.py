@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Small file-backed TTL cache for the health/voices checks in the root scripts
+Set FA_CACHE=0 to always hit the network
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+
+CACHE_PATH = os.path.expanduser('~/.filealchemy_cache.json')
+
+# Per-endpoint TTLs in seconds: health is short-lived, the voice list is stable
+HEALTH_TTL = 30
+VOICES_TTL = 300
+
+# Serializes read-modify-write of the cache file between threads in one script
+_lock = threading.Lock()
+
+class CachedResponse:
+    """The parts of requests.Response the scripts use, rebuilt from the cache"""
+    
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.text = body
+        self.content = body.encode('utf-8')
+    
+    def json(self):
+        return json.loads(self.text)
+
+def _load_cache():
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    # Write to a temp file and rename over the cache, so concurrent scripts
+    # never read a half-written file
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CACHE_PATH), prefix='.filealchemy_cache')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+def cached_get(session, url, ttl=HEALTH_TTL, **kwargs):
+    """GET url through session, reusing a 200 response younger than ttl seconds"""
+    if os.environ.get('FA_CACHE') == '0':
+        return session.get(url, **kwargs)
+    
+    entry = _load_cache().get(url)
+    if entry and time.time() - entry['ts'] < ttl:
+        return CachedResponse(entry['status'], entry['body'])
+    
+    response = session.get(url, **kwargs)
+    if response.status_code == 200:
+        with _lock:
+            cache = _load_cache()
+            cache[url] = {'ts': time.time(), 'status': response.status_code, 'body': response.text}
+            _save_cache(cache)
+    return response
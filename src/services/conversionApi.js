@@ -149,6 +149,42 @@ export class ConversionApi {
     });
   }
 
+  /**
+   * Follow conversion status via Server-Sent Events, falling back to polling
+   */
+  static async watchConversionStatus(jobId, onProgress = null) {
+    if (typeof EventSource === 'undefined') {
+      return this.pollConversionStatus(jobId, onProgress);
+    }
+
+    return new Promise((resolve, reject) => {
+      const source = new EventSource(`${API_BASE_URL}/status/${jobId}/stream`);
+
+      source.onmessage = (event) => {
+        const statusData = JSON.parse(event.data);
+
+        // Update progress if callback provided
+        if (onProgress) {
+          onProgress(statusData.progress, statusData.status);
+        }
+
+        if (statusData.status === 'completed') {
+          source.close();
+          resolve(statusData);
+        } else if (statusData.status === 'failed') {
+          source.close();
+          reject(new ConversionApiError(statusData.error_message || 'Conversion failed'));
+        }
+      };
+
+      source.onerror = () => {
+        // Stream unavailable or dropped - fall back to polling
+        source.close();
+        this.pollConversionStatus(jobId, onProgress).then(resolve, reject);
+      };
+    });
+  }
+
   /**
    * Convert files with progress tracking
    */
@@ -160,8 +196,8 @@ export class ConversionApi {
       const uploadResult = await this.startConversion(files, sourceFormat, targetFormat);
       const jobId = uploadResult.job_id;
 
-      // Poll for completion
-      const result = await this.pollConversionStatus(jobId, onProgress);
+      // Wait for completion
+      const result = await this.watchConversionStatus(jobId, onProgress);
       
       // Process results to match frontend expectations
       const processedResults = result.results.map(item => ({
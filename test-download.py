@@ -4,24 +4,52 @@ Test script to verify TTS API endpoints
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import os
 import json
+import shutil
 import time
+from http_cache import cached_get, VOICES_TTL
+
+# One keep-alive session for every request, so probes reuse the connection
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                       max_retries=Retry(total=2, backoff_factor=0.2))
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# orjson parses and pretty-prints in C; fall back to the stdlib if it's missing
+try:
+    import orjson
+    
+    def rjson(response):
+        return orjson.loads(response.content)
+    
+    def pretty_json(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def rjson(response):
+        return json.loads(response.content)
+    
+    def pretty_json(data):
+        return json.dumps(data, indent=2)
 
 # Test configuration
 BASE_URL = "http://localhost:5000"  # Local development server
 TEST_TEXT = "Hello! This is a test of the FileAlchemy text-to-speech system. It should work perfectly!"
 
-def test_tts_api():
+def test_tts_api(save=False):
     print("🧪 Testing TTS API Endpoints...")
     
     # Test 1: Health check
     print("\n1. Testing TTS Health Check:")
     try:
-        response = requests.get(f"{BASE_URL}/api/tts/health", timeout=10)
+        response = cached_get(SESSION, f"{BASE_URL}/api/tts/health", timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = rjson(response)
             print(f"   ✅ Health check successful")
-            print(f"   📊 Health data: {json.dumps(data, indent=2)}")
+            print(f"   📊 Health data: {pretty_json(data)}")
         else:
             print(f"   ❌ Health check failed: {response.status_code}")
             return False
@@ -32,9 +60,9 @@ def test_tts_api():
     # Test 2: Get voices
     print("\n2. Testing Get Voices:")
     try:
-        response = requests.get(f"{BASE_URL}/api/tts/voices", timeout=10)
+        response = cached_get(SESSION, f"{BASE_URL}/api/tts/voices", ttl=VOICES_TTL, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = rjson(response)
             print(f"   ✅ Get voices successful")
             if data.get('success') and data.get('voices'):
                 print(f"   🎤 Available voices: {len(data['voices'])}")
@@ -58,14 +86,14 @@ def test_tts_api():
             "volume": 0.8
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/tts/convert", 
             json=payload,
             timeout=30
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = rjson(response)
             print(f"   ✅ TTS conversion successful")
             print(f"   📄 Filename: {data.get('filename')}")
             print(f"   📊 File size: {data.get('size')} bytes")
@@ -75,19 +103,31 @@ def test_tts_api():
             if data.get('download_url'):
                 print("\n4. Testing Audio File Download:")
                 download_url = f"{BASE_URL}{data['download_url']}"
-                download_response = requests.get(download_url, timeout=10)
-                
-                if download_response.status_code == 200:
-                    print(f"   ✅ Download successful")
-                    print(f"   📊 Downloaded size: {len(download_response.content)} bytes")
-                    
-                    # Save test file
-                    with open("test_downloaded_audio.wav", "wb") as f:
-                        f.write(download_response.content)
-                    print(f"   💾 Saved as: test_downloaded_audio.wav")
+                if not save:
+                    # Reachability and size come from the headers; no body transferred
+                    head_response = SESSION.head(download_url, timeout=10, allow_redirects=False)
+                    if head_response.status_code == 200:
+                        print("   ✅ Download URL reachable")
+                        print(f"   📊 Content-Length: {head_response.headers.get('Content-Length', 'unknown')} bytes")
+                    elif head_response.is_redirect:
+                        print(f"   ✅ Download URL redirects to: {head_response.headers.get('Location')}")
+                    else:
+                        print(f"   ❌ Download failed: {head_response.status_code}")
+                        return False
                 else:
-                    print(f"   ❌ Download failed: {download_response.status_code}")
-                    return False
+                    # Stream straight to disk instead of holding the audio in memory
+                    with SESSION.get(download_url, stream=True, timeout=30) as download_response:
+                        if download_response.status_code == 200:
+                            # Only decodes if a proxy added Content-Encoding
+                            download_response.raw.decode_content = True
+                            with open("test_downloaded_audio.wav", "wb") as f:
+                                shutil.copyfileobj(download_response.raw, f, length=64 * 1024)
+                            print("   ✅ Download successful")
+                            print(f"   📊 Downloaded size: {os.path.getsize('test_downloaded_audio.wav')} bytes")
+                            print("   💾 Saved as: test_downloaded_audio.wav")
+                        else:
+                            print(f"   ❌ Download failed: {download_response.status_code}")
+                            return False
             
         else:
             print(f"   ❌ TTS conversion failed: {response.status_code}")
@@ -102,14 +142,22 @@ def test_tts_api():
     return True
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Test the TTS API endpoints')
+    parser.add_argument('--save', action='store_true',
+                        help='Download the generated audio to test_downloaded_audio.wav '
+                             '(default: only check the download URL with HEAD)')
+    args = parser.parse_args()
+    
     print("🚀 Starting TTS API tests...")
     print("⚠️  Make sure the Flask server is running on localhost:5000")
-    print("   Run: python backend/api_server.py")
+    print("   Run: python backend/run_server.py")
     
     # Wait a moment for user to start server if needed
     input("\nPress Enter when the server is ready...")
     
-    success = test_tts_api()
+    success = test_tts_api(save=args.save)
     
     if success:
         print("\n🎉 All tests completed successfully!")
@@ -5,112 +5,179 @@ Test script to verify eSpeak installation and TTS functionality
 
 import sys
 import os
+import shutil
 import subprocess
 import platform
+import io
+import atexit
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def test_espeak_installation():
+try:
+    import pyttsx3
+    _HAS_PYTTSX3 = True
+except ImportError:
+    _HAS_PYTTSX3 = False
+
+# Constant for the whole run
+PLATFORM = f"{platform.system()} {platform.release()}"
+PYTHON_VERSION = sys.version
+
+# All phrases are synthesized by a single espeak process, fed through stdin
+SYNTHESIS_PHRASES = (
+    "Hello from FileAlchemy TTS test",
+)
+
+@functools.lru_cache(maxsize=1)
+def get_engine():
+    """Initialize the pyttsx3 eSpeak driver once and share it across tests"""
+    engine = pyttsx3.init(driverName='espeak')
+    atexit.register(engine.stop)
+    return engine
+
+# Resolved once; every check below runs this binary
+ESPEAK = shutil.which('espeak')
+
+_voices_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _run_list_voices():
+    return subprocess.run([ESPEAK or 'espeak', '--voices'], capture_output=True, timeout=10)
+
+def list_voices():
+    """Run 'espeak --voices' once; both the install and voice checks use it"""
+    # The checks run concurrently, so make sure only one of them spawns it
+    with _voices_lock:
+        return _run_list_voices()
+
+def run_test(test_name, test_func, out=print):
+    """Run one test, reporting an exception it raises as a failure"""
+    try:
+        return test_func(out)
+    except Exception as e:
+        out(f"❌ {test_name} failed with exception: {e}")
+        return False
+
+def run_buffered(test_name, test_func):
+    """Run one test in a worker thread, returning its result and its output"""
+    buffer = io.StringIO()
+    result = run_test(test_name, test_func, functools.partial(print, file=buffer))
+    return result, buffer.getvalue()
+
+def test_espeak_installation(out=print):
     """Test if eSpeak is properly installed"""
-    print("🧪 Testing eSpeak Installation...")
+    out("🧪 Testing eSpeak Installation...")
     
     try:
-        # Test eSpeak command line
-        result = subprocess.run(['espeak', '--version'], 
-                              capture_output=True, text=True, timeout=5)
+        if not ESPEAK:
+            raise FileNotFoundError('espeak')
+        
+        # A working voice listing proves the binary runs, so the separate
+        # --version process is only needed to diagnose a failure
+        if list_voices().returncode == 0:
+            out(f"✅ eSpeak installed: {ESPEAK}")
+            return True
+        
+        result = subprocess.run([ESPEAK, '--version'], 
+                              capture_output=True, timeout=5)
         if result.returncode == 0:
-            print(f"✅ eSpeak installed: {result.stdout.strip()}")
+            out(f"✅ eSpeak installed: {result.stdout.strip().decode('utf-8', 'replace')}")
             return True
         else:
-            print(f"❌ eSpeak command failed: {result.stderr}")
+            out(f"❌ eSpeak command failed: {result.stderr.decode('utf-8', 'replace')}")
             return False
     except FileNotFoundError:
-        print("❌ eSpeak not found in PATH")
+        out("❌ eSpeak not found in PATH")
         return False
     except subprocess.TimeoutExpired:
-        print("❌ eSpeak command timed out")
+        out("❌ eSpeak command timed out")
         return False
     except Exception as e:
-        print(f"❌ Error testing eSpeak: {e}")
+        out(f"❌ Error testing eSpeak: {e}")
         return False
 
-def test_espeak_voices():
+def test_espeak_voices(out=print):
     """Test available eSpeak voices"""
-    print("\n🎤 Testing eSpeak Voices...")
+    out("\n🎤 Testing eSpeak Voices...")
     
     try:
-        result = subprocess.run(['espeak', '--voices'], 
-                              capture_output=True, text=True, timeout=10)
+        result = list_voices()
         if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            print(f"✅ Found {len(lines)-1} eSpeak voices:")
-            for line in lines[1:6]:  # Show first 5 voices
-                print(f"   {line}")
-            if len(lines) > 6:
-                print(f"   ... and {len(lines)-6} more voices")
+            # Count rows on the raw bytes and only decode the few we print
+            output = result.stdout.strip()
+            line_count = output.count(b'\n') + 1
+            out(f"✅ Found {line_count-1} eSpeak voices:")
+            for line in output.split(b'\n', 6)[1:6]:  # Show first 5 voices
+                out(f"   {line.decode('utf-8', 'replace')}")
+            if line_count > 6:
+                out(f"   ... and {line_count-6} more voices")
             return True
         else:
-            print(f"❌ Could not list eSpeak voices: {result.stderr}")
+            out(f"❌ Could not list eSpeak voices: {result.stderr.decode('utf-8', 'replace')}")
             return False
     except Exception as e:
-        print(f"❌ Error listing eSpeak voices: {e}")
+        out(f"❌ Error listing eSpeak voices: {e}")
         return False
 
-def test_espeak_synthesis():
+def test_espeak_synthesis(out=print):
     """Test eSpeak text synthesis"""
-    print("\n🔊 Testing eSpeak Text Synthesis...")
+    out("\n🔊 Testing eSpeak Text Synthesis...")
     
     try:
-        # Test basic synthesis to file
-        test_text = "Hello from FileAlchemy TTS test"
+        # Test basic synthesis to file; one process for every phrase
         output_file = "/tmp/espeak_test.wav"
         
         result = subprocess.run([
-            'espeak', 
+            ESPEAK or 'espeak', 
+            '--stdin',          # Read the phrases from stdin
             '-w', output_file,  # Write to WAV file
             '-s', '150',        # Speed (words per minute)
-            test_text
-        ], capture_output=True, text=True, timeout=10)
+        ], input='\n'.join(SYNTHESIS_PHRASES), capture_output=True, text=True, timeout=10)
         
         if result.returncode == 0:
-            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
-                file_size = os.path.getsize(output_file)
-                print(f"✅ eSpeak synthesis successful: {file_size} bytes")
+            file_size = os.path.getsize(output_file) if os.path.exists(output_file) else 0
+            if file_size > 0:
+                out(f"✅ eSpeak synthesis successful: {file_size} bytes ({len(SYNTHESIS_PHRASES)} phrases)")
                 # Clean up test file
                 os.remove(output_file)
                 return True
             else:
-                print("❌ eSpeak created empty or no output file")
+                out("❌ eSpeak created empty or no output file")
                 return False
         else:
-            print(f"❌ eSpeak synthesis failed: {result.stderr}")
+            out(f"❌ eSpeak synthesis failed: {result.stderr}")
             return False
     except Exception as e:
-        print(f"❌ Error testing eSpeak synthesis: {e}")
+        out(f"❌ Error testing eSpeak synthesis: {e}")
         return False
 
-def test_pyttsx3_integration():
+def test_pyttsx3_integration(out=print):
     """Test pyttsx3 with eSpeak"""
-    print("\n🐍 Testing pyttsx3 Integration...")
+    out("\n🐍 Testing pyttsx3 Integration...")
+    
+    if not _HAS_PYTTSX3:
+        out("❌ pyttsx3 not installed")
+        return False
     
     try:
-        import pyttsx3
-        
         # Try to initialize with espeak driver
-        engine = pyttsx3.init(driverName='espeak')
-        print("✅ pyttsx3 initialized with eSpeak driver")
+        engine = get_engine()
+        out("✅ pyttsx3 initialized with eSpeak driver")
         
         # Test getting voices
         voices = engine.getProperty('voices')
         if voices:
-            print(f"✅ Found {len(voices)} voices via pyttsx3:")
+            out(f"✅ Found {len(voices)} voices via pyttsx3:")
             for i, voice in enumerate(voices[:3]):  # Show first 3
-                print(f"   Voice {i}: {voice.name} (ID: {voice.id})")
+                out(f"   Voice {i}: {voice.name} (ID: {voice.id})")
         else:
-            print("⚠️  No voices found via pyttsx3")
+            out("⚠️  No voices found via pyttsx3")
         
         # Test basic properties
         rate = engine.getProperty('rate')
         volume = engine.getProperty('volume')
-        print(f"✅ Engine properties - Rate: {rate}, Volume: {volume}")
+        out(f"✅ Engine properties - Rate: {rate}, Volume: {volume}")
         
         # Test synthesis to file
         test_text = "Testing pyttsx3 with eSpeak integration"
@@ -121,43 +188,45 @@ def test_pyttsx3_integration():
         
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             file_size = os.path.getsize(output_file)
-            print(f"✅ pyttsx3 synthesis successful: {file_size} bytes")
+            out(f"✅ pyttsx3 synthesis successful: {file_size} bytes")
             os.remove(output_file)
         else:
-            print("❌ pyttsx3 created empty or no output file")
+            out("❌ pyttsx3 created empty or no output file")
             return False
         
-        engine.stop()
         return True
         
-    except ImportError:
-        print("❌ pyttsx3 not installed")
-        return False
     except Exception as e:
-        print(f"❌ pyttsx3 integration error: {e}")
+        out(f"❌ pyttsx3 integration error: {e}")
         return False
 
 def main():
     print("🚀 eSpeak and TTS Integration Test")
     print("=" * 50)
-    print(f"Platform: {platform.system()} {platform.release()}")
-    print(f"Python: {sys.version}")
+    print(f"Platform: {PLATFORM}")
+    print(f"Python: {PYTHON_VERSION}")
     
-    tests = [
+    espeak_tests = [
         ("eSpeak Installation", test_espeak_installation),
         ("eSpeak Voices", test_espeak_voices),
         ("eSpeak Synthesis", test_espeak_synthesis),
-        ("pyttsx3 Integration", test_pyttsx3_integration)
     ]
     
+    # The eSpeak checks are independent, so run them together; each one writes
+    # to its own buffer, printed afterwards in the usual order
+    with ThreadPoolExecutor(max_workers=len(espeak_tests)) as executor:
+        futures = [executor.submit(run_buffered, test_name, test_func)
+                   for test_name, test_func in espeak_tests]
+        outcomes = [future.result() for future in futures]
+    
     results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
+    for (test_name, _), (result, text) in zip(espeak_tests, outcomes):
+        sys.stdout.write(text)
+        results.append((test_name, result))
+    
+    # pyttsx3 isn't thread-safe and drives espeak itself, so it runs last on this thread
+    results.append(("pyttsx3 Integration",
+                    run_test("pyttsx3 Integration", test_pyttsx3_integration)))
     
     print("\n" + "=" * 50)
     print("📊 Test Results Summary:")
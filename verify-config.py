@@ -6,18 +6,43 @@ Shows current API configuration
 
 import os
 import json
+import mmap
+
+PRODUCTION_API_URL = b'https://filealchemy-production.up.railway.app/api'
+
+def scan_file(path, needles):
+    """Open path once and report which byte strings it contains.
+    
+    The file is memory-mapped and searched as raw bytes, so it is never
+    decoded or copied into a Python string.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {needle: False for needle in needles}  # mmap rejects empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return {needle: mm.find(needle) != -1 for needle in needles}
+
+def list_entries(path):
+    """Map entry names to DirEntry objects with a single directory read"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
 
 def main():
     print("🔍 FileAlchemy Configuration Verification")
     print("=" * 50)
     
+    # One listing of the project root answers every existence check below
+    root_entries = list_entries('.')
+    
     # Check API configuration
     print("\n📡 API Configuration:")
     try:
-        with open('src/config/api.js', 'r') as f:
-            api_config = f.read()
+        found = scan_file('src/config/api.js', [PRODUCTION_API_URL])
         
-        if 'https://filealchemy-production.up.railway.app/api' in api_config:
+        if found[PRODUCTION_API_URL]:
             print("✅ Frontend configured for Railway production backend")
             print("   API URL: https://filealchemy-production.up.railway.app/api")
         else:
@@ -28,27 +53,28 @@ def main():
     # Check environment variables
     print("\n🌍 Environment Configuration:")
     try:
-        with open('.env', 'r') as f:
-            env_content = f.read()
+        vite_url = b'VITE_API_BASE_URL=' + PRODUCTION_API_URL
+        found = scan_file('.env', [b'FLASK_ENV=production', b'NODE_ENV=production', vite_url])
         
-        if 'FLASK_ENV=production' in env_content:
+        if found[b'FLASK_ENV=production']:
             print("✅ Backend configured for production")
         
-        if 'NODE_ENV=production' in env_content:
+        if found[b'NODE_ENV=production']:
             print("✅ Node environment set to production")
             
-        if 'VITE_API_BASE_URL=https://filealchemy-production.up.railway.app/api' in env_content:
+        if found[vite_url]:
             print("✅ Vite API URL configured for production")
     except Exception as e:
         print(f"❌ Error reading .env: {e}")
     
     # Check build output
     print("\n🏗️  Build Status:")
-    if os.path.exists('dist'):
+    dist = root_entries.get('dist')
+    if dist is not None and dist.is_dir():
         print("✅ Frontend build exists")
         
         # Check if index.html exists
-        if os.path.exists('dist/index.html'):
+        if os.path.isfile(os.path.join(dist.path, 'index.html')):
             print("✅ Built index.html found")
         else:
             print("❌ Built index.html not found")
@@ -57,12 +83,12 @@ def main():
     
     # Check Railway configuration
     print("\n🚂 Railway Configuration:")
-    if os.path.exists('railway.json'):
+    if 'railway.json' in root_entries:
         print("✅ Railway configuration exists")
     else:
         print("❌ Railway configuration missing")
     
-    if os.path.exists('nixpacks.toml'):
+    if 'nixpacks.toml' in root_entries:
         print("✅ Nixpacks configuration exists")
     else:
         print("❌ Nixpacks configuration missing")
@@ -4,18 +4,62 @@ Verify TTS deployment on Railway
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from http_cache import cached_get, HEALTH_TTL, VOICES_TTL
+
+# One client for every request. With httpx[http2] installed the concurrent
+# probes are multiplexed over a single HTTP/2 connection (falling back to
+# HTTP/1.1 if the server doesn't negotiate it); otherwise a pooled
+# keep-alive requests session is used (httpx raises ImportError for
+# http2=True when h2 is missing)
+try:
+    import httpx
+    SESSION = httpx.Client(http2=True, follow_redirects=True,
+                           transport=httpx.HTTPTransport(http2=True, retries=2))
+except ImportError:
+    SESSION = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                           max_retries=Retry(total=2, backoff_factor=0.2))
+    SESSION.mount('https://', _adapter)
+    SESSION.mount('http://', _adapter)
+
+# Read-only checks that don't depend on each other, with their cache TTLs
+PROBE_PATHS = ('/api/health', '/api/tts/health', '/api/tts/voices')
+PROBE_TTLS = {'/api/tts/voices': VOICES_TTL}
+
+def probe(base_url, path):
+    """GET a path, returning the response or the exception it raised"""
+    try:
+        return cached_get(SESSION, f"{base_url}{path}",
+                          ttl=PROBE_TTLS.get(path, HEALTH_TTL), timeout=10)
+    except Exception as e:
+        return e
+
+def fetched(result):
+    """Unwrap a probe result, re-raising its error for the caller's handler"""
+    if isinstance(result, Exception):
+        raise result
+    return result
 
 def verify_tts_deployment(base_url):
     """Verify TTS functionality on deployed server"""
     print(f"🚀 Verifying TTS deployment at: {base_url}")
     
+    # Send the GET probes together so the wait is one round-trip, not three;
+    # results are still reported in order below
+    with ThreadPoolExecutor(max_workers=len(PROBE_PATHS)) as executor:
+        health_result, tts_health_result, voices_result = executor.map(
+            lambda path: probe(base_url, path), PROBE_PATHS)
+    
     # Test 1: General health check
     print("\n1. Testing general health check...")
     try:
-        response = requests.get(f"{base_url}/api/health", timeout=10)
+        response = fetched(health_result)
         if response.status_code == 200:
             data = response.json()
             print(f"   ✅ Server is healthy")
@@ -35,7 +79,7 @@ def verify_tts_deployment(base_url):
     # Test 2: TTS-specific health check
     print("\n2. Testing TTS health check...")
     try:
-        response = requests.get(f"{base_url}/api/tts/health", timeout=10)
+        response = fetched(tts_health_result)
         if response.status_code == 200:
             data = response.json()
             if data.get('success'):
@@ -57,7 +101,7 @@ def verify_tts_deployment(base_url):
     # Test 3: Get available voices
     print("\n3. Testing voice availability...")
     try:
-        response = requests.get(f"{base_url}/api/tts/voices", timeout=10)
+        response = fetched(voices_result)
         if response.status_code == 200:
             data = response.json()
             if data.get('success') and data.get('voices'):
@@ -88,7 +132,7 @@ def verify_tts_deployment(base_url):
             "volume": 0.8
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{base_url}/api/tts/convert",
             json=test_payload,
             timeout=30
@@ -105,7 +149,7 @@ def verify_tts_deployment(base_url):
                 # Test download
                 if data.get('download_url'):
                     download_url = f"{base_url}{data['download_url']}"
-                    download_response = requests.head(download_url, timeout=10)
+                    download_response = SESSION.head(download_url, timeout=10)
                     if download_response.status_code == 200:
                         print(f"   ✅ Download URL accessible")
                     else: